@@ -224,8 +224,10 @@ def main():
     # Save results
     output_file = Path("data/performance_baseline.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Keep histories recorded by the other benchmarks in the same file
+    existing = json.loads(output_file.read_text()) if output_file.exists() else {}
     with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+        json.dump({**existing, **results}, f, indent=2)
     
     print(f"\n✅ Results saved to: {output_file}")
     print("\n⚠️  NOTE: Performance targets may vary based on hardware")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+Measures how long importing the dashboard server takes (python -X importtime)
+
+Runs ``import src.api.server`` in fresh interpreters, keeps the fastest
+run, and reports the slowest modules by cumulative and self time. Fails if
+the import exceeds the budget or pulls in a model library that should only
+load on first use or during the background warm-up.
+
+Usage:
+    python scripts/maintenance/benchmark_imports.py [--runs N] [--budget-ms MS] [--json] [--no-save]
+
+Exit codes:
+    0: Import time within budget
+    1: Over budget, heavy module imported, or benchmark failed
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+TARGET = "src.api.server"
+BASELINE_FILE = ROOT / "data" / "performance_baseline.json"
+HISTORY_KEY = "import_history"
+HISTORY_SIZE = 100
+
+# Must not be imported by the server module; they load on first use or in the warm-up
+HEAVY_MODULES = (
+    "numpy", "cv2", "torch", "ultralytics", "faster_whisper", "ctranslate2", "piper", "onnxruntime",
+    "mediapipe", "open3d", "pvporcupine", "openwakeword", "sounddevice",
+    "src.voice.stt", "src.voice.tts", "src.voice.wakeword", "src.vision.camera", "src.ai.llm_client",
+)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parse ``-X importtime`` output
+
+    Args:
+        stderr: Interpreter stderr
+
+    Returns:
+        One entry per module: name, depth, self_ms, cumulative_ms
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({
+            "name": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+
+def measure(target: str) -> Dict[str, Any]:
+    """Import the target in a fresh interpreter and return its import profile"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    modules = parse_importtime(result.stderr)
+    # Children are printed before their parent; drop interpreter startup (site, .pth hooks)
+    end = max((i for i, m in enumerate(modules) if m["name"] == target and m["depth"] == 0), default=None)
+    if end is None:
+        raise RuntimeError(f"{target} not found in importtime output")
+    start = end
+    while start > 0 and modules[start - 1]["depth"] > 0:
+        start -= 1
+    return {"total_ms": modules[end]["cumulative_ms"], "modules": modules[start:end + 1]}
+
+
+def save_history(entry: Dict[str, Any]) -> None:
+    """Append a result to the import history in the performance baseline file"""
+    data = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    history = data.get(HISTORY_KEY, [])
+    history.append(entry)
+    data[HISTORY_KEY] = history[-HISTORY_SIZE:]
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_FILE.write_text(json.dumps(data, indent=2))
+
+
+def main() -> int:
+    """Run the import-time benchmark"""
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the dashboard server")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to run (fastest is kept)")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Fail above this import time")
+    parser.add_argument("--top", type=int, default=10, help="Modules listed per table")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--no-save", action="store_true", help=f"Do not record the result in {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    try:
+        runs = [measure(TARGET) for _ in range(max(1, args.runs))]
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    best = min(runs, key=lambda run: run["total_ms"])
+    names = {m["name"] for m in best["modules"]}
+    heavy = [name for name in HEAVY_MODULES if name in names]
+    by_cumulative = sorted((m for m in best["modules"] if m["depth"] == 1),
+                           key=lambda m: m["cumulative_ms"], reverse=True)[:args.top]
+    by_self = sorted(best["modules"], key=lambda m: m["self_ms"], reverse=True)[:args.top]
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "target": TARGET,
+        "python": sys.version.split()[0],
+        "total_ms": round(best["total_ms"], 1),
+        "runs_ms": [round(run["total_ms"], 1) for run in runs],
+        "module_count": len(best["modules"]),
+        "heavy_modules": heavy,
+        "top_cumulative": {m["name"]: round(m["cumulative_ms"], 1) for m in by_cumulative},
+        "top_self": {m["name"]: round(m["self_ms"], 1) for m in by_self},
+    }
+    if not args.no_save:
+        save_history(results)
+
+    passed = results["total_ms"] <= args.budget_ms and not heavy
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0 if passed else 1
+
+    print("=" * 60)
+    print(f"Import time of {TARGET} (best of {len(runs)}, Python {results['python']})")
+    print("=" * 60)
+    print(f"   total {results['total_ms']:.0f}ms, {results['module_count']} modules, budget {args.budget_ms:.0f}ms")
+    print("Slowest top-level imports (cumulative ms):")
+    for name, ms in results["top_cumulative"].items():
+        print(f"   {ms:>8.1f}  {name}")
+    print("Slowest modules (self ms):")
+    for name, ms in results["top_self"].items():
+        print(f"   {ms:>8.1f}  {name}")
+    if heavy:
+        print(f"❌ Heavy modules imported at startup: {', '.join(heavy)}")
+    if results["total_ms"] > args.budget_ms:
+        print(f"❌ Import time over budget: {results['total_ms']:.0f}ms > {args.budget_ms:.0f}ms")
+    if passed:
+        print("✅ Import time within budget")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
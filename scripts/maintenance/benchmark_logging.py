@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Logging Microbenchmark
+Measures log records/sec for the JSON formatter and the logging pipeline
+
+Compares the previous inline JSON formatter (stack capture on every DEBUG
+record, stdlib json) with the current ``JSONFormatter``, and the cost seen
+by the calling thread with a synchronous file handler versus the queued
+pipeline.
+
+Usage:
+    python scripts/maintenance/benchmark_logging.py [--records N] [--json]
+
+Exit codes:
+    0: Benchmark completed successfully
+    1: Benchmark failed
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Callable, Dict, Any
+
+# Allow running from the repository root without installation
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.logger import JSONFormatter, ORJSON_AVAILABLE  # noqa: E402
+from src.utils.log_pipeline import BatchRotatingFileHandler, create_pipeline  # noqa: E402
+
+
+class LegacyJSONFormatter(logging.Formatter):
+    """The formatter as it was before the fast path (kept for comparison)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        import traceback
+        import sys
+
+        log_data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+            "thread": record.threadName if hasattr(record, 'threadName') else None,
+            "process": record.process if hasattr(record, 'process') else None
+        }
+        if record.exc_info:
+            log_data["exception"] = {
+                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
+                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
+                "traceback": self.formatException(record.exc_info)
+            }
+        if record.levelno == logging.DEBUG and not record.exc_info:
+            try:
+                stack = traceback.extract_stack()
+                log_data["stack_trace"] = [
+                    {"file": frame.filename, "line": frame.lineno, "function": frame.name, "code": frame.line}
+                    for frame in stack[-5:]
+                ]
+            except Exception:
+                pass
+        if hasattr(record, 'extra'):
+            log_data.update(record.extra)
+        for field in ("user_id", "request_id", "duration_ms", "memory_mb"):
+            if hasattr(record, field):
+                log_data[field] = getattr(record, field)
+        return json.dumps(log_data, ensure_ascii=False)
+
+
+def make_record(level: int) -> logging.LogRecord:
+    """Build a representative log record"""
+    return logging.LogRecord(
+        "src.voice.stt", level, __file__, 42, "Transcribed %d samples in %.2fms", (16000, 12.5), None, "transcribe"
+    )
+
+
+def rate(func: Callable[[], None], records: int) -> float:
+    """Run func `records` times and return calls per second"""
+    start = time.perf_counter()
+    for _ in range(records):
+        func()
+    return records / (time.perf_counter() - start)
+
+
+def benchmark_formatters(records: int) -> Dict[str, float]:
+    """Formatter-only throughput at INFO and DEBUG"""
+    results = {}
+    for name, formatter in (("legacy", LegacyJSONFormatter(datefmt="%Y-%m-%d %H:%M:%S")),
+                            ("current", JSONFormatter(datefmt="%Y-%m-%d %H:%M:%S"))):
+        for level in (logging.INFO, logging.DEBUG):
+            record = make_record(level)
+            results[f"{name}_{logging.getLevelName(level).lower()}"] = rate(lambda: formatter.format(record), records)
+    return results
+
+
+def benchmark_calling_thread(records: int, log_dir: Path) -> Dict[str, float]:
+    """Records/sec as seen by the thread that calls logger.debug()"""
+    results = {}
+    logger = logging.getLogger("benchmark")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    direct = RotatingFileHandler(log_dir / "direct.log", maxBytes=50 * 1024 * 1024, backupCount=1)
+    direct.setFormatter(LegacyJSONFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+    logger.addHandler(direct)
+    results["direct_legacy"] = rate(lambda: logger.debug("Transcribed %d samples", 16000), records)
+    logger.removeHandler(direct)
+    direct.close()
+
+    batched = BatchRotatingFileHandler(log_dir / "queued.log", maxBytes=50 * 1024 * 1024, backupCount=1)
+    batched.setFormatter(JSONFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+    pipeline = create_pipeline([batched], queue_size=records + 1)
+    logger.addHandler(pipeline.handler)
+    results["queued_current"] = rate(lambda: logger.debug("Transcribed %d samples", 16000), records)
+    drain_start = time.perf_counter()
+    pipeline.stop()
+    results["queued_drain_seconds"] = time.perf_counter() - drain_start
+    logger.removeHandler(pipeline.handler)
+    batched.close()
+    return results
+
+
+def main() -> int:
+    """Run the logging benchmark"""
+    parser = argparse.ArgumentParser(description="Logging microbenchmark")
+    parser.add_argument("--records", type=int, default=20000, help="Records per measurement")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results: Dict[str, Any] = {
+                "records": args.records,
+                "orjson": ORJSON_AVAILABLE,
+                "formatter": benchmark_formatters(args.records),
+                "calling_thread": benchmark_calling_thread(args.records, Path(tmp)),
+            }
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    formatter = results["formatter"]
+    calling = results["calling_thread"]
+    print("=" * 60)
+    print(f"Logging benchmark ({args.records} records, orjson: {ORJSON_AVAILABLE})")
+    print("=" * 60)
+    print("Formatter only (records/sec):")
+    for level in ("info", "debug"):
+        legacy, current = formatter[f"legacy_{level}"], formatter[f"current_{level}"]
+        print(f"   {level.upper():6} legacy {legacy:>10,.0f}   current {current:>10,.0f}   ({current / legacy:.1f}x)")
+    print("Calling thread, DEBUG to file (records/sec):")
+    print(f"   direct handler + legacy formatter  {calling['direct_legacy']:>10,.0f}")
+    print(f"   queued pipeline + current formatter {calling['queued_current']:>10,.0f}"
+          f"   ({calling['queued_current'] / calling['direct_legacy']:.1f}x)")
+    print(f"   pipeline drain after run: {calling['queued_drain_seconds']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
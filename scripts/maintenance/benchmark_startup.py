@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Benchmark
+Measures dashboard and assistant startup time, subsystem readiness and peak memory
+
+Starts the dashboard server in a fresh process and measures:
+- wall time from process start to the first ``/api/status`` response
+- time from process start until each warm-up subsystem is ready
+  (LLM model loaded, STT loaded, TTS loaded, camera streaming), as reported
+  by ``/api/ready``
+- peak RSS of the server process during startup
+
+Runs the assistant entry point (``python -m src.main``) in a fresh process
+and measures the wall time until it has initialized and exited, and its
+peak RSS.
+
+Each measurement is the median across runs; peak RSS is also reported as
+the maximum across runs. Results are appended to ``startup_history`` in
+data/performance_baseline.json. The run fails if time to first status
+exceeds the watchdog deadline, or if a time or the median peak RSS regresses
+beyond the threshold against the median of the recent history from the same
+host.
+
+Usage:
+    python scripts/maintenance/benchmark_startup.py [--runs N] [--entry both|server|main] [--threshold 0.2] [--json] [--no-save]
+
+Exit codes:
+    0: Startup within limits
+    1: Regression, deadline missed, or benchmark failed
+"""
+
+import argparse
+import json
+import os
+import platform
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+ROOT = Path(__file__).resolve().parents[2]
+BASELINE_FILE = ROOT / "data" / "performance_baseline.json"
+HISTORY_KEY = "startup_history"
+HISTORY_SIZE = 100
+# Recent runs from the same host forming the baseline
+BASELINE_RUNS = 5
+POLL_INTERVAL = 0.02
+
+
+def free_port() -> int:
+    """Pick an unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_json(url: str) -> Optional[Dict[str, Any]]:
+    """GET a JSON endpoint, returning None while the server is not answering"""
+    try:
+        with urllib.request.urlopen(url, timeout=1.0) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        # /api/ready answers 503 with a body while warming up
+        return json.loads(e.read()) if e.code == 503 else None
+    except (urllib.error.URLError, ConnectionError, socket.timeout, json.JSONDecodeError):
+        return None
+
+
+def wait_for_exit(process: subprocess.Popen, timeout: float) -> Optional[float]:
+    """
+    Wait for a child to exit, killing it after the timeout
+
+    Args:
+        process: Child process
+        timeout: Seconds to wait before SIGKILL
+
+    Returns:
+        The child's own peak RSS in MB where the OS reports it, else None
+    """
+    if not hasattr(os, "wait4"):
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        return None
+    deadline = time.monotonic() + timeout
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.monotonic() > deadline:
+            process.kill()
+            pid, status, usage = os.wait4(process.pid, 0)
+            break
+        time.sleep(POLL_INTERVAL)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if platform.system() == "Darwin" else 1024)
+
+
+def measure_once(ready_timeout: float) -> Dict[str, Any]:
+    """
+    Start the server once and measure it
+
+    Args:
+        ready_timeout: Seconds to wait for warm-up before giving up
+
+    Returns:
+        Startup measurements for one run
+    """
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    # A file rather than a pipe, so a chatty server never blocks on a full pipe
+    errors = tempfile.TemporaryFile()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.server:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=errors
+    )
+    monitor = psutil.Process(process.pid) if PSUTIL_AVAILABLE else None
+    peak_rss = 0
+    status_seconds = None
+    ready: Optional[Dict[str, Any]] = None
+    try:
+        while time.perf_counter() - start < ready_timeout:
+            if process.poll() is not None:
+                errors.seek(0)
+                raise RuntimeError(f"server exited: {errors.read().decode(errors='replace').strip()[-500:]}")
+            if monitor is not None:
+                try:
+                    peak_rss = max(peak_rss, monitor.memory_info().rss)
+                except psutil.Error:
+                    pass
+            if status_seconds is None:
+                if get_json(f"{base}/api/status") is not None:
+                    status_seconds = time.perf_counter() - start
+            else:
+                ready = get_json(f"{base}/api/ready")
+                if ready is not None and ready.get("ready"):
+                    break
+            time.sleep(POLL_INTERVAL)
+        if status_seconds is None:
+            raise RuntimeError(f"no /api/status response within {ready_timeout:.0f}s")
+    finally:
+        process.send_signal(signal.SIGTERM)
+        # Sampling can miss short spikes; prefer the kernel's exact peak where available
+        exact_peak = wait_for_exit(process, 30)
+        errors.close()
+
+    subsystems = {}
+    for name, state in ((ready or {}).get("subsystems") or {}).items():
+        subsystems[name] = {
+            "state": state["state"],
+            "ready_seconds": state["ready_after"] if state["state"] == "ready" else None,
+        }
+    return {
+        "status_seconds": status_seconds,
+        "ready": bool(ready and ready.get("ready")),
+        "subsystems": subsystems,
+        "peak_rss_mb": exact_peak or (peak_rss / (1024 * 1024) if peak_rss else None),
+    }
+
+
+def measure_main_once(timeout: float) -> Dict[str, Any]:
+    """
+    Run the assistant entry point once and measure it
+
+    ``src.main`` returns once it has initialized, so the time to exit is the
+    time to an initialized assistant (plus interpreter shutdown).
+
+    Args:
+        timeout: Seconds to wait for the process to finish
+
+    Returns:
+        Startup measurements for one run
+    """
+    errors = tempfile.TemporaryFile()
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "src.main"], cwd=ROOT,
+                               stdout=subprocess.DEVNULL, stderr=errors)
+    try:
+        peak_rss = wait_for_exit(process, timeout)
+        seconds = time.perf_counter() - start
+        if seconds >= timeout:
+            raise RuntimeError(f"src.main did not finish within {timeout:.0f}s")
+        if process.returncode != 0:
+            errors.seek(0)
+            raise RuntimeError(f"src.main exited with {process.returncode}: "
+                               f"{errors.read().decode(errors='replace').strip()[-500:]}")
+    finally:
+        errors.close()
+    return {"main_seconds": seconds, "main_peak_rss_mb": peak_rss}
+
+
+def summarize(runs: List[Dict[str, Any]], main_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of each measurement across runs; peak RSS also as the maximum"""
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 3) if values else None
+
+    def maximum(values):
+        values = [v for v in values if v is not None]
+        return round(max(values), 3) if values else None
+
+    result: Dict[str, Any] = {}
+    if runs:
+        names = sorted({name for run in runs for name in run["subsystems"]})
+        result.update({
+            "status_seconds": median(run["status_seconds"] for run in runs),
+            "subsystems": {
+                name: {
+                    "ready_seconds": median(run["subsystems"].get(name, {}).get("ready_seconds") for run in runs),
+                    "state": runs[-1]["subsystems"].get(name, {}).get("state"),
+                }
+                for name in names
+            },
+            "peak_rss_mb": median(run["peak_rss_mb"] for run in runs),
+            "peak_rss_max_mb": maximum(run["peak_rss_mb"] for run in runs),
+        })
+    if main_runs:
+        result.update({
+            "main_seconds": median(run["main_seconds"] for run in main_runs),
+            "main_peak_rss_mb": median(run["main_peak_rss_mb"] for run in main_runs),
+            "main_peak_rss_max_mb": maximum(run["main_peak_rss_mb"] for run in main_runs),
+        })
+    return result
+
+
+def load_history() -> List[Dict[str, Any]]:
+    """Startup history from the performance baseline file"""
+    if not BASELINE_FILE.exists():
+        return []
+    return json.loads(BASELINE_FILE.read_text()).get(HISTORY_KEY, [])
+
+
+def save_history(entry: Dict[str, Any]) -> None:
+    """Append a result to the startup history, keeping other keys in the file"""
+    data = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    history = data.get(HISTORY_KEY, [])
+    history.append(entry)
+    data[HISTORY_KEY] = history[-HISTORY_SIZE:]
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_FILE.write_text(json.dumps(data, indent=2))
+
+
+def check_regressions(result: Dict[str, Any], history: List[Dict[str, Any]],
+                      threshold: float, deadline: float) -> List[str]:
+    """
+    Compare a result with the recent history from the same host
+
+    Args:
+        result: This run's summary
+        history: Previous entries
+        threshold: Allowed relative increase (0.2 = 20%)
+        deadline: Seconds allowed until the first /api/status response
+
+    Returns:
+        Failure messages (empty if startup is within limits)
+    """
+    failures = []
+    if result.get("status_seconds") is not None and result["status_seconds"] > deadline:
+        failures.append(f"first /api/status after {result['status_seconds']:.2f}s (deadline {deadline:.1f}s)")
+
+    # Failed runs are recorded but do not move the baseline
+    recent = [entry for entry in history
+              if entry.get("host") == result["host"] and entry.get("passed", True)][-BASELINE_RUNS:]
+    checks = [("status_seconds", "time to first status", "s"), ("peak_rss_mb", "median peak RSS", "MB"),
+              ("main_seconds", "src.main startup", "s"), ("main_peak_rss_mb", "src.main median peak RSS", "MB")]
+    checks += [(f"subsystems.{name}", f"{name} ready", "s") for name in result.get("subsystems", {})]
+    for key, label, unit in checks:
+        current = _lookup(result, key)
+        previous = [value for value in (_lookup(entry, key) for entry in recent) if value is not None]
+        if current is None or not previous:
+            continue
+        baseline = statistics.median(previous)
+        if current > baseline * (1 + threshold):
+            failures.append(f"{label} regressed: {current:.2f}{unit} vs baseline {baseline:.2f}{unit} "
+                            f"(+{(current / baseline - 1) * 100:.0f}%, limit {threshold * 100:.0f}%)")
+    return failures
+
+
+def _lookup(entry: Dict[str, Any], key: str) -> Optional[float]:
+    """Read a measurement; ``subsystems.<name>`` reads that subsystem's ready time"""
+    if key.startswith("subsystems."):
+        return (entry.get("subsystems") or {}).get(key.split(".", 1)[1], {}).get("ready_seconds")
+    return entry.get(key)
+
+
+def main() -> int:
+    """Run the cold-start benchmark"""
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the dashboard server and src.main")
+    parser.add_argument("--runs", type=int, default=3, help="Starts to measure per entry point (medians are reported)")
+    parser.add_argument("--entry", choices=("both", "server", "main"), default="both", help="Entry points to measure")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed increase over the baseline (0.2 = 20%%)")
+    parser.add_argument("--deadline", type=float, default=2.0, help="Seconds allowed until the first /api/status response")
+    parser.add_argument("--ready-timeout", type=float, default=120.0, help="Seconds to wait for warm-up (or src.main) per run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--no-save", action="store_true", help=f"Do not record the result in {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    count = max(1, args.runs)
+    try:
+        runs = [measure_once(args.ready_timeout) for _ in range(count)] if args.entry != "main" else []
+        main_runs = [measure_main_once(args.ready_timeout) for _ in range(count)] if args.entry != "server" else []
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    result = {
+        "timestamp": datetime.now().isoformat(),
+        "host": platform.node(),
+        "python": sys.version.split()[0],
+        "runs": count,
+        **summarize(runs, main_runs),
+    }
+    failures = check_regressions(result, load_history(), args.threshold, args.deadline)
+    result["passed"] = not failures
+    if not args.no_save:
+        save_history(result)
+
+    if args.json:
+        print(json.dumps({**result, "failures": failures}, indent=2))
+        return 0 if not failures else 1
+
+    print("=" * 60)
+    print(f"Cold start (median of {count}, Python {result['python']})")
+    print("=" * 60)
+    if runs:
+        print(f"   first /api/status      {result['status_seconds']:>7.2f}s   (deadline {args.deadline:.1f}s)")
+        for name, subsystem in result["subsystems"].items():
+            ready = subsystem["ready_seconds"]
+            print(f"   {name + ' ready':<22} " + (f"{ready:>7.2f}s" if ready is not None else f"{subsystem['state']:>8}"))
+        if result["peak_rss_mb"] is not None:
+            print(f"   peak RSS               {result['peak_rss_mb']:>7.1f}MB   (max {result['peak_rss_max_mb']:.1f}MB)")
+    if main_runs:
+        print(f"   src.main initialized   {result['main_seconds']:>7.2f}s")
+        if result["main_peak_rss_mb"] is not None:
+            print(f"   src.main peak RSS      {result['main_peak_rss_mb']:>7.1f}MB   (max {result['main_peak_rss_max_mb']:.1f}MB)")
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Startup within limits")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
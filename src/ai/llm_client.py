@@ -6,8 +6,12 @@ Interface to Ollama for AI responses (100% OFFLINE)
 import httpx
 import json
 import logging
-from typing import List, Dict, Optional, AsyncGenerator
+import time
+from typing import Any, List, Dict, Optional, AsyncGenerator
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.utils.metrics import registry
+from src.utils.performance import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,16 @@ class LLMClient:
     CRITICAL: All LLM calls must go to localhost:11434.
     No internet required. Fully offline operation.
     """
+
+    # Ollama takes the model and options per request and every call opens its own
+    # HTTP client, so every setting (the server URL included) is live
+    LIVE_SETTINGS = {
+        "ollama_url": "base_url",
+        "llm_model": "update_model",
+        "llm_temperature": "temperature",
+        "llm_max_tokens": "max_tokens",
+        "llm_system_prompt": "system_prompt",
+    }
     
     def __init__(self, settings: Settings):
         """
@@ -29,7 +43,7 @@ class LLMClient:
         """
         self.settings = settings
         # CRITICAL: Local only - no internet required
-        self.base_url = "http://localhost:11434"  # Local Ollama server
+        self.base_url = settings.ollama_url  # Local Ollama server, http://localhost:11434 by default
         self.model = settings.llm_model  # e.g., "llama2:13b"
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
@@ -53,7 +67,25 @@ class LLMClient:
             logger.error(f"Ollama not available: {e}")
             return False
     
-    async def generate(self, user_input: str, context: Optional[Dict] = None) -> str:
+    @log_performance
+    async def warm_up(self) -> bool:
+        """
+        Load the model into Ollama's memory so the first turn is fast
+
+        Returns:
+            True if the model is loaded, False if Ollama is not running
+        """
+        if not await self.check_ollama_available():
+            return False
+        # A generate request without a prompt only loads the model
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            response = await client.post(f"{self.base_url}/api/generate", json={"model": self.model})
+            response.raise_for_status()
+        logger.info(f"Model loaded: {self.model}")
+        return True
+
+    @log_performance
+    async def generate(self, user_input: str, context: Optional[Dict] = None, remember: bool = True) -> str:
         """
         Generate response from LLM (OFFLINE)
         
@@ -62,6 +94,8 @@ class LLMClient:
         Args:
             user_input: User's input text
             context: Optional context (vision, tools, etc.)
+            remember: If False, the exchange is not added to conversation history
+                (used for internal one-shot prompts such as scene descriptions)
             
         Returns:
             Generated response text
@@ -73,6 +107,7 @@ class LLMClient:
         messages = self._build_messages(user_input, context)
         
         # Call LOCAL Ollama API
+        start = time.perf_counter()
         async with httpx.AsyncClient(timeout=60.0) as client:
             response = await client.post(
                 f"{self.base_url}/api/chat",
@@ -88,13 +123,16 @@ class LLMClient:
             )
             response.raise_for_status()
             result = response.json()
+            get_performance_monitor().record("llm", "generate", (time.perf_counter() - start) * 1000)
+            self._record_generation(result)
             
             # Update conversation history
-            self.conversation_history.append({"role": "user", "content": user_input})
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": result["message"]["content"]
-            })
+            if remember:
+                self.conversation_history.append({"role": "user", "content": user_input})
+                self.conversation_history.append({
+                    "role": "assistant",
+                    "content": result["message"]["content"]
+                })
             
             return result["message"]["content"]
     
@@ -115,6 +153,8 @@ class LLMClient:
             raise ConnectionError("Ollama server not running locally")
         
         messages = self._build_messages(user_input, context)
+        start = time.perf_counter()
+        first_token = True
         
         async with httpx.AsyncClient(timeout=120.0) as client:
             async with client.stream(
@@ -135,10 +175,34 @@ class LLMClient:
                     if line:
                         try:
                             data = json.loads(line)
-                            if "message" in data and "content" in data["message"]:
-                                yield data["message"]["content"]
                         except json.JSONDecodeError:
                             continue
+                        if "message" in data and "content" in data["message"]:
+                            if first_token and data["message"]["content"]:
+                                first_token = False
+                                ttft = time.perf_counter() - start
+                                registry.set("zema_llm_time_to_first_token_seconds", ttft, model=self.model)
+                                get_performance_monitor().record("llm", "time_to_first_token", ttft * 1000)
+                            yield data["message"]["content"]
+                        if data.get("done"):
+                            get_performance_monitor().record("llm", "generate_stream", (time.perf_counter() - start) * 1000)
+                            self._record_generation(data)
+
+    def _record_generation(self, result: Dict[str, Any]) -> None:
+        """
+        Export token throughput from Ollama's final response statistics
+
+        Args:
+            result: Final (done) response object with eval_count/eval_duration
+        """
+        tokens = result.get("eval_count")
+        duration_ns = result.get("eval_duration")
+        if not tokens or not duration_ns:
+            return
+        seconds = duration_ns / 1e9
+        registry.inc("zema_llm_tokens_total", tokens, model=self.model)
+        registry.inc("zema_llm_generation_seconds_total", seconds, model=self.model)
+        registry.set("zema_llm_tokens_per_second", tokens / seconds, model=self.model)
     
     def _build_messages(self, user_input: str, context: Optional[Dict]) -> List[Dict]:
         """
@@ -0,0 +1,141 @@
+"""
+Broadcast Hub
+Fans dashboard messages out to websocket clients
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Hashable, Optional
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+class _Client:
+    """A connected websocket with its latest-only outbox"""
+
+    __slots__ = ("websocket", "pending", "ready", "task", "sent", "skipped")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.pending: Dict[Hashable, str] = {}
+        self.ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.skipped = 0
+
+
+class BroadcastHub:
+    """
+    Broadcast hub for dashboard websockets
+
+    Each published message is serialised once and the same text is handed to
+    every client. Clients have one slot per message key and their own writer
+    task: a client that is still sending when a newer message arrives skips
+    the older one, and a client whose send exceeds ``send_timeout`` is
+    disconnected, so a slow dashboard never delays the others.
+    """
+
+    def __init__(self, send_timeout: float = 1.0):
+        """
+        Initialize broadcast hub
+
+        Args:
+            send_timeout: Seconds a single send may take before the client is dropped
+        """
+        self.send_timeout = send_timeout
+        self.clients: Dict[WebSocket, _Client] = {}
+        self.published = 0
+        self.dropped_clients = 0
+        self._last: Dict[Hashable, str] = {}
+
+    def register(self, websocket: WebSocket) -> None:
+        """
+        Add a connected client
+
+        The client immediately receives the latest message for every key.
+
+        Args:
+            websocket: Accepted websocket
+        """
+        client = _Client(websocket)
+        client.pending.update(self._last)
+        if client.pending:
+            client.ready.set()
+        client.task = asyncio.create_task(self._writer(client), name="ws-writer")
+        self.clients[websocket] = client
+        logger.debug(f"Dashboard client connected ({len(self.clients)} total)")
+
+    def unregister(self, websocket: WebSocket) -> None:
+        """
+        Remove a client and stop its writer
+
+        Args:
+            websocket: Client websocket
+        """
+        client = self.clients.pop(websocket, None)
+        if client is not None and client.task is not None:
+            client.task.cancel()
+            logger.debug(f"Dashboard client disconnected ({len(self.clients)} total)")
+
+    def publish(self, message: Dict[str, Any], key: Optional[Hashable] = None) -> None:
+        """
+        Send a message to all clients
+
+        Args:
+            message: JSON-serialisable message
+            key: Slot key; a newer message with the same key replaces an unsent one
+                (defaults to the message type)
+        """
+        key = key if key is not None else message.get("type")
+        text = json.dumps(message, default=str)
+        self._last[key] = text
+        self.published += 1
+        for client in self.clients.values():
+            if key in client.pending:
+                client.skipped += 1
+            client.pending[key] = text
+            client.ready.set()
+
+    async def close(self) -> None:
+        """Stop all writers"""
+        for websocket in list(self.clients):
+            self.unregister(websocket)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get broadcast statistics
+
+        Returns:
+            Dictionary with client count and per-client sent/skipped counts
+        """
+        return {
+            "clients": len(self.clients),
+            "published": self.published,
+            "dropped_clients": self.dropped_clients,
+            "sent": sum(c.sent for c in self.clients.values()),
+            "skipped": sum(c.skipped for c in self.clients.values()),
+        }
+
+    async def _writer(self, client: _Client) -> None:
+        """Drain one client's outbox"""
+        while True:
+            await client.ready.wait()
+            client.ready.clear()
+            pending, client.pending = client.pending, {}
+            for text in pending.values():
+                try:
+                    await asyncio.wait_for(client.websocket.send_text(text), self.send_timeout)
+                    client.sent += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Dropping dashboard client: {e or type(e).__name__}")
+                    self.dropped_clients += 1
+                    self.clients.pop(client.websocket, None)
+                    try:
+                        await client.websocket.close()
+                    except Exception:
+                        pass
+                    return
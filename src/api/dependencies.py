@@ -0,0 +1,32 @@
+"""
+API Dependencies
+FastAPI dependencies resolving application-scoped services
+"""
+
+from fastapi import HTTPException, Request
+from src.config.config_manager import ConfigManager
+from src.core.container import Container
+from src.core.event_bus import EventBus
+
+
+def get_container(request: Request) -> Container:
+    """
+    Get the application container created at startup
+
+    Raises:
+        HTTPException: 503 if the application has not started
+    """
+    container = getattr(request.app.state, "container", None)
+    if container is None:
+        raise HTTPException(status_code=503, detail="Application is starting")
+    return container
+
+
+def get_config_manager(request: Request) -> ConfigManager:
+    """Dependency returning the shared ConfigManager"""
+    return get_container(request).config_manager
+
+
+def get_event_bus(request: Request) -> EventBus:
+    """Dependency returning the application event bus"""
+    return get_container(request).event_bus
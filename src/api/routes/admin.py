@@ -0,0 +1,53 @@
+"""
+Admin API Routes
+Production diagnostics: on-demand profiling and recent trace spans
+"""
+
+import asyncio
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any, Optional
+from src.api.dependencies import get_container
+from src.config.settings import settings
+from src.core.container import Container
+from src.utils.profiler import ProfilerBusyError, profile
+from src.utils.tracing import span_store
+
+router = APIRouter()
+
+@router.post("/api/admin/profile")
+async def run_profile(
+    seconds: float = Query(10.0, gt=0, description="Seconds to sample"),
+    interval_ms: float = Query(5.0, ge=1.0, le=100.0, description="Milliseconds between samples")
+) -> PlainTextResponse:
+    """
+    Sample all threads and return a collapsed-stack flamegraph file
+
+    Render with flamegraph.pl, speedscope or inferno.
+    """
+    if seconds > settings.profiler_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {settings.profiler_max_seconds}")
+    try:
+        stacks = await asyncio.to_thread(profile, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    filename = f"zema-profile-{time.strftime('%Y%m%d-%H%M%S')}.folded"
+    return PlainTextResponse(stacks, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+@router.get("/api/admin/traces")
+async def get_traces(
+    limit: int = Query(100, ge=1, le=2000),
+    min_duration_ms: float = Query(0.0, ge=0),
+    name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get recent trace spans, newest first"""
+    return {
+        "enabled": span_store.enabled,
+        "spans": span_store.recent(limit, min_duration_ms, name)
+    }
+
+@router.get("/api/admin/reconfigure")
+async def get_reconfigure_stats(container: Container = Depends(get_container)) -> Dict[str, Any]:
+    """Get live-reconfiguration state per component (settings followed, reloads, in-flight users)"""
+    return {"components": container.reconfigurator.get_stats()}
@@ -6,8 +6,8 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 from src.config.settings import settings
-from src.config.config_manager import ConfigManager
-from src.core.event_bus import EventBus
+from src.config.config_manager import ConfigManager, ConfigValidationError
+from src.api.dependencies import get_config_manager
 
 router = APIRouter()
 
@@ -20,11 +20,6 @@ class ConfigBulkUpdate(BaseModel):
     """Bulk configuration update model"""
     updates: Dict[str, Any]
 
-def get_config_manager() -> ConfigManager:
-    """Dependency to get ConfigManager instance"""
-    event_bus = EventBus()
-    return ConfigManager(settings, event_bus)
-
 # User-facing settings (exposed in dashboard)
 USER_FACING_SETTINGS = {
     # Privacy & Security
@@ -34,6 +29,7 @@ USER_FACING_SETTINGS = {
     'wakeword_keywords',
     'wakeword_sensitivity',
     'stt_language',
+    'stt_model',
     'tts_voice',
     'tts_speed',
     'audio_input_device_index',  # Phase 0.5: Hardware verification
@@ -41,6 +37,7 @@ USER_FACING_SETTINGS = {
     # Camera & Vision
     'camera_tracking',
     'camera_gestures',
+    'camera_fps',
     'camera_device_path',  # Phase 0.5: Hardware verification
     # AI & Intelligence
     'llm_model',
@@ -101,10 +98,11 @@ async def update_config(
             detail=f"Setting '{update.key}' is not user-configurable. Use .env file for technical settings."
         )
     
-    success = config_manager.update_setting(update.key, update.value)
-    if success:
-        return {"status": "updated", "key": update.key, "value": update.value}
-    raise HTTPException(status_code=400, detail="Invalid setting or value")
+    try:
+        config_manager.update_settings({update.key: update.value})
+    except ConfigValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid setting or value: {e}")
+    return {"status": "updated", "key": update.key, "value": getattr(config_manager.settings, update.key)}
 
 @router.post("/api/config/bulk")
 async def update_config_bulk(
@@ -124,6 +122,7 @@ async def update_config_bulk(
     
     results = {}
     errors = []
+    accepted = {}
     
     for key, value in updates.updates.items():
         logger.debug(f"Processing update: {key} = {value} (type: {type(value).__name__})")
@@ -135,23 +134,28 @@ async def update_config_bulk(
             errors.append(error_msg)
             results[key] = {"status": "error", "message": "Not a user-facing setting"}
             continue
-        
-        # Update setting
-        try:
-            success = config_manager.update_setting(key, value)
-            if success:
-                logger.info(f"Successfully updated setting: {key} = {value}")
-                results[key] = {"status": "updated", "value": value}
-            else:
-                error_msg = f"Failed to update '{key}'"
-                logger.error(error_msg)
-                errors.append(error_msg)
-                results[key] = {"status": "error", "message": "Update failed"}
-        except Exception as e:
-            error_msg = f"Exception updating '{key}': {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            errors.append(error_msg)
-            results[key] = {"status": "error", "message": str(e)}
+        accepted[key] = value
+    
+    # Validate and apply the accepted settings together: one write, one event
+    try:
+        changes = config_manager.update_settings(accepted)
+    except ConfigValidationError as e:
+        logger.warning(f"Bulk update rejected: {e}")
+        for key in accepted:
+            message = e.errors.get(key)
+            results[key] = {"status": "error", "message": message or "Not applied (batch rejected)"}
+            if message:
+                errors.append(f"Invalid value for '{key}': {message}")
+        return {
+            "status": "error",
+            "results": results,
+            "errors": errors,
+            "message": f"No settings were saved. {len(e.errors)} invalid value(s)."
+        }
+    
+    for key in accepted:
+        value = getattr(config_manager.settings, key)
+        results[key] = {"status": "updated" if key in changes else "unchanged", "value": value}
     
     if errors:
         logger.warning(f"Bulk update completed with {len(errors)} errors: {errors}")
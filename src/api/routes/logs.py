@@ -10,21 +10,24 @@ from pathlib import Path
 import json
 import asyncio
 from datetime import datetime
+from src.utils.log_index import QueryError, get_log_index
+from src.utils.log_follower import LogFollower
+from src.utils.log_stats import read_log_stats, reset_log_stats
+from src.utils.log_store import LogStore
 
 router = APIRouter()
 
 LOG_FILE = Path("data/logs/zema.log")
+STATS_FILE = LOG_FILE.parent / "stats.json"
 
+# Indexed reader over zema.log, its rotated backups and the compressed archive
+log_store = LogStore(LOG_FILE, archive_dir=LOG_FILE.parent / "archive")
 
-def parse_log_line(line: str) -> Optional[Dict[str, Any]]:
-    """Parse a JSON log line into a dictionary"""
-    try:
-        if line.strip():
-            return json.loads(line.strip())
-    except json.JSONDecodeError:
-        # If line is not valid JSON, return None
-        return None
-    return None
+# One follower of zema.log shared by all stream clients
+log_follower = LogFollower(LOG_FILE)
+
+# Seconds between SSE keepalive comments on a quiet stream
+STREAM_KEEPALIVE = 15.0
 
 
 @router.get("/api/logs")
@@ -32,7 +35,9 @@ async def get_logs(
     limit: int = Query(default=100, ge=1, le=1000, description="Number of log entries to return"),
     level: Optional[str] = Query(default=None, description="Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"),
     search: Optional[str] = Query(default=None, description="Search term in log messages"),
-    tail: bool = Query(default=True, description="Get logs from end of file (tail)")
+    tail: bool = Query(default=True, description="Get logs from end of file (tail)"),
+    since: Optional[datetime] = Query(default=None, description="Only entries at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only entries at or before this time")
 ) -> Dict[str, Any]:
     """
     Get log entries from log file
@@ -42,6 +47,8 @@ async def get_logs(
         level: Filter by log level (optional)
         search: Search term in log messages (optional)
         tail: If True, get logs from end of file (default: True)
+        since: Earliest entry time (optional)
+        until: Latest entry time (optional)
     
     Returns:
         Dictionary with log entries and metadata
@@ -54,40 +61,16 @@ async def get_logs(
         }
     
     try:
-        # Read log file
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Parse log lines
-        log_entries = []
-        for line in lines:
-            log_entry = parse_log_line(line)
-            if log_entry:
-                log_entries.append(log_entry)
-        
-        # Apply filters
-        filtered_logs = log_entries
-        
-        # Filter by level if specified
-        if level:
-            level_upper = level.upper()
-            filtered_logs = [log for log in filtered_logs if log.get('level') == level_upper]
-        
-        # Filter by search term if specified
-        if search:
-            search_lower = search.lower()
-            filtered_logs = [
-                log for log in filtered_logs
-                if search_lower in log.get('message', '').lower() or
-                   search_lower in log.get('logger', '').lower() or
-                   search_lower in log.get('module', '').lower()
-            ]
-        
-        # Get tail or head
-        if tail:
-            filtered_logs = filtered_logs[-limit:]
-        else:
-            filtered_logs = filtered_logs[:limit]
+        # search is a plain substring; the field query language is /api/logs/search
+        filtered_logs = await asyncio.to_thread(
+            log_store.query,
+            limit=limit,
+            level=level,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+            search=search,
+            tail=tail
+        )
         
         return {
             "logs": filtered_logs,
@@ -97,6 +80,8 @@ async def get_logs(
             "filters": {
                 "level": level,
                 "search": search,
+                "since": since.isoformat() if since else None,
+                "until": until.isoformat() if until else None,
                 "limit": limit
             }
         }
@@ -105,47 +90,98 @@ async def get_logs(
         raise HTTPException(status_code=500, detail=f"Error reading logs: {str(e)}")
 
 
+@router.get("/api/logs/search")
+async def search_logs(
+    q: str = Query(default="", description="Query, e.g. 'level:ERROR logger:src.ai* timeout'"),
+    since: Optional[datetime] = Query(default=None, description="Only entries at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only entries at or before this time"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Number of log entries to return"),
+    cursor: Optional[int] = Query(default=None, description="next_cursor from the previous page")
+) -> Dict[str, Any]:
+    """
+    Search the full-text log index
+    
+    Args:
+        q: Field-scoped query (level:, logger:, module:, function:, message: and bare words)
+        since: Earliest entry time (optional)
+        until: Latest entry time (optional)
+        limit: Maximum number of log entries to return (1-1000)
+        cursor: Pagination cursor (optional)
+    
+    Returns:
+        Dictionary with log entries (newest first) and next_cursor
+    """
+    log_index = get_log_index()
+    if log_index is None:
+        raise HTTPException(status_code=503, detail="Log search index is not available")
+    
+    try:
+        result = await asyncio.to_thread(
+            log_index.search,
+            q,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+            limit=limit,
+            cursor=cursor
+        )
+    except QueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching logs: {str(e)}")
+    
+    return {
+        "logs": result["logs"],
+        "total": len(result["logs"]),
+        "next_cursor": result["next_cursor"],
+        "query": q
+    }
+
+
 @router.get("/api/logs/stream")
-async def stream_logs() -> StreamingResponse:
+async def stream_logs(
+    level: Optional[str] = Query(default=None, description="Only stream this log level"),
+    search: Optional[str] = Query(default=None, description="Only stream entries containing this term"),
+    initial: int = Query(default=50, ge=0, le=1000, description="Recent entries sent on connect")
+) -> StreamingResponse:
     """
     Stream logs in real-time via Server-Sent Events (SSE)
     
+    All clients share one follower of the log file; each gets its own
+    filtered, bounded queue.
+    
+    Args:
+        level: Filter by log level (optional)
+        search: Search term in message, logger or module (optional)
+        initial: Number of recent matching entries sent first
+    
     Returns:
         StreamingResponse with log entries as they're written
     """
     async def log_generator() -> AsyncGenerator[str, None]:
         """Generate log entries as they're written"""
-        # Read existing logs first
-        if LOG_FILE.exists():
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in lines[-50:]:  # Last 50 lines
-                    log_entry = parse_log_line(line)
-                    if log_entry:
-                        yield f"data: {json.dumps(log_entry)}\n\n"
-        
-        # Monitor file for new entries
-        last_position = LOG_FILE.stat().st_size if LOG_FILE.exists() else 0
-        
-        while True:
-            try:
-                if LOG_FILE.exists():
-                    with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                        f.seek(last_position)
-                        new_lines = f.readlines()
-                        
-                        for line in new_lines:
-                            log_entry = parse_log_line(line)
-                            if log_entry:
-                                yield f"data: {json.dumps(log_entry)}\n\n"
-                        
-                        last_position = f.tell()
-                
-                await asyncio.sleep(0.5)  # Check every 500ms
-                
-            except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                await asyncio.sleep(1)
+        subscriber = log_follower.subscribe(level=level, search=search)
+        try:
+            recent: List[Dict[str, Any]] = []
+            if initial and LOG_FILE.exists():
+                recent = await asyncio.to_thread(log_store.query, limit=initial, level=level, search=search)
+                for log_entry in recent:
+                    yield f"data: {json.dumps(log_entry)}\n\n"
+            
+            # Skip records that arrived while the recent entries were read
+            while not subscriber.queue.empty() and recent:
+                log_entry = subscriber.queue.get_nowait()
+                if log_entry not in recent:
+                    yield f"data: {json.dumps(log_entry)}\n\n"
+            
+            while True:
+                try:
+                    log_entry = await asyncio.wait_for(subscriber.queue.get(), timeout=STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(log_entry)}\n\n"
+        finally:
+            log_follower.unsubscribe(subscriber)
     
     return StreamingResponse(
         log_generator(),
@@ -160,7 +196,17 @@ async def stream_logs() -> StreamingResponse:
 
 @router.get("/api/logs/stats")
 async def get_log_stats() -> Dict[str, Any]:
-    """Get statistics about log file"""
+    """
+    Get statistics about log file
+    
+    Counts are maintained by the logging pipeline as records are written,
+    so this does not read the log. ``total_records`` counts log records
+    (a multi-line record counts once, rotated records are included) since
+    ``counting_since``.
+    
+    Returns:
+        Dictionary with file info, record and level counts, top loggers and top errors
+    """
     if not LOG_FILE.exists():
         return {
             "exists": False,
@@ -168,25 +214,7 @@ async def get_log_stats() -> Dict[str, Any]:
         }
     
     try:
-        # Read log file and count by level
-        level_counts = {
-            "DEBUG": 0,
-            "INFO": 0,
-            "WARNING": 0,
-            "ERROR": 0,
-            "CRITICAL": 0
-        }
-        
-        total_lines = 0
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                total_lines += 1
-                log_entry = parse_log_line(line)
-                if log_entry and 'level' in log_entry:
-                    level = log_entry['level']
-                    if level in level_counts:
-                        level_counts[level] += 1
-        
+        stats = read_log_stats(STATS_FILE).snapshot()
         file_stat = LOG_FILE.stat()
         
         return {
@@ -194,8 +222,12 @@ async def get_log_stats() -> Dict[str, Any]:
             "file_path": str(LOG_FILE),
             "file_size": file_stat.st_size,
             "file_size_mb": round(file_stat.st_size / (1024 * 1024), 2),
-            "total_lines": total_lines,
-            "level_counts": level_counts,
+            "total_records": stats["total"],
+            "level_counts": stats["level_counts"],
+            "top_loggers": [{"logger": name, "count": count} for name, count in stats["top_loggers"]],
+            "top_errors": [{"message": message, "count": count} for message, count in stats["top_errors"]],
+            "errors_last_hour": stats["errors_last_hour"],
+            "counting_since": datetime.fromtimestamp(stats["since"]).isoformat(),
             "last_modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
         }
     
@@ -203,6 +235,22 @@ async def get_log_stats() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Error getting log stats: {str(e)}")
 
 
+@router.get("/api/logs/stats/errors")
+async def get_error_series(
+    minutes: int = Query(default=60, ge=1, le=1440, description="Minutes of history")
+) -> Dict[str, Any]:
+    """
+    Get errors per minute for the dashboard
+    
+    Args:
+        minutes: Minutes of history (1-1440)
+    
+    Returns:
+        Dictionary with minute timestamps (epoch seconds) and ERROR/CRITICAL counts
+    """
+    return read_log_stats(STATS_FILE).error_series(minutes)
+
+
 @router.delete("/api/logs/clear")
 async def clear_logs() -> Dict[str, Any]:
     """Clear log file (admin only - should have authentication in production)"""
@@ -212,6 +260,11 @@ async def clear_logs() -> Dict[str, Any]:
             # Create empty log file
             LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
             LOG_FILE.touch()
+        # Drop indexed copies and counts of the cleared records
+        log_index = get_log_index()
+        if log_index is not None:
+            await asyncio.to_thread(log_index.clear)
+        await asyncio.to_thread(reset_log_stats, STATS_FILE)
         
         return {
             "success": True,
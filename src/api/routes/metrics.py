@@ -0,0 +1,15 @@
+"""
+Metrics API Routes
+Prometheus scrape endpoint
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from src.utils.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Prometheus metrics in text exposition format"""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -4,10 +4,12 @@ Provides endpoints for running internal tests and validation
 """
 
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, Any, List
 import traceback
 from datetime import datetime
+from src.api.dependencies import get_config_manager
+from src.config.config_manager import ConfigManager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -182,17 +184,13 @@ async def run_api_endpoint_tests() -> List[QATestResult]:
     return results
 
 
-async def run_save_functionality_tests() -> List[QATestResult]:
+async def run_save_functionality_tests(config_manager: ConfigManager) -> List[QATestResult]:
     """Test save functionality"""
     results = []
     
     # Test: Config manager can update settings
     try:
-        from src.config.config_manager import ConfigManager
         from src.config.settings import settings
-        from src.core.event_bus import EventBus
-        
-        config_manager = ConfigManager(settings, EventBus())
         
         # Test updating a setting
         test_key = "log_level"
@@ -292,7 +290,7 @@ async def run_logging_tests() -> List[QATestResult]:
 
 
 @router.get("/api/qa/test/all")
-async def run_all_qa_tests() -> Dict[str, Any]:
+async def run_all_qa_tests(config_manager: ConfigManager = Depends(get_config_manager)) -> Dict[str, Any]:
     """
     Run all QA tests
     
@@ -306,7 +304,7 @@ async def run_all_qa_tests() -> Dict[str, Any]:
         button_results = await run_button_tests()
         slider_results = await run_slider_tests()
         api_results = await run_api_endpoint_tests()
-        save_results = await run_save_functionality_tests()
+        save_results = await run_save_functionality_tests(config_manager)
         logging_results = await run_logging_tests()
         
         # Add all results
@@ -372,9 +370,9 @@ async def test_sliders() -> Dict[str, Any]:
 
 
 @router.get("/api/qa/test/save")
-async def test_save_functionality() -> Dict[str, Any]:
+async def test_save_functionality(config_manager: ConfigManager = Depends(get_config_manager)) -> Dict[str, Any]:
     """Test save functionality"""
-    results = await run_save_functionality_tests()
+    results = await run_save_functionality_tests(config_manager)
     return {
         "status": "success",
         "tests": [
@@ -2,10 +2,13 @@
 System API Routes
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
 from typing import Dict, Any
-import psutil
 import time
+from src.api.dependencies import get_container
+from src.core.container import Container
+from src.utils.system_sampler import get_system_sampler
 
 router = APIRouter()
 
@@ -16,11 +19,15 @@ def get_system_status() -> Dict[str, Any]:
     """Get system status - shared function for API and WebSocket"""
     # Calculate uptime in seconds
     uptime_seconds = int(time.time() - start_time)
-    
+
+    # Latest background sample; never calls psutil on the request path
+    sample = get_system_sampler().latest()
+
     return {
+        **sample,
         "listening": True,  # TODO: Get actual listening status from core
-        "cpu_percent": psutil.cpu_percent(interval=0.1),
-        "memory_percent": psutil.virtual_memory().percent,
+        "cpu_percent": sample["cpu_percent"] or 0,
+        "memory_percent": sample["memory_percent"] or 0,
         "uptime": uptime_seconds
     }
 
@@ -29,3 +36,21 @@ async def get_status() -> Dict[str, Any]:
     """Get system status"""
     return get_system_status()
 
+@router.get("/api/status/history")
+async def get_status_history(
+    window: float = Query(300.0, gt=0, description="Seconds of history"),
+    points: int = Query(120, ge=1, le=2000, description="Maximum points per series")
+) -> Dict[str, Any]:
+    """Get downsampled system resource series for dashboard charts"""
+    sampler = get_system_sampler()
+    return {
+        "window": window,
+        "interval": sampler.interval,
+        "series": sampler.history(window, points)
+    }
+
+@router.get("/api/ready")
+async def get_ready(container: Container = Depends(get_container)) -> JSONResponse:
+    """Readiness: 200 once background warm-up has finished, 503 while subsystems are loading"""
+    status = container.warmup.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
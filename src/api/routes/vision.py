@@ -3,16 +3,39 @@ Vision API Routes
 Handles screen capture, camera feed, and vision processing
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional
+import asyncio
 import logging
 import base64
 from pathlib import Path
+from src.api.dependencies import get_container
+from src.config.settings import settings
+from src.core.container import Container
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_model3d_generator = None
+
+
+class Model3DJobRequest(BaseModel):
+    """3D reconstruction capture request"""
+    frames: int = Field(default=60, ge=2, le=500, description="Number of frames to capture")
+    interval: float = Field(default=0.2, ge=0.0, le=10.0, description="Seconds between captured frames")
+    output_name: Optional[str] = Field(default=None, description="Output file name (.ply or .obj)")
+
+
+def get_model3d_generator():
+    """Get the shared 3D model generator (created on first use)"""
+    global _model3d_generator
+    if _model3d_generator is None:
+        from src.vision.model3d import Model3DGenerator
+        _model3d_generator = Model3DGenerator(settings)
+    return _model3d_generator
+
 
 @router.post("/api/vision/screenshot")
 async def upload_screenshot(screenshot: UploadFile = File(...)) -> Dict[str, Any]:
@@ -57,6 +80,19 @@ async def get_camera_status() -> Dict[str, Any]:
     }
 
 
+@router.get("/api/vision/scheduler")
+async def get_vision_scheduler(container: Container = Depends(get_container)) -> Dict[str, Any]:
+    """Get frame scheduling statistics of the vision pipeline"""
+    if not container.vision_running:
+        return {"running": False, "frames_captured": 0, "consumers": {}}
+    scheduler = container.vision_scheduler
+    return {
+        "running": True,
+        "frames_captured": scheduler.frames_captured,
+        "consumers": scheduler.get_stats(),
+    }
+
+
 @router.post("/api/vision/analyze")
 async def analyze_image(image: UploadFile = File(...)) -> Dict[str, Any]:
     """Analyze uploaded image"""
@@ -83,3 +119,62 @@ async def analyze_image(image: UploadFile = File(...)) -> Dict[str, Any]:
         logger.error(f"Image analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+
+@router.post("/api/vision/model3d/jobs")
+async def start_model3d_job(
+    request: Model3DJobRequest,
+    container: Container = Depends(get_container)
+) -> Dict[str, Any]:
+    """Start a background 3D reconstruction capture from the shared camera"""
+    from src.utils.helpers import safe_filename
+
+    def open_camera() -> bool:
+        with container.camera.use() as camera:
+            return camera.cap is not None or camera.open()
+
+    def read_frame():
+        with container.camera.use() as camera:
+            return camera.capture_frame()
+
+    if container.vision_running:
+        # The scheduler owns the camera stream; share its frames
+        next_frame = container.vision_scheduler.next_frame
+    elif await asyncio.to_thread(open_camera):
+        next_frame = lambda: asyncio.to_thread(read_frame)
+    else:
+        raise HTTPException(status_code=503, detail="Camera not available")
+
+    output_name = safe_filename(request.output_name or "model.ply")
+    if Path(output_name).suffix.lower() not in (".ply", ".obj"):
+        output_name += ".ply"
+
+    generator = get_model3d_generator()
+    job = generator.start_capture(
+        next_frame, request.frames, request.interval,
+        Path("data/exports") / output_name
+    )
+    return job.get_status()
+
+
+@router.get("/api/vision/model3d/jobs/{job_id}")
+async def get_model3d_job(job_id: str) -> Dict[str, Any]:
+    """Get 3D reconstruction job status and progress"""
+    status = get_model3d_generator().get_job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status
+
+
+@router.delete("/api/vision/model3d/jobs/{job_id}")
+async def cancel_model3d_job(job_id: str) -> Dict[str, Any]:
+    """Cancel a running 3D reconstruction job (409 if it already finished)"""
+    from src.vision.model3d import FINISHED_STATES
+
+    generator = get_model3d_generator()
+    job = generator.get_job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] in FINISHED_STATES:
+        raise HTTPException(status_code=409, detail=f"Job already {job['status']}")
+    return {"success": True, "job_id": job_id, "status": generator.cancel_job(job_id)}
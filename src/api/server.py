@@ -1,6 +1,11 @@
 """
 Web Dashboard Server
 FastAPI server for Zema dashboard
+
+Keep this module and the route modules free of top-level imports of model
+libraries (numpy-heavy vision/voice stacks, cv2, faster_whisper, piper,
+ultralytics): the dashboard must answer within the watchdog deadline.
+Components are imported inside handlers or by the background warm-up.
 """
 
 import logging
@@ -8,11 +13,15 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
 import asyncio
 from pathlib import Path
-from src.config.settings import Settings
-from src.api.routes import logs, system, config, users, conversations, voice, vision, hardware, models, qa
+from src.config.settings import Settings, settings
+from src.core.container import Container
+from src.api.broadcast import BroadcastHub
+from src.utils.system_sampler import get_system_sampler
+from src.utils.metrics import registry, event_bus_collector, executor_collector, log_pipeline_collector, performance_collector
+from src.utils.tracing import span_store
+from src.api.routes import logs, system, config, users, conversations, voice, vision, hardware, models, qa, metrics, admin
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +38,8 @@ app.include_router(vision.router)
 app.include_router(hardware.router)
 app.include_router(models.router)
 app.include_router(qa.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
 
 # CORS middleware
 app.add_middleware(
@@ -44,18 +55,80 @@ static_dir = Path("src/api/static")
 if static_dir.exists():
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
-# WebSocket connections
-websocket_connections = []
+# Dashboard websocket fan-out
+hub = BroadcastHub(send_timeout=settings.dashboard_send_timeout)
+
+# Topics forwarded to /ws clients as coalesced telemetry batches
+TELEMETRY_TOPICS = ("vision.**", "voice.audio_level", "gesture_detected")
+
+_background_tasks = []
+_collectors = []
+
+async def status_sampler() -> None:
+    """Publish one status snapshot per interval to all dashboards"""
+    while True:
+        try:
+            status = system.get_system_status()
+        except Exception as e:
+            logger.error(f"Error getting status: {e}")
+            # Fallback status
+            status = {
+                "listening": False,
+                "cpu_percent": 0,
+                "memory_percent": 0,
+                "uptime": 0
+            }
+        hub.publish({"type": "status", "data": status})
+        await asyncio.sleep(settings.dashboard_status_interval)
+
+def _forward_telemetry(topic: str):
+    """Build a bus callback publishing one telemetry batch per tick"""
+    def forward(events: list) -> None:
+        hub.publish({"type": "telemetry", "events": events}, key=f"telemetry:{topic}")
+    return forward
 
 @app.on_event("startup")
 async def startup() -> None:
     """Startup event"""
     logger.info("Dashboard server starting...")
+    span_store.configure(settings.tracing_enabled, settings.trace_buffer_size)
+    # One set of application services for every route and background task
+    container = Container(settings)
+    app.state.container = container
+    await container.start()
+    await asyncio.to_thread(get_system_sampler)
+    # Scrape-time views of preaggregated component state for GET /metrics
+    _collectors.extend([
+        performance_collector(container.performance_monitor),
+        executor_collector(container.inference_executor),
+        event_bus_collector(container.event_bus),
+        log_pipeline_collector(),
+    ])
+    for collector in _collectors:
+        registry.register_collector(collector)
+    # Latest value per topic, batched per pattern at most telemetry_hz times a second
+    for topic in TELEMETRY_TOPICS:
+        container.event_bus.subscribe(topic, _forward_telemetry(topic), max_rate_hz=settings.dashboard_telemetry_hz, batch=True)
+    _background_tasks.append(asyncio.create_task(status_sampler(), name="status-sampler"))
+    # Heavy subsystems load after startup returns, while the dashboard is already serving;
+    # the "vision" step starts the frame scheduler, which container.stop() stops
+    container.add_warmup_steps()
+    _background_tasks.append(container.warmup.start())
 
 @app.on_event("shutdown")
 async def shutdown() -> None:
     """Shutdown event"""
     logger.info("Dashboard server shutting down...")
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    for collector in _collectors:
+        registry.unregister_collector(collector)
+    _collectors.clear()
+    await hub.close()
+    await app.state.container.stop()
+    app.state.container = None
+    get_system_sampler().stop()
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard() -> HTMLResponse:
@@ -69,38 +142,22 @@ async def dashboard() -> HTMLResponse:
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """WebSocket for real-time updates"""
     await websocket.accept()
-    websocket_connections.append(websocket)
-    
+    hub.register(websocket)
+
     try:
+        # Updates are pushed by the hub; this loop only notices disconnects
         while True:
-            # Get real status using shared function
-            try:
-                status = system.get_system_status()
-            except Exception as e:
-                logger.error(f"Error getting status: {e}")
-                # Fallback status
-                status = {
-                    "listening": False,
-                    "cpu_percent": 0,
-                    "memory_percent": 0,
-                    "uptime": 0
-                }
-            
-            # Send status updates
-            await websocket.send_json({
-                "type": "status",
-                "data": status
-            })
-            await asyncio.sleep(2)  # Update every 2 seconds
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        websocket_connections.remove(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        if websocket in websocket_connections:
-            websocket_connections.remove(websocket)
+    finally:
+        hub.unregister(websocket)
 
 async def start_dashboard(settings: Settings) -> None:
     """Start dashboard server"""
+    import uvicorn
     config = uvicorn.Config(
         app,
         host=settings.dashboard_host,
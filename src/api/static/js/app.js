@@ -135,7 +135,7 @@ async function updateLogStats() {
             statsEl.innerHTML = `
                 <small>
                     File: ${(stats.file_size_mb || 0).toFixed(2)} MB | 
-                    Lines: ${stats.total_lines || 0} | 
+                    Records: ${stats.total_records || 0} | 
                     DEBUG: ${stats.level_counts?.DEBUG || 0} | 
                     INFO: ${stats.level_counts?.INFO || 0} | 
                     WARNING: ${stats.level_counts?.WARNING || 0} | 
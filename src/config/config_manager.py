@@ -5,41 +5,68 @@ Manages live configuration updates without restart
 
 import logging
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
+from pydantic import ValidationError
 from src.config.settings import Settings
 from src.core.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
 
+class ConfigValidationError(ValueError):
+    """Raised when a configuration update is rejected; no setting was changed"""
+
+    def __init__(self, errors: Dict[str, str]):
+        """
+        Initialize validation error
+
+        Args:
+            errors: Error message per setting name
+        """
+        self.errors = errors
+        super().__init__("; ".join(f"{key}: {message}" for key, message in errors.items()))
+
+
 class ConfigManager:
     """
     Configuration manager for live updates
-    
+
     Handles:
-    - Configuration updates
+    - Configuration updates (validated and applied as one transaction)
     - Validation
-    - Event broadcasting
-    - Persistent storage
+    - Event broadcasting (one config_changed event per transaction)
+    - Persistent storage (only changed settings, written atomically and
+      debounced on a background timer)
     """
-    
-    def __init__(self, settings: Settings, event_bus: Optional[EventBus] = None):
+
+    def __init__(self, settings: Settings, event_bus: Optional[EventBus] = None,
+                 config_file: Optional[Path] = None, save_delay: float = 0.5):
         """
         Initialize configuration manager
-        
+
         Args:
             settings: Application settings instance
             event_bus: Optional event bus for broadcasting changes
+            config_file: Saved overrides (defaults to data/config/settings.json)
+            save_delay: Seconds to collect further changes before writing
         """
         self.settings = settings
         self.event_bus = event_bus or EventBus()
-        self.config_file = Path("data/config/settings.json")
+        self.config_file = Path(config_file) if config_file else Path("data/config/settings.json")
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        
+        self.save_delay = save_delay
+        self.saves = 0
+        self._overrides: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+
         self._load_config()
         logger.info("ConfigManager initialized")
-    
+
     def _load_config(self) -> None:
         """Load configuration from file if it exists"""
         if self.config_file.exists():
@@ -50,61 +77,110 @@ class ConfigManager:
                     for key, value in saved_config.items():
                         if hasattr(self.settings, key):
                             setattr(self.settings, key, value)
+                            self._overrides[key] = value
                 logger.info("Configuration loaded from file")
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
-    
+
+    def update_settings(self, updates: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate and apply several settings as one transaction
+
+        Either every update is applied or none is. The file write happens
+        later on a background timer, and subscribers get a single
+        config_changed event with the diff.
+
+        Args:
+            updates: New value per setting name
+
+        Returns:
+            Diff of settings whose value changed: {key: {"old_value", "new_value"}}
+
+        Raises:
+            ConfigValidationError: If a setting is unknown or a value is invalid
+        """
+        with self._lock:
+            validated = self._validate(updates)
+            changes = {}
+            for key, value in validated.items():
+                old_value = getattr(self.settings, key)
+                if old_value == value:
+                    continue
+                setattr(self.settings, key, value)
+                self._overrides[key] = value
+                changes[key] = {"old_value": old_value, "new_value": value}
+            if changes:
+                self._schedule_save()
+
+        if changes:
+            self.event_bus.emit('config_changed', {'changes': changes})
+            summary = ", ".join(f"{key} = {change['new_value']}" for key, change in changes.items())
+            logger.info(f"Settings updated: {summary}")
+        return changes
+
     def update_setting(self, key: str, value: Any) -> bool:
         """
         Update a single setting
-        
+
         Args:
             key: Setting name
             value: New value
-            
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Validate setting exists
-            if not hasattr(self.settings, key):
-                logger.error(f"Setting '{key}' not found")
-                return False
-            
-            # Store old value
-            old_value = getattr(self.settings, key)
-            
-            # Update setting
-            setattr(self.settings, key, value)
-            
-            # Save to file
-            self._save_config()
-            
-            # Broadcast change
-            self.event_bus.emit('config_changed', {
-                'key': key,
-                'old_value': old_value,
-                'new_value': value
-            })
-            
-            logger.info(f"Setting updated: {key} = {value}")
+            self.update_settings({key: value})
             return True
-        
-        except Exception as e:
+        except ConfigValidationError as e:
             logger.error(f"Failed to update setting: {e}")
             return False
-    
-    def _save_config(self) -> None:
-        """Save configuration to file"""
+
+    def _validate(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate updates against the settings model, returning coerced values"""
+        errors = {key: "Setting not found" for key in updates if key not in type(self.settings).model_fields}
+        if errors:
+            raise ConfigValidationError(errors)
+        try:
+            candidate = type(self.settings).model_validate({**self.settings.model_dump(), **updates})
+        except ValidationError as e:
+            raise ConfigValidationError({
+                str(error["loc"][0]) if error["loc"] else "settings": error["msg"] for error in e.errors()
+            }) from e
+        return {key: getattr(candidate, key) for key in updates}
+
+    def _schedule_save(self) -> None:
+        """Write after save_delay unless a write is already pending (call with the lock held)"""
+        if self._save_timer is not None:
+            return
+        # Not a daemon: interpreter exit waits for the pending write
+        self._save_timer = threading.Timer(self.save_delay, self.flush)
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes now"""
+        with self._write_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                overrides = dict(self._overrides)
+            self._save_config(overrides)
+
+    def _save_config(self, overrides: Dict[str, Any]) -> None:
+        """Save changed settings to file atomically (temp file, then rename)"""
         try:
-            config_dict = self.settings.model_dump()
-            with open(self.config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            tmp = self.config_file.with_suffix(".tmp")
+            with open(tmp, 'w') as f:
+                json.dump(overrides, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.config_file)
+            self.saves += 1
             logger.debug("Configuration saved")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
-    
+
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as dictionary"""
         return self.settings.model_dump()
-
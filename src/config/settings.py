@@ -29,12 +29,28 @@ class Settings(BaseSettings):
     # General Settings
     environment: str = Field(default="production", description="Environment: development, production")
     log_level: str = Field(default="INFO", description="Log level: DEBUG, INFO, WARNING, ERROR")
+    log_queue_size: int = Field(default=10000, ge=100, le=1000000, description="Maximum log records waiting for the writer thread")
+    log_drop_policy: str = Field(default="drop_newest", description="When the log queue is full: drop_newest, drop_oldest or block")
+    log_batch_size: int = Field(default=256, ge=1, le=10000, description="Maximum log records written to the file at once")
+    log_flush_interval: float = Field(default=0.2, gt=0.0, le=10.0, description="Maximum seconds a log record waits before being written")
+    log_index_enabled: bool = Field(default=True, description="Index log records for full-text search (SQLite FTS5)")
+    log_index_path: str = Field(default="data/db/logs.db", description="SQLite database for the log search index")
+    log_archive_enabled: bool = Field(default=True, description="Compress rotated logs into data/logs/archive (kept for data_retention_days)")
+    tracing_enabled: bool = Field(default=True, description="Record log_performance spans and durations")
+    trace_buffer_size: int = Field(default=2048, ge=64, le=100000, description="Recent trace spans kept in memory")
+    profiler_max_seconds: float = Field(default=60.0, gt=0.0, le=600.0, description="Longest on-demand profile the admin endpoint accepts")
     hostname: str = Field(default="zema", description="System hostname")
     
     # Dashboard Settings
     enable_dashboard: bool = Field(default=True, description="Enable web dashboard")
     dashboard_port: int = Field(default=8000, ge=1024, le=65535, description="Dashboard port")
     dashboard_host: str = Field(default="0.0.0.0", description="Dashboard host")
+    dashboard_status_interval: float = Field(default=2.0, gt=0.0, le=60.0, description="Seconds between status snapshots pushed to dashboards")
+    dashboard_send_timeout: float = Field(default=1.0, gt=0.0, le=30.0, description="Seconds a websocket send may take before the dashboard client is dropped")
+    system_sample_interval: float = Field(default=1.0, ge=0.1, le=60.0, description="Seconds between background system resource samples")
+    system_history_size: int = Field(default=3600, ge=60, le=86400, description="System samples kept in memory for status history")
+    dashboard_telemetry_hz: float = Field(default=10.0, gt=0.0, le=60.0, description="Maximum telemetry batches per second sent to each dashboard websocket")
+    warmup_subsystems: List[str] = Field(default=["llm", "stt", "tts", "camera", "vision"], description="Subsystems loaded in the background after the dashboard starts (others load on first use); \"vision\" also starts the frame scheduler")
     
     # Wake Word Settings
     wakeword_keywords: List[str] = Field(default=["hey zema", "zema"], description="Wake word keywords")
@@ -64,8 +80,14 @@ class Settings(BaseSettings):
     camera_width: int = Field(default=1920, description="Camera width")
     camera_height: int = Field(default=1080, description="Camera height")
     camera_fps: int = Field(default=30, ge=1, le=60, description="Camera FPS")
+    camera_hfov_degrees: float = Field(default=79.5, ge=10.0, le=180.0, description="Horizontal field of view, used when no calibration is available")
     camera_tracking: bool = Field(default=True, description="Enable camera tracking")
     camera_gestures: bool = Field(default=True, description="Enable gesture recognition")
+    gesture_active_fps: float = Field(default=15.0, ge=1.0, le=60.0, description="Gesture detection rate while a hand is visible")
+    gesture_idle_fps: float = Field(default=3.0, ge=0.5, le=30.0, description="Gesture detection rate while no hand is visible")
+    gesture_debounce_frames: int = Field(default=3, ge=1, le=30, description="Consecutive frames a gesture must hold before it is reported")
+    gesture_cooldown_seconds: float = Field(default=1.5, ge=0.0, le=30.0, description="Minimum time before the same gesture is reported again")
+    gesture_roi_margin: float = Field(default=0.25, ge=0.0, le=2.0, description="Margin added around the hand/person box when cropping the ROI")
     
     # LLM Settings
     llm_model: str = Field(
@@ -86,6 +108,18 @@ class Settings(BaseSettings):
     # Vision Settings
     vision_detection_model: str = Field(default="yolov8n", description="Detection model")
     vision_confidence_threshold: float = Field(default=0.5, ge=0.0, le=1.0, description="Confidence threshold")
+    vision_detection_fps: float = Field(default=10.0, ge=0.1, le=60.0, description="Target object detection rate")
+    vision_measurement_fps: float = Field(default=2.0, ge=0.1, le=30.0, description="Target measurement rate")
+    vision_analysis_fps: float = Field(default=0.5, ge=0.01, le=10.0, description="Target scene description refresh rate")
+    measurement_default_distance_mm: float = Field(default=600.0, ge=50.0, le=10000.0, description="Assumed object distance when no reference object is visible")
+    calibration_path: str = Field(default="data/calibration", description="Camera calibration storage path")
+    model3d_workers: int = Field(default=2, ge=1, le=16, description="Worker processes for 3D reconstruction")
+    model3d_max_features: int = Field(default=2000, ge=100, le=20000, description="ORB features per frame for 3D reconstruction")
+    model3d_work_path: str = Field(default="data/exports/model3d", description="Working directory for 3D reconstruction jobs")
+    model3d_job_ttl: float = Field(default=3600.0, ge=0.0, le=604800.0, description="Seconds a finished 3D reconstruction job stays queryable")
+    inference_workers: int = Field(default=2, ge=1, le=16, description="Worker threads in the shared inference executor")
+    vision_description_cache_ttl: float = Field(default=30.0, ge=0.0, le=3600.0, description="Seconds a cached scene description stays valid")
+    vision_description_grid: int = Field(default=3, ge=1, le=8, description="Grid cells per axis used to bucket object positions for the description cache")
     
     # Feature Flags
     feature_voice: bool = Field(default=True, description="Enable voice features")
@@ -142,6 +176,15 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {valid_levels}")
         return v.upper()
     
+    @field_validator('log_drop_policy')
+    @classmethod
+    def validate_log_drop_policy(cls, v: str) -> str:
+        """Validate log queue overload policy"""
+        valid_policies = ['drop_newest', 'drop_oldest', 'block']
+        if v.lower() not in valid_policies:
+            raise ValueError(f"log_drop_policy must be one of {valid_policies}")
+        return v.lower()
+    
     @field_validator('stt_model')
     @classmethod
     def validate_stt_model(cls, v: str) -> str:
@@ -0,0 +1,164 @@
+"""
+Coalescing Channels
+Latest-value, rate-limited delivery for high-frequency telemetry
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingChannel:
+    """
+    Coalescing channel
+
+    Keeps only the latest value per key and hands pending values to the
+    consumer at most ``max_rate_hz`` times per second. With ``batch=True``
+    the consumer gets one list of the pending values per tick instead of
+    one call per key. Producers never block: ``put`` is O(1) and thread-safe.
+
+    Values put before ``start()`` are kept and flushed once running.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Any], Any],
+        max_rate_hz: float,
+        batch: bool = False,
+        name: Optional[str] = None
+    ):
+        """
+        Initialize coalescing channel
+
+        Args:
+            deliver: Sync or async consumer callback
+            max_rate_hz: Maximum deliveries (ticks) per second
+            batch: Deliver all pending values as one list per tick
+            name: Optional name for logging
+        """
+        if max_rate_hz <= 0:
+            raise ValueError("max_rate_hz must be positive")
+        self.deliver = deliver
+        self.is_async = inspect.iscoroutinefunction(deliver)
+        self.interval = 1.0 / max_rate_hz
+        self.batch = batch
+        self.name = name or getattr(deliver, "__qualname__", "channel")
+        self.received = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.errors = 0
+        self._pending: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of keys waiting for the next tick"""
+        return len(self._pending)
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Store the latest value for a key
+
+        Args:
+            key: Coalescing key (e.g. topic or object label)
+            value: Latest value
+
+        Returns:
+            True if an undelivered value for the key was replaced
+        """
+        with self._lock:
+            replaced = key in self._pending
+            if replaced:
+                self.coalesced += 1
+            self._pending[key] = value
+            self.received += 1
+        if self._loop is not None:
+            if threading.get_ident() == self._loop_thread:
+                self._wake.set()
+            else:
+                try:
+                    self._loop.call_soon_threadsafe(self._wake.set)
+                except RuntimeError:
+                    pass  # Loop closed during shutdown
+        return replaced
+
+    def start(self) -> None:
+        """Start delivering on the running event loop"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wake = asyncio.Event()
+        if self._pending:
+            self._wake.set()
+        self._task = self._loop.create_task(self._run(), name=f"channel-{self.name}")
+
+    def stop(self) -> None:
+        """Stop delivering; pending values are discarded"""
+        task, self._task = self._task, None
+        if task is not None:
+            if threading.get_ident() == self._loop_thread:
+                task.cancel()
+            else:
+                self._loop.call_soon_threadsafe(task.cancel)
+        self._loop = None
+        with self._lock:
+            self._pending = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get channel statistics
+
+        Returns:
+            Dictionary with received, coalesced and delivered counts
+        """
+        return {
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "pending": self.depth,
+        }
+
+    async def _run(self) -> None:
+        """Flush pending values at most once per interval"""
+        last_flush = 0.0
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            wait = last_flush + self.interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                continue
+            last_flush = time.monotonic()
+            if self.batch:
+                await self._call(list(pending.values()))
+            else:
+                for value in pending.values():
+                    await self._call(value)
+
+    async def _call(self, payload: Any) -> None:
+        """Invoke the consumer, isolating its errors"""
+        try:
+            if self.is_async:
+                await self.deliver(payload)
+            else:
+                self.deliver(payload)
+            self.delivered += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Error delivering coalesced values on {self.name}: {e}")
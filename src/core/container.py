@@ -0,0 +1,259 @@
+"""
+Application Container
+Application-scoped services shared by the API and background tasks
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional
+from src.config.settings import Settings
+from src.config.config_manager import ConfigManager
+from src.core.event_bus import EventBus
+from src.core.inference import InferenceExecutor, get_inference_executor
+from src.core.reconfigure import Reconfigurator, Reloadable
+from src.core.warmup import Warmup
+from src.utils.metrics import registry, scene_cache_collector
+from src.utils.performance import PerformanceMonitor, get_performance_monitor
+from src.utils.tracing import span_store
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """
+    Application-scoped dependency container
+
+    Created once at server startup and stored on ``app.state``. Holds the
+    single settings object, event bus and config manager plus the shared
+    components, so routes resolve them with an attribute lookup instead of
+    constructing them per request. Config changes made through the manager
+    are published on this bus and routed by a ``Reconfigurator`` to the
+    components that declared a dependency on them.
+    """
+
+    def __init__(self, settings: Settings, event_bus: Optional[EventBus] = None,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Initialize container
+
+        Args:
+            settings: Application settings (the process-wide instance)
+            event_bus: Event bus (created if not given)
+            config_manager: Config manager (created on this bus if not given)
+        """
+        self.settings = settings
+        self.event_bus = event_bus or EventBus()
+        self.config_manager = config_manager or ConfigManager(settings, self.event_bus)
+        self.performance_monitor: PerformanceMonitor = get_performance_monitor()
+        self.inference_executor: InferenceExecutor = get_inference_executor()
+        self.reconfigurator = Reconfigurator(settings)
+        self.reconfigurator.register_callback("logging", ("log_level",), self._apply_log_level)
+        self.reconfigurator.register_callback("tracing", ("tracing_enabled", "trace_buffer_size"), self._apply_tracing)
+        self.warmup = Warmup()
+        self._llm_client = None
+        self._speech_to_text: Optional[Reloadable] = None
+        self._text_to_speech: Optional[Reloadable] = None
+        self._camera: Optional[Reloadable] = None
+        self._audio_io = None
+        self._wake_word: Optional[Reloadable] = None
+        self._scene_analyzer = None
+        self._vision_scheduler = None
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def llm_client(self):
+        """Shared LLMClient (created on first use)"""
+        if self._llm_client is None:
+            with self._lock:
+                if self._llm_client is None:
+                    from src.ai.llm_client import LLMClient
+                    self._llm_client = LLMClient(self.settings)
+                    self.reconfigurator.register("llm", self._llm_client)
+        return self._llm_client
+
+    @property
+    def speech_to_text(self) -> Reloadable:
+        """Shared SpeechToText, reloaded in the background when its model changes"""
+        if self._speech_to_text is None:
+            with self._lock:
+                if self._speech_to_text is None:
+                    from src.voice.stt import SpeechToText
+                    self._speech_to_text = Reloadable("stt", SpeechToText, self.settings)
+                    self.reconfigurator.register("stt", self._speech_to_text)
+        return self._speech_to_text
+
+    @property
+    def text_to_speech(self) -> Reloadable:
+        """Shared TextToSpeech, reloaded in the background when its voice changes"""
+        if self._text_to_speech is None:
+            with self._lock:
+                if self._text_to_speech is None:
+                    from src.voice.tts import TextToSpeech
+                    self._text_to_speech = Reloadable("tts", TextToSpeech, self.settings)
+                    self.reconfigurator.register("tts", self._text_to_speech)
+        return self._text_to_speech
+
+    @property
+    def camera(self) -> Reloadable:
+        """Shared Camera; frame rate changes apply in place, device or resolution changes reopen it"""
+        if self._camera is None:
+            with self._lock:
+                if self._camera is None:
+                    from src.vision.camera import Camera
+                    self._camera = Reloadable("camera", Camera, self.settings)
+                    self.reconfigurator.register("camera", self._camera)
+        return self._camera
+
+    @property
+    def audio_io(self):
+        """Shared AudioIO"""
+        if self._audio_io is None:
+            with self._lock:
+                if self._audio_io is None:
+                    from src.voice.audio_io import AudioIO
+                    self._audio_io = AudioIO(self.settings)
+        return self._audio_io
+
+    @property
+    def wake_word(self) -> Reloadable:
+        """Shared WakeWordDetector, rebuilt in the background when keywords or sensitivity change"""
+        if self._wake_word is None:
+            audio_io = self.audio_io
+            with self._lock:
+                if self._wake_word is None:
+                    from src.voice.wakeword import WakeWordDetector
+                    self._wake_word = Reloadable(
+                        "wakeword", lambda settings: WakeWordDetector(settings, audio_io), self.settings
+                    )
+                    self.reconfigurator.register("wakeword", self._wake_word)
+        return self._wake_word
+
+    @property
+    def scene_analyzer(self):
+        """Shared SceneAnalyzer; its description cache is exported on /metrics"""
+        if self._scene_analyzer is None:
+            with self._lock:
+                if self._scene_analyzer is None:
+                    from src.vision.analyzer import SceneAnalyzer
+                    self._scene_analyzer = SceneAnalyzer(self.settings, self.event_bus)
+                    collector = scene_cache_collector(self._scene_analyzer)
+                    registry.register_collector(collector)
+                    self._collectors.append(collector)
+        return self._scene_analyzer
+
+    @property
+    def vision_scheduler(self):
+        """Shared VisionScheduler reading the shared camera (started by start_vision)"""
+        if self._vision_scheduler is None:
+            camera = self.camera
+            with self._lock:
+                if self._vision_scheduler is None:
+                    from src.vision.scheduler import VisionScheduler
+                    self._vision_scheduler = VisionScheduler(self.settings, camera, self.inference_executor)
+        return self._vision_scheduler
+
+    @property
+    def vision_running(self) -> bool:
+        """True while the vision scheduler is dispatching camera frames"""
+        return self._vision_scheduler is not None and self._vision_scheduler.running
+
+    async def start_vision(self) -> bool:
+        """
+        Open the camera, attach the vision pipeline and start dispatching frames
+
+        Model imports and loading run in a worker thread.
+
+        Returns:
+            False if the camera is not available (the pipeline is not started)
+        """
+        scheduler = await asyncio.to_thread(lambda: self.vision_scheduler)
+        if scheduler.running:
+            return True
+
+        def open_camera() -> bool:
+            with self.camera.use() as camera:
+                return camera.cap is not None or camera.open()
+
+        if not await asyncio.to_thread(open_camera):
+            logger.warning("Camera not available - vision pipeline not started")
+            return False
+        if not scheduler.consumers:
+            pipeline = await asyncio.to_thread(self._build_vision_pipeline)
+            scheduler.attach_pipeline(**pipeline)
+        await scheduler.start()
+        return True
+
+    def _build_vision_pipeline(self) -> Dict[str, Any]:
+        """Create the detector, gesture, measurement and scene components (worker thread)"""
+        from src.vision.detector import Detector
+        from src.vision.gestures import GestureDetector
+        from src.vision.measurement import Measurement
+        return {
+            "detector": Detector(self.settings, self.inference_executor),
+            "gesture_detector": GestureDetector(self.settings, self.event_bus, self.inference_executor),
+            "measurement": Measurement(self.settings, self.inference_executor),
+            "analyzer": self.scene_analyzer,
+            "llm_client": self.llm_client,
+        }
+
+    def add_warmup_steps(self) -> None:
+        """Queue background loading of the subsystems named in warmup_subsystems"""
+        steps = {
+            "llm": self._warm_llm,
+            "stt": lambda: self.speech_to_text.current,
+            "tts": lambda: self.text_to_speech.current,
+            "camera": self._warm_camera,
+            "wakeword": lambda: self.wake_word.current,
+            "vision": self.start_vision,
+        }
+        for name in self.settings.warmup_subsystems:
+            if name in steps:
+                self.warmup.add(name, steps[name])
+            else:
+                logger.warning(f"Unknown warm-up subsystem: {name}")
+
+    async def _warm_llm(self) -> bool:
+        """Import the client off the loop, then load the model in Ollama"""
+        client = await asyncio.to_thread(lambda: self.llm_client)
+        return await client.warm_up()
+
+    def _warm_camera(self) -> bool:
+        """Open the shared camera and read one frame (it stays open)"""
+        with self.camera.use() as camera:
+            return camera.open() and camera.capture_frame() is not None
+
+    async def start(self) -> None:
+        """Start the event bus and apply config changes as they are published"""
+        if self._started:
+            return
+        await self.event_bus.start()
+        self.reconfigurator.attach(self.event_bus)
+        self._started = True
+        logger.info("Application container started")
+
+    async def stop(self) -> None:
+        """Stop the vision pipeline, write pending config changes and stop the event bus"""
+        if not self._started:
+            return
+        self.config_manager.flush()
+        if self._vision_scheduler is not None:
+            await self._vision_scheduler.stop()
+        await self.reconfigurator.wait_idle()
+        for collector in self._collectors:
+            registry.unregister_collector(collector)
+        self._collectors.clear()
+        await self.event_bus.stop()
+        self._started = False
+        logger.info("Application container stopped")
+
+    def _apply_log_level(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """Set the root logger level"""
+        level = str(changes["log_level"]["new_value"]).upper()
+        logging.getLogger().setLevel(getattr(logging, level, logging.INFO))
+
+    def _apply_tracing(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """Resize or toggle the span store"""
+        span_store.configure(self.settings.tracing_enabled, self.settings.trace_buffer_size)
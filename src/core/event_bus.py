@@ -3,74 +3,519 @@ Event Bus
 Pub/sub system for component communication
 """
 
+import asyncio
+import heapq
+import inspect
+import itertools
 import logging
-from typing import Dict, List, Callable, Any, Optional
+import re
+import threading
+import time
+from typing import Dict, List, Callable, Any, Hashable, Optional, Pattern, Tuple
 from collections import defaultdict
+from src.core.channels import CoalescingChannel
 
 logger = logging.getLogger(__name__)
 
+# Queue overflow policies
+DROP_OLDEST = "drop_oldest"    # Evict the lowest-priority, oldest pending event
+DROP_NEWEST = "drop_newest"    # Reject the incoming event
+COALESCE = "coalesce"          # Replace a pending event of the same type, else drop oldest
+
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+DEFAULT_QUEUE_SIZE = 100
+
+# Topic wildcards: '*' matches exactly one dot-separated segment,
+# '**' matches any number of segments (including none)
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "**"
+
+
+def is_pattern(event_type: str) -> bool:
+    """Check whether a subscription topic contains wildcards"""
+    return SINGLE_WILDCARD in event_type
+
+
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compile a hierarchical topic pattern to a regex
+
+    Args:
+        pattern: Topic pattern such as 'voice.*' or 'vision.**'
+
+    Returns:
+        Compiled regex matching full topic names
+    """
+    segments = pattern.split(".")
+    if segments == [MULTI_WILDCARD]:
+        return re.compile(r"^[^.]+(?:\.[^.]+)*$")
+
+    regex = ""
+    need_separator = False
+    for segment in segments:
+        if segment == MULTI_WILDCARD:
+            # Zero or more whole segments, absorbing the adjacent dot
+            regex += r"(?:\.[^.]+)*" if need_separator else r"(?:[^.]+\.)*"
+            continue
+        piece = r"[^.]+" if segment == SINGLE_WILDCARD else re.escape(segment)
+        regex += (r"\." if need_separator else "") + piece
+        need_separator = True
+    return re.compile(f"^{regex}$")
+
+
+class Event:
+    """Single emitted event"""
+
+    __slots__ = ("event_type", "data", "priority", "emitted_at")
+
+    def __init__(self, event_type: str, data: Any, priority: int):
+        self.event_type = event_type
+        self.data = data
+        self.priority = priority
+        self.emitted_at = time.perf_counter()
+
+
+class Subscription:
+    """
+    A subscriber and its bounded, priority-ordered delivery queue
+
+    Also serves as the handle returned by ``EventBus.subscribe``;
+    ``unsubscribe()`` removes it in O(1). Queue operations only ever run on
+    the bus's event loop thread.
+
+    Rate-limited subscriptions bypass the queue and feed a
+    ``CoalescingChannel`` that keeps only the latest event per key.
+    """
+
+    _ids = itertools.count()
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        event_type: str,
+        callback: Callable[[Any], Any],
+        max_queue: int,
+        policy: str,
+        blocking: bool,
+        max_rate_hz: Optional[float] = None,
+        batch: bool = False,
+        key: Optional[Callable[[str, Any], Hashable]] = None
+    ):
+        self.id = next(self._ids)
+        self.bus = bus
+        self.event_type = event_type
+        self.matcher: Optional[Pattern] = compile_pattern(event_type) if is_pattern(event_type) else None
+        self.callback = callback
+        self.is_async = inspect.iscoroutinefunction(callback)
+        self.max_queue = max_queue
+        self.policy = policy
+        self.blocking = blocking
+        self.name = getattr(callback, "__qualname__", repr(callback))
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.task: Optional[asyncio.Task] = None
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._ready: Optional[asyncio.Event] = None
+        self.batch = batch
+        self.key = key
+        self.channel: Optional[CoalescingChannel] = None
+        if max_rate_hz:
+            self.channel = CoalescingChannel(self._call_blocking if blocking and not self.is_async else callback,
+                                             max_rate_hz, batch=batch, name=self.name)
+
+    @property
+    def depth(self) -> int:
+        """Number of pending events"""
+        if self.channel is not None:
+            return self.channel.depth
+        return len(self._heap)
+
+    def matches(self, event_type: str) -> bool:
+        """Check whether this subscription receives an event type"""
+        if self.matcher is None:
+            return event_type == self.event_type
+        return self.matcher.match(event_type) is not None
+
+    def unsubscribe(self) -> None:
+        """Remove this subscription from its bus"""
+        self.bus.remove(self)
+
+    def offer(self, event: Event) -> Optional[Event]:
+        """
+        Enqueue an event, applying the overflow policy
+
+        Returns:
+            The event that was dropped, if any
+        """
+        if self.channel is not None:
+            key = self.key(event.event_type, event.data) if self.key else event.event_type
+            value = {"event_type": event.event_type, "data": event.data} if self.batch else event.data
+            return event if self.channel.put(key, value) else None
+
+        if self.policy == COALESCE:
+            for index, (_, _, pending) in enumerate(self._heap):
+                if pending.event_type == event.event_type:
+                    priority = max(pending.priority, event.priority)
+                    event.priority = priority
+                    self._heap[index] = (-priority, self._heap[index][1], event)
+                    heapq.heapify(self._heap)
+                    return pending
+
+        dropped = None
+        if len(self._heap) >= self.max_queue:
+            if self.policy == DROP_NEWEST:
+                return event
+            # Worst entry: lowest priority, then oldest
+            worst = max(range(len(self._heap)), key=lambda i: (self._heap[i][0], -self._heap[i][1]))
+            if -self._heap[worst][0] > event.priority:
+                return event
+            dropped = self._heap[worst][2]
+            self._heap[worst] = self._heap[-1]
+            self._heap.pop()
+            heapq.heapify(self._heap)
+
+        heapq.heappush(self._heap, (-event.priority, next(self._seq), event))
+        if self._ready is not None:
+            self._ready.set()
+        return dropped
+
+    async def get(self) -> Event:
+        """Wait for and pop the highest-priority pending event"""
+        while not self._heap:
+            self._ready.clear()
+            await self._ready.wait()
+        return heapq.heappop(self._heap)[2]
+
+    async def _call_blocking(self, payload: Any) -> None:
+        """Run a blocking callback in a worker thread"""
+        await asyncio.to_thread(self.callback, payload)
+
 
 class EventBus:
     """
     Event bus for component communication
-    
-    Allows components to publish events and subscribe to events
+
+    Allows components to publish events and subscribe to events.
+
+    Topics are hierarchical and dot-separated (``vision.detection.person``).
+    Subscriptions may use ``*`` for one segment or ``**`` for any number of
+    segments (``voice.*``, ``vision.**``). Matching subscribers per topic are
+    resolved once into a dispatch table that is only invalidated when
+    subscriptions change, so emit never pattern-matches on the hot path.
+
+    Until ``start()`` is awaited the bus delivers synchronously in the
+    emitter's thread. Once started, every subscriber gets its own bounded
+    priority queue drained by a task on the bus's event loop, so a slow
+    subscriber only delays itself. ``emit`` is then safe to call from any
+    thread (e.g. the audio callback) and never blocks.
+
+    High-frequency telemetry subscribers pass ``max_rate_hz`` to receive only
+    the latest event per key at most that often, optionally batched as one
+    list per tick.
     """
-    
-    def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+
+    def __init__(self, default_queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize event bus
+
+        Args:
+            default_queue_size: Queue bound for subscribers that don't set one
+        """
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._dispatch: Dict[str, Tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()
+        self.default_queue_size = default_queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._metrics: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"emitted": 0, "delivered": 0, "dropped": 0, "latency_sum_ms": 0.0, "latency_max_ms": 0.0}
+        )
         logger.info("EventBus initialized")
-    
-    def subscribe(self, event_type: str, callback: Callable[[Any], None]):
+
+    @property
+    def running(self) -> bool:
+        """True when asynchronous delivery is active"""
+        return self._loop is not None
+
+    @property
+    def subscribers(self) -> Dict[str, List[Subscription]]:
+        """Current subscriptions grouped by subscribed topic or pattern"""
+        grouped: Dict[str, List[Subscription]] = defaultdict(list)
+        for subscription in list(self._subscriptions.values()):
+            grouped[subscription.event_type].append(subscription)
+        return grouped
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable[[Any], Any],
+        max_queue: Optional[int] = None,
+        policy: str = DROP_OLDEST,
+        blocking: bool = False,
+        max_rate_hz: Optional[float] = None,
+        batch: bool = False,
+        key: Optional[Callable[[str, Any], Hashable]] = None
+    ) -> Subscription:
         """
         Subscribe to an event type
-        
+
         Args:
-            event_type: Event type name (e.g., 'config_changed')
-            callback: Callback function to call when event occurs
+            event_type: Event type name or pattern (e.g., 'config_changed', 'voice.*')
+            callback: Callback function or coroutine function to call when event occurs
+            max_queue: Maximum pending events for this subscriber
+            policy: Overflow policy (drop_oldest, drop_newest, coalesce)
+            blocking: Run a sync callback in a worker thread instead of on the loop
+            max_rate_hz: Coalesce to the latest event per key, delivered at most this often
+            batch: With max_rate_hz, deliver one list of {event_type, data} dicts per tick
+            key: With max_rate_hz, coalescing key from (event_type, data); defaults to event type
+
+        Returns:
+            Subscription handle
         """
-        self.subscribers[event_type].append(callback)
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"policy must be one of {OVERFLOW_POLICIES}")
+        subscription = Subscription(
+            self, event_type, callback, max_queue or self.default_queue_size, policy, blocking,
+            max_rate_hz=max_rate_hz, batch=batch, key=key
+        )
+        with self._lock:
+            self._subscriptions[subscription.id] = subscription
+            self._dispatch = {}
+        if self._loop is not None:
+            self._call_in_loop(self._start_worker, subscription)
         logger.debug(f"Subscribed to event: {event_type}")
-    
-    def unsubscribe(self, event_type: str, callback: Callable[[Any], None]):
+        return subscription
+
+    def unsubscribe(self, event_type: str, callback: Callable[[Any], Any]):
         """
         Unsubscribe from an event type
-        
+
         Args:
             event_type: Event type name
             callback: Callback function to remove
         """
-        if callback in self.subscribers[event_type]:
-            self.subscribers[event_type].remove(callback)
-            logger.debug(f"Unsubscribed from event: {event_type}")
-    
-    def emit(self, event_type: str, data: Any = None):
+        for subscription in list(self._subscriptions.values()):
+            if subscription.event_type == event_type and subscription.callback == callback:
+                self.remove(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription by handle in O(1)
+
+        Args:
+            subscription: Handle returned by subscribe()
+        """
+        with self._lock:
+            if self._subscriptions.pop(subscription.id, None) is None:
+                return
+            self._dispatch = {}
+        self._stop_worker(subscription)
+        logger.debug(f"Unsubscribed from event: {subscription.event_type}")
+
+    def subscribers_for(self, event_type: str) -> Tuple[Subscription, ...]:
+        """
+        Resolve the subscriptions receiving an event type
+
+        Served from the dispatch table; computed on first use per topic.
+
+        Args:
+            event_type: Concrete event type name
+
+        Returns:
+            Matching subscriptions in subscription order
+        """
+        targets = self._dispatch.get(event_type)
+        if targets is None:
+            with self._lock:
+                targets = tuple(s for s in self._subscriptions.values() if s.matches(event_type))
+                self._dispatch[event_type] = targets
+        return targets
+
+    def emit(self, event_type: str, data: Any = None, priority: int = 0):
         """
         Emit an event to all subscribers
-        
+
+        Thread-safe; never blocks once the bus is started.
+
         Args:
             event_type: Event type name
             data: Event data to pass to subscribers
+            priority: Higher priority events are delivered first
         """
-        if event_type in self.subscribers:
-            for callback in self.subscribers[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error in event callback for {event_type}: {e}")
-        
+        event = Event(event_type, data, priority)
+        if self._loop is None:
+            self._deliver_sync(event)
+        elif threading.get_ident() == self._loop_thread:
+            self._enqueue(event)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._enqueue, event)
+            except RuntimeError:
+                # Loop already closed during shutdown
+                return
+
         logger.debug(f"Emitted event: {event_type}")
-    
+
+    async def start(self) -> None:
+        """Switch to asynchronous delivery on the running event loop"""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        for subscription in list(self._subscriptions.values()):
+            self._start_worker(subscription)
+        logger.info("EventBus started (async delivery)")
+
+    async def stop(self, drain_timeout: float = 1.0) -> None:
+        """
+        Stop asynchronous delivery
+
+        Args:
+            drain_timeout: Seconds to wait for pending events to be delivered
+        """
+        if self._loop is None:
+            return
+        deadline = time.monotonic() + drain_timeout
+        while time.monotonic() < deadline and any(s.depth for s in list(self._subscriptions.values())):
+            await asyncio.sleep(0.01)
+        for subscription in list(self._subscriptions.values()):
+            self._stop_worker(subscription)
+        self._loop = None
+        self._loop_thread = None
+        logger.info("EventBus stopped")
+
     def clear_subscribers(self, event_type: Optional[str] = None):
         """
         Clear subscribers for an event type or all events
-        
+
         Args:
-            event_type: Event type to clear, or None for all events
+            event_type: Subscribed topic or pattern to clear, or None for all events
         """
-        if event_type:
-            self.subscribers[event_type].clear()
-        else:
-            self.subscribers.clear()
+        for subscription in list(self._subscriptions.values()):
+            if event_type is None or subscription.event_type == event_type:
+                self.remove(subscription)
         logger.debug(f"Cleared subscribers for: {event_type or 'all events'}")
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get delivery metrics
+
+        Returns:
+            Per-topic counters and latencies, and per-subscriber queue depth
+        """
+        topics = {}
+        for event_type, stats in self._metrics.items():
+            delivered = stats["delivered"]
+            topics[event_type] = {
+                **stats,
+                "latency_avg_ms": stats["latency_sum_ms"] / delivered if delivered else 0.0,
+            }
+        subscribers = [
+            {
+                "event_type": subscription.event_type,
+                "subscriber": subscription.name,
+                "queue_depth": subscription.depth,
+                "max_queue": subscription.max_queue,
+                "policy": "coalesce_rate" if subscription.channel else subscription.policy,
+                "delivered": subscription.channel.delivered if subscription.channel else subscription.delivered,
+                "dropped": subscription.dropped,
+                "errors": subscription.errors,
+            }
+            for subscription in list(self._subscriptions.values())
+        ]
+        return {"running": self.running, "topics": topics, "subscribers": subscribers}
+
+    def _deliver_sync(self, event: Event) -> None:
+        """Legacy delivery in the emitter's thread (bus not started)"""
+        self._metrics[event.event_type]["emitted"] += 1
+        for subscription in self.subscribers_for(event.event_type):
+            if subscription.channel is not None:
+                # Buffered in the channel until the bus is started
+                if subscription.offer(event) is not None:
+                    subscription.dropped += 1
+                    self._metrics[event.event_type]["dropped"] += 1
+                continue
+            try:
+                if subscription.is_async:
+                    try:
+                        asyncio.get_running_loop().create_task(subscription.callback(event.data))
+                    except RuntimeError:
+                        logger.warning(f"Dropped {event.event_type} for async subscriber: no running event loop")
+                        subscription.dropped += 1
+                        continue
+                else:
+                    subscription.callback(event.data)
+                subscription.delivered += 1
+                self._record_delivery(event)
+            except Exception as e:
+                subscription.errors += 1
+                logger.error(f"Error in event callback for {event.event_type}: {e}")
+
+    def _enqueue(self, event: Event) -> None:
+        """Fan an event out to subscriber queues (loop thread)"""
+        stats = self._metrics[event.event_type]
+        stats["emitted"] += 1
+        for subscription in self.subscribers_for(event.event_type):
+            dropped = subscription.offer(event)
+            if dropped is not None:
+                subscription.dropped += 1
+                self._metrics[dropped.event_type]["dropped"] += 1
+
+    def _record_delivery(self, event: Event) -> None:
+        """Update per-topic latency statistics"""
+        latency_ms = (time.perf_counter() - event.emitted_at) * 1000
+        stats = self._metrics[event.event_type]
+        stats["delivered"] += 1
+        stats["latency_sum_ms"] += latency_ms
+        if latency_ms > stats["latency_max_ms"]:
+            stats["latency_max_ms"] = latency_ms
+
+    def _call_in_loop(self, func: Callable, *args: Any) -> None:
+        """Run a function on the bus loop thread"""
+        if threading.get_ident() == self._loop_thread:
+            func(*args)
+        else:
+            self._loop.call_soon_threadsafe(func, *args)
+
+    def _start_worker(self, subscription: Subscription) -> None:
+        """Create the delivery task for a subscription (loop thread)"""
+        if subscription.channel is not None:
+            if self._loop is not None:
+                subscription.channel.start()
+            return
+        if subscription.task is None and self._loop is not None:
+            subscription._ready = asyncio.Event()
+            if subscription.depth:
+                subscription._ready.set()
+            subscription.task = self._loop.create_task(self._worker(subscription))
+
+    def _stop_worker(self, subscription: Subscription) -> None:
+        """Cancel the delivery task for a subscription"""
+        if subscription.channel is not None:
+            subscription.channel.stop()
+            return
+        task, subscription.task = subscription.task, None
+        if task is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(task.cancel)
+
+    async def _worker(self, subscription: Subscription) -> None:
+        """Deliver queued events to one subscriber"""
+        while True:
+            event = await subscription.get()
+            try:
+                if subscription.is_async:
+                    await subscription.callback(event.data)
+                elif subscription.blocking:
+                    await asyncio.to_thread(subscription.callback, event.data)
+                else:
+                    subscription.callback(event.data)
+                subscription.delivered += 1
+                self._record_delivery(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                subscription.errors += 1
+                logger.error(f"Error in event callback for {event.event_type}: {e}")
@@ -0,0 +1,128 @@
+"""
+Inference Executor
+Shared worker pool for CPU-bound model inference
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceExecutor:
+    """
+    Shared thread pool for model inference
+
+    Vision and voice models release the GIL inside their native code, so a
+    small thread pool keeps them off the event loop without oversubscribing
+    the CPU. Queue depth and latency counters are kept for monitoring.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize inference executor
+
+        Args:
+            max_workers: Number of worker threads
+        """
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+        logger.info(f"InferenceExecutor initialized with {max_workers} workers")
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking function on the pool and await its result
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        with self._lock:
+            self._queued += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._tracked, func, args)
+
+    def _tracked(self, func: Callable[..., Any], args: tuple) -> Any:
+        """Run a job while maintaining queue and latency counters"""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._busy_seconds += elapsed
+        return result
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queued
+
+    @property
+    def saturated(self) -> bool:
+        """True when every worker is busy and jobs are waiting"""
+        return self._running >= self.max_workers and self._queued > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with worker count, queue depth and job counters
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "busy_seconds": self._busy_seconds,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and release the worker threads"""
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+        logger.info("InferenceExecutor shut down")
+
+
+_executor: Optional[InferenceExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """
+    Get the process-wide inference executor
+
+    Returns:
+        Shared InferenceExecutor instance (created on first use)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from src.config.settings import settings
+                _executor = InferenceExecutor(settings.inference_workers)
+    return _executor
@@ -0,0 +1,303 @@
+"""
+Live Reconfiguration
+Applies config changes to running components without a restart
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from src.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Components declare their settings with two class attributes:
+#   LIVE_SETTINGS   = {"setting": "attribute_or_method"}  cheap, applied in place
+#   RELOAD_SETTINGS = ("setting", ...)                    expensive, rebuilt in the background
+
+
+def live_settings(component: Any) -> Dict[str, str]:
+    """Settings a component applies in place"""
+    return dict(getattr(component, "LIVE_SETTINGS", {}))
+
+
+def reload_settings(component: Any) -> tuple:
+    """Settings that require rebuilding a component"""
+    return tuple(getattr(component, "RELOAD_SETTINGS", ()))
+
+
+def apply_live(component: Any, changes: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Apply cheap setting changes to a component in place
+
+    Args:
+        component: Instance declaring LIVE_SETTINGS
+        changes: config_changed diff
+
+    Returns:
+        Settings that were applied
+    """
+    applied = []
+    for key, target in live_settings(component).items():
+        if key not in changes:
+            continue
+        value = changes[key]["new_value"]
+        member = getattr(component, target, None)
+        if callable(member):
+            member(value)
+        else:
+            setattr(component, target, value)
+        applied.append(key)
+    return applied
+
+
+def _close(instance: Any) -> None:
+    """Release a retired instance's resources if it has a close/cleanup method"""
+    for name in ("close", "cleanup"):
+        method = getattr(instance, name, None)
+        if callable(method):
+            try:
+                method()
+            except Exception as e:
+                logger.warning(f"Error closing {type(instance).__name__}: {e}")
+            return
+
+
+class _Slot:
+    """One generation of a reloadable component plus its in-flight users"""
+
+    __slots__ = ("instance", "users", "retired")
+
+    def __init__(self, instance: Any):
+        self.instance = instance
+        self.users = 0
+        self.retired = False
+
+
+class Reloadable:
+    """
+    Double-buffered holder for a component that is expensive to rebuild
+
+    Callers wrap each unit of work (a voice turn, a transcription) in
+    ``with holder.use() as component:``. A reload builds the replacement in
+    a worker thread while the current instance keeps serving, then swaps
+    the reference in one step. Work already in flight finishes on the
+    instance it started with, which is closed when its last user leaves,
+    so no turn is dropped or switched mid-way.
+    """
+
+    def __init__(self, name: str, factory: Callable[[Settings], Any], settings: Settings):
+        """
+        Initialize reloadable component
+
+        Args:
+            name: Component name (for logs and stats)
+            factory: Builds a ready instance from settings (may block)
+            settings: Application settings
+        """
+        self.name = name
+        self.factory = factory
+        self.settings = settings
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._slot = _Slot(factory(settings))
+
+    @property
+    def current(self) -> Any:
+        """Current instance (for quick reads; use ``use()`` around work)"""
+        return self._slot.instance
+
+    @contextmanager
+    def use(self) -> Iterator[Any]:
+        """Borrow the current instance for one unit of work"""
+        with self._lock:
+            slot = self._slot
+            slot.users += 1
+        try:
+            yield slot.instance
+        finally:
+            with self._lock:
+                slot.users -= 1
+                close = slot.retired and slot.users == 0
+            if close:
+                _close(slot.instance)
+
+    @property
+    def in_flight(self) -> int:
+        """Users of the current instance"""
+        return self._slot.users
+
+    async def reload(self) -> None:
+        """Build a new instance off the event loop, then swap it in"""
+        instance = await asyncio.to_thread(self.factory, self.settings)
+        self.swap(instance)
+
+    def swap(self, instance: Any) -> None:
+        """
+        Make an instance current; the previous one closes after its last user
+
+        Args:
+            instance: Ready replacement
+        """
+        with self._lock:
+            old = self._slot
+            self._slot = _Slot(instance)
+            old.retired = True
+            close = old.users == 0
+            self.generation += 1
+        if close:
+            _close(old.instance)
+        logger.info(f"{self.name} reloaded (generation {self.generation})")
+
+
+class _Binding:
+    """A registered component and the settings it follows"""
+
+    def __init__(self, name: str, live: Iterable[str], reload: Iterable[str],
+                 apply: Optional[Callable[[Dict[str, Dict[str, Any]]], Any]] = None,
+                 reloadable: Optional[Reloadable] = None):
+        self.name = name
+        self.live = frozenset(live)
+        self.reload = frozenset(reload)
+        self.apply = apply
+        self.reloadable = reloadable
+        self.applied = 0
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_ms: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.pending = False
+
+
+class Reconfigurator:
+    """
+    Routes config_changed events to the components that depend on them
+
+    Cheap settings are applied in place inside the event callback.
+    Expensive settings trigger a background rebuild of the component's
+    ``Reloadable``; changes that arrive during a rebuild are coalesced into
+    one more rebuild, which reads the latest settings.
+    """
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize reconfigurator
+
+        Args:
+            settings: Application settings (already updated when events arrive)
+        """
+        self.settings = settings
+        self._bindings: Dict[str, _Binding] = {}
+
+    def attach(self, event_bus: Any) -> None:
+        """
+        Subscribe to config changes
+
+        Args:
+            event_bus: Application EventBus
+        """
+        event_bus.subscribe("config_changed", self.on_config_changed)
+
+    def register(self, name: str, component: Any) -> None:
+        """
+        Register a component by its LIVE_SETTINGS / RELOAD_SETTINGS declarations
+
+        Args:
+            name: Component name
+            component: Instance, or a Reloadable wrapping one
+        """
+        if isinstance(component, Reloadable):
+            instance = component.current
+            self._bindings[name] = _Binding(
+                name, live_settings(instance), reload_settings(instance),
+                apply=lambda changes: apply_live(component.current, changes), reloadable=component
+            )
+        else:
+            self._bindings[name] = _Binding(
+                name, live_settings(component), (), apply=lambda changes: apply_live(component, changes)
+            )
+
+    def register_callback(self, name: str, keys: Iterable[str],
+                          callback: Callable[[Dict[str, Dict[str, Any]]], Any]) -> None:
+        """
+        Register a cheap in-place handler for some settings
+
+        Args:
+            name: Handler name
+            keys: Settings it follows
+            callback: Called with the config_changed diff
+        """
+        self._bindings[name] = _Binding(name, keys, (), apply=callback)
+
+    def unregister(self, name: str) -> None:
+        """Stop following settings for a component"""
+        self._bindings.pop(name, None)
+
+    async def on_config_changed(self, data: Dict[str, Any]) -> None:
+        """
+        Apply one config_changed diff
+
+        Args:
+            data: Event data with a ``changes`` mapping
+        """
+        changes = data.get("changes", {})
+        for binding in list(self._bindings.values()):
+            live = binding.live.intersection(changes)
+            if live and binding.apply is not None:
+                try:
+                    binding.apply({key: changes[key] for key in live})
+                    binding.applied += 1
+                except Exception as e:
+                    binding.failures += 1
+                    logger.error(f"Failed to apply {sorted(live)} to {binding.name}: {e}")
+            if binding.reloadable is not None and binding.reload.intersection(changes):
+                if binding.task is not None and not binding.task.done():
+                    binding.pending = True
+                else:
+                    binding.task = asyncio.create_task(self._reload(binding), name=f"reload-{binding.name}")
+
+    async def _reload(self, binding: _Binding) -> None:
+        """Rebuild a component until no newer change is pending"""
+        while True:
+            binding.pending = False
+            start = time.perf_counter()
+            try:
+                await binding.reloadable.reload()
+                binding.reloads += 1
+                binding.last_reload_ms = (time.perf_counter() - start) * 1000
+            except Exception as e:
+                binding.failures += 1
+                logger.error(f"Reload of {binding.name} failed, keeping the current instance: {e}")
+            if not binding.pending:
+                return
+
+    async def wait_idle(self) -> None:
+        """Wait for running reloads to finish"""
+        tasks = [b.task for b in self._bindings.values() if b.task is not None and not b.task.done()]
+        while tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [b.task for b in self._bindings.values() if b.task is not None and not b.task.done()]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-component reconfiguration counters
+
+        Returns:
+            Dictionary keyed by component name
+        """
+        return {
+            name: {
+                "live_settings": sorted(b.live),
+                "reload_settings": sorted(b.reload),
+                "applied": b.applied,
+                "reloads": b.reloads,
+                "failures": b.failures,
+                "reloading": b.task is not None and not b.task.done(),
+                "generation": b.reloadable.generation if b.reloadable else None,
+                "in_flight": b.reloadable.in_flight if b.reloadable else None,
+                "last_reload_ms": b.last_reload_ms,
+            }
+            for name, b in self._bindings.items()
+        }
@@ -0,0 +1,134 @@
+"""
+Startup Warm-up
+Loads heavy subsystems in the background once the dashboard is serving
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Step states
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+UNAVAILABLE = "unavailable"
+FAILED = "failed"
+
+
+def process_start_time() -> float:
+    """Epoch seconds when this process started (import time if psutil is missing)"""
+    if PSUTIL_AVAILABLE:
+        try:
+            return psutil.Process().create_time()
+        except Exception:
+            pass
+    return time.time()
+
+
+PROCESS_START = process_start_time()
+
+
+class _Step:
+    """One warm-up step and its outcome"""
+
+    def __init__(self, name: str, func: Callable[[], Any]):
+        self.name = name
+        self.func = func
+        self.state = PENDING
+        self.ready_after: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class Warmup:
+    """
+    Background warm-up of heavy subsystems
+
+    The server starts answering as soon as the routes are registered; model
+    loading and heavy imports (Whisper, Piper, OpenCV, the Ollama model) run
+    here afterwards, one step at a time so they do not compete with each
+    other or with the first dashboard requests. Synchronous steps run in a
+    worker thread, coroutine functions on the event loop. A step that returns
+    False is "unavailable" (e.g. no camera attached); one that raises is
+    "failed". Neither stops the remaining steps.
+    """
+
+    def __init__(self):
+        """Initialize warm-up with no steps"""
+        self._steps: Dict[str, _Step] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, name: str, func: Callable[[], Any]) -> None:
+        """
+        Add a step
+
+        Args:
+            name: Subsystem name
+            func: Loads the subsystem; may be a coroutine function
+        """
+        self._steps[name] = _Step(name, func)
+
+    def start(self) -> asyncio.Task:
+        """Run the steps in a background task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="warmup")
+        return self._task
+
+    async def run(self) -> None:
+        """Run all pending steps in order"""
+        for step in self._steps.values():
+            if step.state != PENDING:
+                continue
+            step.state = LOADING
+            start = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(step.func):
+                    result = await step.func()
+                else:
+                    result = await asyncio.to_thread(step.func)
+                step.state = UNAVAILABLE if result is False else READY
+            except Exception as e:
+                step.state = FAILED
+                step.error = str(e)
+                logger.error(f"Warm-up of {step.name} failed: {e}")
+            step.duration_ms = (time.perf_counter() - start) * 1000
+            step.ready_after = time.time() - PROCESS_START
+            logger.info(f"Warm-up {step.name}: {step.state} in {step.duration_ms:.0f}ms "
+                        f"({step.ready_after:.2f}s after process start)")
+
+    @property
+    def done(self) -> bool:
+        """True once every step has finished (whatever its outcome)"""
+        return all(step.state not in (PENDING, LOADING) for step in self._steps.values())
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get readiness per subsystem
+
+        Returns:
+            Dictionary with ready, degraded, uptime and per-step state
+        """
+        return {
+            "ready": self.done,
+            "degraded": any(step.state in (UNAVAILABLE, FAILED) for step in self._steps.values()),
+            "uptime": time.time() - PROCESS_START,
+            "subsystems": {
+                step.name: {
+                    "state": step.state,
+                    "ready_after": step.ready_after,
+                    "duration_ms": step.duration_ms,
+                    "error": step.error,
+                }
+                for step in self._steps.values()
+            },
+        }
@@ -6,6 +6,7 @@ import asyncio
 import logging
 from src.config.settings import settings
 from src.utils.logger import setup_logging, get_logger
+from src.utils.tracing import span_store
 
 logger = get_logger(__name__)
 
@@ -16,7 +17,17 @@ __version__ = "0.1.0"
 async def main() -> None:
     """Main application entry point"""
     # Setup logging
-    setup_logging(settings.log_level)
+    setup_logging(
+        settings.log_level,
+        queue_size=settings.log_queue_size,
+        drop_policy=settings.log_drop_policy,
+        batch_size=settings.log_batch_size,
+        flush_interval=settings.log_flush_interval,
+        index_path=settings.log_index_path if settings.log_index_enabled else None,
+        retention_days=settings.data_retention_days,
+        archive=settings.log_archive_enabled
+    )
+    span_store.configure(settings.tracing_enabled, settings.trace_buffer_size)
     
     logger.info("=" * 60)
     logger.info("Zema AI Assistant Starting...")
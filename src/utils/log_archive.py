@@ -0,0 +1,334 @@
+"""
+Log Archive
+Compressed, frame-indexed storage for rotated log segments
+"""
+
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from src.utils.log_pipeline import BatchRotatingFileHandler
+from src.utils.log_store import LEVEL_CODES, SegmentIndex
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# numpy is imported where archives are read or written, so importing the
+# log routes (and with them the dashboard server) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Uncompressed bytes per frame; each frame holds whole lines and decompresses on its own
+FRAME_SIZE = 1024 * 1024
+INDEX_SUFFIX = ".idx.npz"
+PENDING_PREFIX = "pending-"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    """Compress one frame as an independent zstd frame or gzip member"""
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    """Decompress one frame"""
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read .zst log archives")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class ArchiveSegment:
+    """
+    One compressed log segment and its frame index
+
+    The archive is a concatenation of independent zstd frames (or gzip
+    members), so ``zstdcat``/``zcat`` read it as a whole. The sidecar index
+    records each frame's byte range, first and last timestamp and a bitmask
+    of the levels it contains, so a query decompresses only the frames that
+    can match.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Load an archive's frame index
+
+        Args:
+            path: Archive file (the index is ``<path>.idx.npz``)
+        """
+        import numpy as np
+        self.path = Path(path)
+        with np.load(index_path(self.path)) as data:
+            self.offsets = data["offsets"]
+            self.sizes = data["sizes"]
+            self.first = data["first"]
+            self.last = data["last"]
+            self.masks = data["masks"]
+            self.codec = str(data["codec"])
+
+    @property
+    def first_ts(self) -> float:
+        """Time of the first record"""
+        return float(self.first[0]) if len(self.first) else 0.0
+
+    @property
+    def last_ts(self) -> float:
+        """Time of the last record"""
+        return float(self.last[-1]) if len(self.last) else 0.0
+
+    def frames(self, level: Optional[str] = None, since: Optional[float] = None,
+               until: Optional[float] = None) -> "np.ndarray":
+        """
+        Frames that may contain matching records
+
+        Args:
+            level: Exact level name
+            since: Earliest epoch seconds
+            until: Latest epoch seconds
+
+        Returns:
+            Frame numbers, oldest first
+        """
+        import numpy as np
+        keep = np.ones(len(self.offsets), dtype=bool)
+        if since is not None:
+            keep &= self.last >= since
+        if until is not None:
+            keep &= self.first <= until
+        if level:
+            keep &= (self.masks & (1 << LEVEL_CODES.get(level.upper(), 7))) != 0
+        return np.flatnonzero(keep)
+
+    def read_frame(self, frame: int) -> List[bytes]:
+        """
+        Decompress one frame
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            Non-empty lines of the frame, oldest first
+        """
+        with open(self.path, "rb") as f:
+            f.seek(int(self.offsets[frame]))
+            data = _decompress(f.read(int(self.sizes[frame])), self.codec)
+        return [line for line in data.split(b"\n") if line]
+
+
+def index_path(archive: Path) -> Path:
+    """Sidecar index path of an archive"""
+    return archive.with_name(archive.name + INDEX_SUFFIX)
+
+
+def list_archives(archive_dir: Path) -> List[Path]:
+    """
+    Complete archives, newest first
+
+    An archive counts once its index exists (the index is written last).
+
+    Args:
+        archive_dir: Archive directory
+
+    Returns:
+        Archive paths
+    """
+    if not Path(archive_dir).exists():
+        return []
+    archives = [p.with_name(p.name[:-len(INDEX_SUFFIX)]) for p in Path(archive_dir).glob("*" + INDEX_SUFFIX)]
+    return sorted((p for p in archives if p.exists()), key=lambda p: p.name, reverse=True)
+
+
+def compress_segment(source: Path, archive_dir: Path, codec: Optional[str] = None) -> Optional[Path]:
+    """
+    Compress a closed log segment into frames
+
+    Args:
+        source: Plain log file
+        archive_dir: Destination directory
+        codec: "zstd" or "gzip" (defaults to zstd when installed)
+
+    Returns:
+        Archive path, or None if the segment held no records
+    """
+    import numpy as np
+    codec = codec or ("zstd" if ZSTD_AVAILABLE else "gzip")
+    index = SegmentIndex()
+    index.extend(source)
+    if not len(index.offsets):
+        return None
+    with open(source, "rb") as f:
+        data = f.read(index.size)
+
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(float(index.times[0])))
+    suffix = ".log.zst" if codec == "zstd" else ".log.gz"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    # Names sort chronologically: start time, then a sequence number within the second
+    sequence = 0
+    target = archive_dir / f"zema-{stamp}-{sequence:03d}{suffix}"
+    while target.exists():
+        sequence += 1
+        target = archive_dir / f"zema-{stamp}-{sequence:03d}{suffix}"
+
+    offsets, sizes, first, last, masks = [], [], [], [], []
+    level_bits = (1 << index.levels.astype(np.uint8)).astype(np.uint8)
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as out:
+        start = 0
+        while start < len(index.offsets):
+            stop = int(np.searchsorted(index.offsets, index.offsets[start] + FRAME_SIZE, side="left"))
+            stop = max(stop, start + 1)
+            end = int(index.offsets[stop]) if stop < len(index.offsets) else index.size
+            frame = _compress(data[int(index.offsets[start]):end], codec)
+            offsets.append(out.tell())
+            sizes.append(len(frame))
+            first.append(index.times[start])
+            last.append(index.times[stop - 1])
+            masks.append(np.bitwise_or.reduce(level_bits[start:stop]))
+            out.write(frame)
+            start = stop
+    os.replace(tmp, target)
+
+    sidecar = index_path(target)
+    sidecar_tmp = sidecar.with_name(sidecar.name + ".tmp")
+    with open(sidecar_tmp, "wb") as f:
+        np.savez(f, offsets=np.asarray(offsets, dtype=np.int64), sizes=np.asarray(sizes, dtype=np.int64),
+                 first=np.asarray(first, dtype=np.float64), last=np.asarray(last, dtype=np.float64),
+                 masks=np.asarray(masks, dtype=np.uint8), codec=np.array(codec))
+    os.replace(sidecar_tmp, sidecar)
+    return target
+
+
+def purge_archives(archive_dir: Path, retention_days: int) -> int:
+    """
+    Delete archives whose newest record is older than the retention period
+
+    Args:
+        archive_dir: Archive directory
+        retention_days: Days to keep
+
+    Returns:
+        Number of archives deleted
+    """
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for archive in list_archives(archive_dir):
+        try:
+            if ArchiveSegment(archive).last_ts < cutoff:
+                archive.unlink(missing_ok=True)
+                index_path(archive).unlink(missing_ok=True)
+                removed += 1
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not check log archive {archive}: {e}")
+    return removed
+
+
+class LogArchiver:
+    """
+    Background compressor for rotated segments
+
+    ``submit`` moves a segment into the archive directory under a pending
+    name (a rename, so rotation is not slowed down) and a daemon thread
+    compresses it, deletes the plain copy and applies retention. Pending
+    files left by a crash are picked up on start.
+    """
+
+    def __init__(self, archive_dir: Path, retention_days: int = 30, codec: Optional[str] = None):
+        """
+        Initialize archiver
+
+        Args:
+            archive_dir: Directory for archives
+            retention_days: Days of archives kept
+            codec: "zstd" or "gzip" (defaults to zstd when installed)
+        """
+        self.archive_dir = Path(archive_dir)
+        self.retention_days = retention_days
+        self.codec = codec
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the compression thread and queue leftover pending segments"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        for pending in sorted(self.archive_dir.glob(PENDING_PREFIX + "*.log")):
+            self._queue.put(pending)
+        self._thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+        self._thread.start()
+
+    def submit(self, segment: Path) -> None:
+        """
+        Hand over a closed segment
+
+        Args:
+            segment: Rotated log file (moved away immediately)
+        """
+        pending = self.archive_dir / f"{PENDING_PREFIX}{time.time_ns()}.log"
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        os.replace(segment, pending)
+        self._queue.put(pending)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Finish queued segments and stop the thread"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Compress segments as they arrive"""
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return
+            try:
+                target = compress_segment(pending, self.archive_dir, self.codec)
+                pending.unlink(missing_ok=True)
+                removed = purge_archives(self.archive_dir, self.retention_days)
+                logger.info(f"Archived log segment to {target}" + (f", removed {removed} expired" if removed else ""))
+            except Exception as e:
+                logger.error(f"Failed to archive log segment {pending}: {e}")
+
+
+class ArchivingRotatingFileHandler(BatchRotatingFileHandler):
+    """
+    Batch rotating file handler that archives the oldest backup
+
+    Rotation works as usual, except that the backup which would be deleted
+    is handed to a LogArchiver instead.
+    """
+
+    def __init__(self, filename: Path, archiver: LogArchiver, **kwargs):
+        """
+        Initialize archiving handler
+
+        Args:
+            filename: Log file
+            archiver: Running LogArchiver
+            **kwargs: RotatingFileHandler arguments (maxBytes, backupCount, encoding)
+        """
+        super().__init__(filename, **kwargs)
+        self.archiver = archiver
+
+    def doRollover(self) -> None:
+        """Archive the oldest backup, then rotate"""
+        if self.backupCount > 0:
+            oldest = self.rotation_filename(f"{self.baseFilename}.{self.backupCount}")
+            if os.path.exists(oldest):
+                try:
+                    self.archiver.submit(Path(oldest))
+                except OSError as e:
+                    logger.error(f"Could not archive {oldest}: {e}")
+        super().doRollover()
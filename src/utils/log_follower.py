@@ -0,0 +1,290 @@
+"""
+Log Follower
+One shared tail of zema.log, fanned out to stream subscribers
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from src.utils.log_store import matches_search, parse_record
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+READ_SIZE = 256 * 1024
+
+
+def _load_inotify() -> Optional[Any]:
+    """Load libc's inotify functions, or None where unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_inotify()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+class Subscriber:
+    """One stream client: a bounded queue of records plus its filters"""
+
+    def __init__(self, level: Optional[str], search: Optional[str], queue_size: int):
+        """
+        Initialize subscriber
+
+        Args:
+            level: Exact level filter (optional)
+            search: Case-insensitive search term (optional)
+            queue_size: Records buffered before the oldest are dropped
+        """
+        self.level = level.upper() if level else None
+        self.needle = search.lower() if search else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def accepts(self, record: Dict[str, Any]) -> bool:
+        """Check a record against this subscriber's filters"""
+        if self.level and record.get("level") != self.level:
+            return False
+        return self.needle is None or matches_search(record, self.needle)
+
+    def offer(self, record: Dict[str, Any]) -> None:
+        """Queue a record, dropping the oldest when the client falls behind"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(record)
+
+
+class LogFollower:
+    """
+    Follow a log file and fan new records out to subscribers
+
+    A single task watches the log directory with inotify (or polls where
+    inotify is unavailable), reads only the bytes appended since the last
+    event, parses each complete line once and offers the record to every
+    subscriber whose filters match. Rotation is detected by an inode change
+    (the rest of the old file is read first) and truncation by a shrinking
+    size. The follower starts with the first subscriber and stops with the
+    last.
+    """
+
+    def __init__(self, path: Path, poll_interval: float = 0.5, queue_size: int = 1000):
+        """
+        Initialize log follower
+
+        Args:
+            path: Log file to follow
+            poll_interval: Seconds between checks without inotify
+            queue_size: Records buffered per subscriber
+        """
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.subscribers: Set[Subscriber] = set()
+        self.records = 0
+        self.rotations = 0
+        self._file = None
+        self._inode: Optional[int] = None
+        self._partial = b""
+        self._inotify_fd: Optional[int] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, level: Optional[str] = None, search: Optional[str] = None) -> Subscriber:
+        """
+        Add a subscriber, starting the follower if needed
+
+        Must be called from the event loop.
+
+        Args:
+            level: Exact level filter (optional)
+            search: Case-insensitive search term (optional)
+
+        Returns:
+            Subscriber whose queue receives new records
+        """
+        subscriber = Subscriber(level, search, self.queue_size)
+        self.subscribers.add(subscriber)
+        if self._loop is None:
+            self._start()
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber, stopping the follower after the last one"""
+        self.subscribers.discard(subscriber)
+        if not self.subscribers:
+            self._stop()
+
+    @property
+    def mode(self) -> str:
+        """'inotify', 'poll' or 'stopped'"""
+        if self._loop is None:
+            return "stopped"
+        return "inotify" if self._inotify_fd is not None else "poll"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get follower statistics
+
+        Returns:
+            Dictionary with mode, subscribers, records read, rotations and drops
+        """
+        return {
+            "mode": self.mode,
+            "subscribers": len(self.subscribers),
+            "records": self.records,
+            "rotations": self.rotations,
+            "dropped": sum(s.dropped for s in self.subscribers),
+        }
+
+    def _start(self) -> None:
+        """Open the file at its end and begin watching"""
+        self._loop = asyncio.get_running_loop()
+        self._open(at_end=True)
+        if INOTIFY_AVAILABLE and self._watch():
+            self._loop.add_reader(self._inotify_fd, self._on_inotify)
+        else:
+            self._poll_task = self._loop.create_task(self._poll())
+        logger.debug(f"Following {self.path} ({self.mode})")
+
+    def _stop(self) -> None:
+        """Stop watching and close the file"""
+        if self._inotify_fd is not None:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.remove_reader(self._inotify_fd)
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._inode = None
+        self._partial = b""
+        self._loop = None
+
+    def _watch(self) -> bool:
+        """Watch the log directory (so rotation and re-creation are seen)"""
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if _libc.inotify_add_watch(fd, os.fsencode(self.path.parent), WATCH_MASK) < 0:
+            os.close(fd)
+            return False
+        self._inotify_fd = fd
+        return True
+
+    def _on_inotify(self) -> None:
+        """Read pending inotify events and check the file if it was involved"""
+        try:
+            data = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        name = os.fsencode(self.path.name)
+        relevant = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if data[offset:offset + length].rstrip(b"\0") == name:
+                relevant = True
+            offset += length
+        if relevant:
+            self._check()
+
+    async def _poll(self) -> None:
+        """Polling fallback"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self._check()
+
+    def _open(self, at_end: bool) -> None:
+        """Open the current log file, at its end or its start"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._partial = b""
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            self._inode = None
+            return
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        if at_end:
+            self._file.seek(0, os.SEEK_END)
+
+    def _check(self) -> None:
+        """Read what was appended, following rotation and truncation"""
+        try:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                stat = None
+            if self._file is None:
+                if stat is not None:
+                    self._open(at_end=False)
+                    self._read()
+                return
+            if stat is None or stat.st_ino != self._inode:
+                # Rotated: finish the old file, then start the new one from the top
+                self._read()
+                self.rotations += 1
+                self._open(at_end=False)
+                self._read()
+                return
+            if stat.st_size < self._file.tell():
+                self._file.seek(0)
+                self._partial = b""
+            self._read()
+        except Exception as e:
+            logger.warning(f"Log follower error on {self.path}: {e}")
+
+    def _read(self) -> None:
+        """Parse complete new lines and fan them out"""
+        if self._file is None:
+            return
+        while True:
+            chunk = self._file.read(READ_SIZE)
+            if not chunk:
+                return
+            lines = (self._partial + chunk).split(b"\n")
+            self._partial = lines.pop()
+            self._publish(lines)
+
+    def _publish(self, lines: List[bytes]) -> None:
+        """Parse lines once and offer each record to matching subscribers"""
+        for line in lines:
+            record = parse_record(line)
+            if record is None:
+                continue
+            self.records += 1
+            for subscriber in self.subscribers:
+                if subscriber.accepts(record):
+                    subscriber.offer(record)
@@ -0,0 +1,412 @@
+"""
+Log Index
+Full-text search over structured logs in SQLite FTS5
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    import json
+
+
+def _fts5_available() -> bool:
+    """Check whether the linked SQLite was built with FTS5"""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+# Columns stored per record; ``data`` holds the full JSON line as written to zema.log
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    level TEXT NOT NULL,
+    logger TEXT NOT NULL,
+    module TEXT,
+    function TEXT,
+    message TEXT,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS logs_ts ON logs(ts);
+CREATE INDEX IF NOT EXISTS logs_level ON logs(level, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5(
+    message, logger, module, content='logs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS logs_ai AFTER INSERT ON logs BEGIN
+    INSERT INTO logs_fts(rowid, message, logger, module) VALUES (new.id, new.message, new.logger, new.module);
+END;
+CREATE TRIGGER IF NOT EXISTS logs_ad AFTER DELETE ON logs BEGIN
+    INSERT INTO logs_fts(logs_fts, rowid, message, logger, module)
+    VALUES ('delete', old.id, old.message, old.logger, old.module);
+END;
+"""
+
+# Fields that filter on a column; everything else is full-text
+COLUMN_FIELDS = ("level", "logger", "module", "function")
+TEXT_FIELDS = ("message",)
+
+_TOKEN = re.compile(r'(?:(\w+):)?("[^"]*"|\S+)')
+
+PURGE_INTERVAL = 3600.0
+
+# Records reach the index in queue order, which can lag creation order slightly
+ORDER_SLACK_SECONDS = 5.0
+
+
+class QueryError(ValueError):
+    """Raised for a search query that cannot be parsed"""
+
+
+def parse_query(query: str) -> Tuple[List[str], List[Any], Optional[str]]:
+    """
+    Parse a field-scoped search query
+
+    ``level:ERROR`` (comma-separated for several levels), ``logger:``,
+    ``module:`` and ``function:`` filter on columns; a ``*`` makes them a
+    glob (``logger:src.ai*``). ``message:word`` and bare words are full-text
+    terms; quotes make a phrase and a trailing ``*`` a prefix match. All
+    terms must match.
+
+    Args:
+        query: Query text
+
+    Returns:
+        (SQL conditions, parameters, FTS5 match expression or None)
+
+    Raises:
+        QueryError: If a field name is unknown
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    terms: List[str] = []
+    for field, value in _TOKEN.findall(query or ""):
+        field = field.lower()
+        if value.startswith('"') and value.endswith('"') and len(value) > 1:
+            value, quoted = value[1:-1], True
+        else:
+            quoted = False
+        if not value:
+            continue
+        if field in COLUMN_FIELDS:
+            if field == "level":
+                levels = [v.strip().upper() for v in value.split(",") if v.strip()]
+                conditions.append(f"l.level IN ({','.join('?' * len(levels))})")
+                params.extend(levels)
+            elif "*" in value or "?" in value:
+                conditions.append(f"l.{field} GLOB ?")
+                params.append(value)
+            else:
+                conditions.append(f"l.{field} = ?")
+                params.append(value)
+        elif field in TEXT_FIELDS or not field:
+            prefix = value.endswith("*") and not quoted
+            text = value.rstrip("*") if prefix else value
+            if not text:
+                continue
+            term = '"' + text.replace('"', '""') + '"' + ("*" if prefix else "")
+            terms.append(f"{field} : {term}" if field else term)
+        else:
+            raise QueryError(f"Unknown search field: {field}")
+    return conditions, params, " AND ".join(terms) or None
+
+
+def _loads(text: str) -> Dict[str, Any]:
+    """Decode a stored JSON line"""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+class LogIndex:
+    """
+    SQLite FTS5 index of log records
+
+    Records are written by ``LogIndexHandler`` on the log listener thread and
+    read by API requests, each with its own connection (WAL mode, so readers
+    never wait for the writer). Results are newest first and paginated with
+    the id of the last record returned, which stays stable while new records
+    arrive.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize log index
+
+        Args:
+            db_path: SQLite database file (created on first write)
+        """
+        self.db_path = Path(db_path)
+        self._schema_ready = False
+
+    def exists(self) -> bool:
+        """Whether the database has been created"""
+        return self.db_path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            conn.executescript(SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def add(self, conn: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Insert records in one transaction
+
+        Args:
+            conn: Writer connection
+            rows: (ts, level, logger, module, function, message, data) tuples
+        """
+        with conn:
+            conn.executemany(
+                "INSERT INTO logs (ts, level, logger, module, function, message, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def purge(self, conn: sqlite3.Connection, before: float) -> int:
+        """
+        Delete records older than a timestamp
+
+        Args:
+            conn: Writer connection
+            before: Epoch seconds
+
+        Returns:
+            Number of records deleted
+        """
+        with conn:
+            return conn.execute("DELETE FROM logs WHERE ts < ?", (before,)).rowcount
+
+    def search(
+        self,
+        query: str = "",
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Search the index
+
+        Args:
+            query: Field-scoped query (see parse_query)
+            since: Earliest record time, epoch seconds
+            until: Latest record time, epoch seconds
+            limit: Maximum records to return
+            cursor: ``next_cursor`` from the previous page
+
+        Returns:
+            Dictionary with logs (newest first) and next_cursor (None on the last page)
+
+        Raises:
+            QueryError: If the query cannot be parsed
+        """
+        conditions, params, match = parse_query(query)
+        if not self.exists():
+            return {"logs": [], "next_cursor": None}
+        conn = self.connect()
+        try:
+            # Ids follow time, so a time range becomes an id range that both
+            # the table and the FTS index can seek to; ts is still checked
+            low, high = self._id_range(conn, since, until)
+            if low is not None:
+                conditions.append("{id} >= ?")
+                params.append(low)
+            if high is not None:
+                conditions.append("{id} <= ?")
+                params.append(high)
+            if since is not None:
+                conditions.append("l.ts >= ?")
+                params.append(since)
+            if until is not None:
+                conditions.append("l.ts <= ?")
+                params.append(until)
+            if cursor is not None:
+                conditions.append("{id} < ?")
+                params.append(cursor)
+            rows = self._select(conn, conditions, params, match, limit)
+        finally:
+            conn.close()
+        return {
+            "logs": [_loads(data) for _, data in rows],
+            "next_cursor": rows[-1][0] if len(rows) == limit else None
+        }
+
+    def _select(self, conn: sqlite3.Connection, conditions: List[str], params: List[Any],
+                match: Optional[str], limit: int) -> List[Tuple[int, str]]:
+        """Run the search, newest first"""
+        # Id bounds go on the FTS rowid when matching so FTS5 can seek to them
+        row_id = "logs_fts.rowid" if match else "l.id"
+        conditions = [condition.replace("{id}", row_id) for condition in conditions]
+        if match:
+            sql = "SELECT l.id, l.data FROM logs_fts JOIN logs l ON l.id = logs_fts.rowid WHERE logs_fts MATCH ?"
+            params.insert(0, match)
+            for condition in conditions:
+                sql += f" AND {condition}"
+            sql += " ORDER BY logs_fts.rowid DESC LIMIT ?"
+        else:
+            sql = "SELECT l.id, l.data FROM logs l"
+            if conditions:
+                sql += " WHERE " + " AND ".join(conditions)
+            sql += " ORDER BY l.id DESC LIMIT ?"
+        params.append(limit)
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            if match and "fts5" in str(e).lower():
+                raise QueryError(f"Invalid search terms: {e}") from e
+            raise
+
+    @staticmethod
+    def _id_range(conn: sqlite3.Connection, since: Optional[float],
+                  until: Optional[float]) -> Tuple[Optional[int], Optional[int]]:
+        """Approximate id bounds for a time range (widened by ORDER_SLACK_SECONDS)"""
+        low = high = None
+        if since is not None:
+            row = conn.execute("SELECT id FROM logs WHERE ts >= ? ORDER BY ts LIMIT 1",
+                               (since - ORDER_SLACK_SECONDS,)).fetchone()
+            low = row[0] if row else None
+        if until is not None:
+            row = conn.execute("SELECT id FROM logs WHERE ts <= ? ORDER BY ts DESC LIMIT 1",
+                               (until + ORDER_SLACK_SECONDS,)).fetchone()
+            high = row[0] if row else -1
+        return low, high
+
+    def clear(self) -> int:
+        """
+        Delete every record (the log file was cleared)
+
+        Returns:
+            Number of records deleted
+        """
+        if not self.exists():
+            return 0
+        conn = self.connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM logs").rowcount
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        """Number of indexed records"""
+        if not self.exists():
+            return 0
+        conn = self.connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        finally:
+            conn.close()
+
+
+class LogIndexHandler(logging.Handler):
+    """
+    Log handler that feeds the FTS5 index
+
+    Meant to run behind the log pipeline: each batch is one transaction.
+    The ``data`` column holds the record as formatted by this handler's
+    formatter (the JSON formatter used for zema.log), so search results
+    look like /api/logs entries. Records older than ``retention_days`` are
+    purged at most once an hour.
+    """
+
+    def __init__(self, index: LogIndex, retention_days: int = 30, level: int = logging.DEBUG):
+        """
+        Initialize index handler
+
+        Args:
+            index: Target LogIndex
+            retention_days: Days of history kept in the index
+            level: Minimum level indexed
+        """
+        super().__init__(level)
+        self.index = index
+        self.retention_seconds = retention_days * 86400
+        self._conn: Optional[sqlite3.Connection] = None
+        self._next_purge = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Index a single record"""
+        self.emit_batch([record])
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Index several records in one transaction
+
+        Args:
+            records: Records to index
+        """
+        rows = []
+        for record in records:
+            try:
+                if self.filter(record):
+                    rows.append((
+                        record.created, record.levelname, record.name, record.module,
+                        record.funcName, record.getMessage(), self.format(record)
+                    ))
+            except Exception:
+                self.handleError(record)
+        if not rows:
+            return
+        with self.lock:
+            try:
+                if self._conn is None:
+                    self._conn = self.index.connect()
+                self.index.add(self._conn, rows)
+                now = time.time()
+                if now >= self._next_purge:
+                    self._next_purge = now + PURGE_INTERVAL
+                    self.index.purge(self._conn, now - self.retention_seconds)
+            except Exception:
+                self.handleError(records[-1])
+
+    def close(self) -> None:
+        """Close the writer connection"""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        super().close()
+
+
+_index: Optional[LogIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_log_index() -> Optional[LogIndex]:
+    """
+    Get the process-wide log index
+
+    Returns:
+        LogIndex, or None if FTS5 is unavailable or the index is disabled
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from src.config.settings import settings
+                if not FTS5_AVAILABLE or not settings.log_index_enabled:
+                    return None
+                _index = LogIndex(Path(settings.log_index_path))
+    return _index
@@ -0,0 +1,334 @@
+"""
+Log Pipeline
+Moves log formatting and file I/O off the calling threads
+"""
+
+import linecache
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Any, Dict, List, Optional, Sequence
+
+# Overload policies when the queue is full
+DROP_NEWEST = "drop_newest"    # Discard the incoming record
+DROP_OLDEST = "drop_oldest"    # Discard the oldest queued record to make room
+BLOCK = "block"                # Wait up to block_timeout, then discard the incoming record
+
+DROP_POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
+_STOP = object()
+
+# Frames from the logging package and these files are skipped when capturing a caller's stack
+_LOGGING_DIR = os.path.normcase(os.path.dirname(logging.__file__)) + os.sep
+_SKIP_FILES = {os.path.normcase(__file__)}
+
+
+def skip_stack_file(path: str) -> None:
+    """
+    Exclude a logging helper module from captured stacks
+
+    Args:
+        path: Source file path (usually ``__file__``)
+    """
+    _SKIP_FILES.add(os.path.normcase(path))
+
+
+def capture_stack(limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Capture the caller's stack, skipping logging internals
+
+    Args:
+        limit: Maximum frames, innermost last
+
+    Returns:
+        List of {file, line, function, code} dictionaries
+    """
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < limit:
+        filename = frame.f_code.co_filename
+        normalized = os.path.normcase(filename)
+        if normalized not in _SKIP_FILES and not normalized.startswith(_LOGGING_DIR):
+            frames.append({
+                "file": filename,
+                "line": frame.f_lineno,
+                "function": frame.f_code.co_name,
+                "code": linecache.getline(filename, frame.f_lineno).strip() or None
+            })
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler with a bounded queue and an overload policy
+
+    The calling thread only merges the message arguments and enqueues the
+    record; formatting and I/O happen on the listener thread. Records that
+    cannot be queued are counted per level instead of blocking the audio or
+    event loop threads.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = DROP_NEWEST, block_timeout: float = 0.05):
+        """
+        Initialize bounded queue handler
+
+        Args:
+            log_queue: Bounded queue shared with the listener
+            policy: drop_newest, drop_oldest or block
+            block_timeout: Seconds to wait for space under the block policy
+        """
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"policy must be one of {DROP_POLICIES}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.enqueued = 0
+        self.dropped: Counter = Counter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message (and any requested stack) on the calling thread"""
+        if getattr(record, "capture_stack", False) and not hasattr(record, "stack_trace"):
+            record.stack_trace = capture_stack()
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, applying the overload policy"""
+        try:
+            if self.policy == BLOCK:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+            self.enqueued += 1
+            return
+        except queue.Full:
+            pass
+
+        if self.policy == DROP_OLDEST:
+            try:
+                evicted = self.queue.get_nowait()
+                self.dropped[evicted.levelname] += 1
+                self.queue.put_nowait(record)
+                self.enqueued += 1
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped[record.levelname] += 1
+
+
+class BatchingQueueListener:
+    """
+    Queue listener that writes in batches
+
+    A single thread drains up to ``batch_size`` records at a time (waiting at
+    most ``flush_interval`` to fill a batch). Handlers with an
+    ``emit_batch`` method, such as ``BatchRotatingFileHandler``, get one
+    write and one flush per batch; other handlers get each record.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        handlers: Sequence[logging.Handler],
+        batch_size: int = 256,
+        flush_interval: float = 0.2
+    ):
+        """
+        Initialize batching listener
+
+        Args:
+            log_queue: Queue filled by BoundedQueueHandler
+            handlers: Output handlers
+            batch_size: Maximum records per batch
+            flush_interval: Maximum seconds a record waits for its batch
+        """
+        self.queue = log_queue
+        self.handlers = list(handlers)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.batches = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the listener thread"""
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Flush queued records and stop the listener thread
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            # The listener is stuck or gone: drop the oldest records to make room
+            for _ in range(self.batch_size):
+                try:
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(_STOP)
+                    break
+                except (queue.Empty, queue.Full):
+                    continue
+        self._thread.join(max(deadline - time.monotonic(), 0))
+        self._thread = None
+        for handler in self.handlers:
+            handler.flush()
+
+    def _run(self) -> None:
+        """Drain the queue in batches until stopped"""
+        while True:
+            batch: List[logging.LogRecord] = []
+            record = self.queue.get()
+            stopping = record is _STOP
+            if not stopping:
+                batch.append(record)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    try:
+                        record = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if record is _STOP:
+                        stopping = True
+                        break
+                    batch.append(record)
+            if batch:
+                self._write(batch)
+            if stopping:
+                # Drain whatever arrived before the stop marker was seen
+                remaining = []
+                while True:
+                    try:
+                        record = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is not _STOP:
+                        remaining.append(record)
+                if remaining:
+                    self._write(remaining)
+                return
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        """Hand one batch to every handler"""
+        for handler in self.handlers:
+            records = [r for r in batch if r.levelno >= handler.level]
+            if not records:
+                continue
+            if hasattr(handler, "emit_batch"):
+                handler.emit_batch(records)
+            else:
+                for record in records:
+                    handler.handle(record)
+        self.written += len(batch)
+        self.batches += 1
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that writes a whole batch with one write call"""
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Format and write several records at once
+
+        Rotation is checked once per batch, so a file may exceed maxBytes
+        by at most one batch.
+
+        Args:
+            records: Records to write
+        """
+        lines = []
+        for record in records:
+            try:
+                if self.filter(record):
+                    lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        text = "".join(lines)
+        with self.lock:
+            try:
+                if self.maxBytes > 0:
+                    if self.stream is None:
+                        self.stream = self._open()
+                    if self.stream.tell() + len(text) >= self.maxBytes and self.stream.tell() > 0:
+                        self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(text)
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+
+class LogPipeline:
+    """Queue handler plus listener, as installed by setup_logging"""
+
+    def __init__(self, handler: BoundedQueueHandler, listener: BatchingQueueListener):
+        self.handler = handler
+        self.listener = listener
+
+    def stop(self) -> None:
+        """Flush and stop the listener"""
+        self.listener.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pipeline counters
+
+        Returns:
+            Dictionary with queue depth, enqueued, written, batches and drops per level
+        """
+        return {
+            "policy": self.handler.policy,
+            "queue_depth": self.handler.queue.qsize(),
+            "queue_size": self.handler.queue.maxsize,
+            "enqueued": self.handler.enqueued,
+            "written": self.listener.written,
+            "batches": self.listener.batches,
+            "dropped": dict(self.handler.dropped),
+            "dropped_total": sum(self.handler.dropped.values()),
+        }
+
+
+def create_pipeline(
+    handlers: Sequence[logging.Handler],
+    queue_size: int = 10000,
+    policy: str = DROP_NEWEST,
+    batch_size: int = 256,
+    flush_interval: float = 0.2
+) -> LogPipeline:
+    """
+    Build and start a log pipeline
+
+    Args:
+        handlers: Output handlers run on the listener thread
+        queue_size: Maximum queued records
+        policy: Overload policy (drop_newest, drop_oldest, block)
+        batch_size: Maximum records per write batch
+        flush_interval: Maximum seconds a record waits for its batch
+
+    Returns:
+        Running LogPipeline; attach ``pipeline.handler`` to a logger
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = BoundedQueueHandler(log_queue, policy)
+    listener = BatchingQueueListener(log_queue, handlers, batch_size, flush_interval)
+    listener.start()
+    return LogPipeline(handler, listener)
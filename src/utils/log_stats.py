@@ -0,0 +1,317 @@
+"""
+Log Statistics
+Level, logger and error counts maintained as records are written
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+MINUTES = 1440            # Error series kept per minute (24 hours)
+MAX_LOGGERS = 1000        # Distinct logger names tracked
+MAX_ERROR_MESSAGES = 500  # Distinct error messages tracked before the rarest are evicted
+ERROR_LEVELS = ("ERROR", "CRITICAL")
+
+# Numbers, hex ids and quoted values vary between otherwise identical errors
+_VARIABLE = re.compile(r"0x[0-9a-fA-F]+|\d+(?:\.\d+)?|'[^']*'|\"[^\"]*\"")
+
+
+def error_key(message: str) -> str:
+    """
+    Group an error message with others that differ only in numbers or quoted values
+
+    Args:
+        message: Log message
+
+    Returns:
+        First line of the message, truncated to 200 characters, with variable parts replaced by '#'
+    """
+    return _VARIABLE.sub("#", message.split("\n", 1)[0])[:200]
+
+
+class LogStats:
+    """
+    Incremental log statistics
+
+    Every update is O(1): counters for levels and loggers, a 24-hour ring of
+    errors per minute, and a bounded counter of error messages (the rarest
+    half is dropped when it fills). Reads return copies, so API requests
+    never rescan the log.
+
+    ``total`` counts records since ``since``, not lines in the log file: a
+    multi-line record (e.g. with a traceback) counts once, and rotated or
+    archived records stay counted until ``reset()``.
+    """
+
+    def __init__(self):
+        # Imported here so the log routes do not load numpy with the server
+        import numpy as np
+        self._lock = threading.Lock()
+        self.per_minute = np.zeros(MINUTES, dtype=np.int64)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all counts and start counting from now"""
+        with self._lock:
+            self.since = time.time()
+            self.total = 0
+            self.levels: Counter = Counter()
+            self.loggers: Counter = Counter()
+            self.errors: Counter = Counter()
+            self.per_minute[:] = 0
+            self.last_minute = int(self.since // 60)
+
+    def add(self, level: str, logger_name: str, message: str, timestamp: float) -> None:
+        """
+        Count one record
+
+        Args:
+            level: Level name
+            logger_name: Logger name
+            message: Formatted message
+            timestamp: Record time, epoch seconds
+        """
+        with self._lock:
+            self.total += 1
+            self.levels[level] += 1
+            if logger_name in self.loggers or len(self.loggers) < MAX_LOGGERS:
+                self.loggers[logger_name] += 1
+            if level in ERROR_LEVELS:
+                self._count_error(int(timestamp // 60))
+                key = error_key(message)
+                self.errors[key] += 1
+                if len(self.errors) > MAX_ERROR_MESSAGES:
+                    self.errors = Counter(dict(self.errors.most_common(MAX_ERROR_MESSAGES // 2)))
+
+    def _count_error(self, minute: int) -> None:
+        """Add one error to the per-minute ring, clearing minutes skipped since the last error"""
+        self._advance(minute)
+        if minute > self.last_minute - MINUTES:
+            self.per_minute[minute % MINUTES] += 1
+
+    def _advance(self, minute: int) -> None:
+        """Move the ring forward to a minute"""
+        if minute <= self.last_minute:
+            return
+        gap = minute - self.last_minute
+        if gap >= MINUTES:
+            self.per_minute[:] = 0
+        else:
+            import numpy as np
+            slots = np.arange(self.last_minute + 1, minute + 1) % MINUTES
+            self.per_minute[slots] = 0
+        self.last_minute = minute
+
+    def snapshot(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Get current statistics
+
+        Args:
+            top: Number of loggers and error messages listed
+
+        Returns:
+            Dictionary with totals, level counts, top loggers, top errors and errors in the last hour
+        """
+        import numpy as np
+        with self._lock:
+            self._advance(int(time.time() // 60))
+            last_hour = (np.arange(self.last_minute - 59, self.last_minute + 1)) % MINUTES
+            return {
+                "since": self.since,
+                "total": self.total,
+                "level_counts": {level: self.levels.get(level, 0)
+                                 for level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")},
+                "top_loggers": self.loggers.most_common(top),
+                "top_errors": self.errors.most_common(top),
+                "errors_last_hour": int(self.per_minute[last_hour].sum()),
+            }
+
+    def error_series(self, minutes: int = 60) -> Dict[str, List]:
+        """
+        Errors per minute, oldest first
+
+        Args:
+            minutes: Minutes of history (at most 1440)
+
+        Returns:
+            Dictionary with minute start times (epoch seconds) and counts
+        """
+        import numpy as np
+        minutes = max(1, min(minutes, MINUTES))
+        with self._lock:
+            self._advance(int(time.time() // 60))
+            numbers = np.arange(self.last_minute - minutes + 1, self.last_minute + 1)
+            counts = self.per_minute[numbers % MINUTES]
+        return {"timestamps": (numbers * 60).tolist(), "errors": counts.tolist()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable state"""
+        with self._lock:
+            return {
+                "since": self.since,
+                "total": self.total,
+                "levels": dict(self.levels),
+                "loggers": dict(self.loggers),
+                "errors": dict(self.errors),
+                "last_minute": self.last_minute,
+                "per_minute": self.per_minute.tolist(),
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogStats":
+        """Restore state saved by to_dict"""
+        stats = cls()
+        stats.since = data.get("since", stats.since)
+        stats.total = data.get("total", 0)
+        stats.levels.update(data.get("levels", {}))
+        stats.loggers.update(data.get("loggers", {}))
+        stats.errors.update(data.get("errors", {}))
+        per_minute = data.get("per_minute")
+        if per_minute and len(per_minute) == MINUTES:
+            stats.per_minute[:] = per_minute
+            stats.last_minute = data.get("last_minute", stats.last_minute)
+        return stats
+
+    def save(self, path: Path) -> None:
+        """Write state atomically (temp file, then rename)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-thread temp file: the API may save while the pipeline flushes
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LogStats":
+        """
+        Load saved state
+
+        Args:
+            path: File written by save
+
+        Returns:
+            Restored LogStats, or an empty one if the file is missing or unreadable
+        """
+        try:
+            return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return cls()
+        except (ValueError, OSError) as e:
+            logger.warning(f"Ignoring unreadable log statistics {path}: {e}")
+            return cls()
+
+
+class LogStatsHandler(logging.Handler):
+    """
+    Log handler that keeps LogStats up to date
+
+    Runs behind the log pipeline, so counting costs the logging threads
+    nothing. State is restored from ``path`` at startup and saved at most
+    every ``save_interval`` seconds and on close.
+    """
+
+    def __init__(self, path: Path, save_interval: float = 10.0, level: int = logging.DEBUG):
+        """
+        Initialize statistics handler
+
+        Args:
+            path: JSON file holding the statistics across restarts
+            save_interval: Minimum seconds between saves
+            level: Minimum level counted
+        """
+        super().__init__(level)
+        self.path = Path(path)
+        self.save_interval = save_interval
+        self.stats = LogStats.load(self.path)
+        self._next_save = time.monotonic() + save_interval
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count a single record"""
+        self.emit_batch([record])
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Count several records
+
+        Args:
+            records: Records to count
+        """
+        for record in records:
+            try:
+                self.stats.add(record.levelname, record.name, record.getMessage(), record.created)
+            except Exception:
+                self.handleError(record)
+        if time.monotonic() >= self._next_save:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save the statistics"""
+        self._next_save = time.monotonic() + self.save_interval
+        try:
+            self.stats.save(self.path)
+        except OSError as e:
+            logger.warning(f"Could not save log statistics to {self.path}: {e}")
+
+    def close(self) -> None:
+        """Save and close"""
+        self.flush()
+        super().close()
+
+
+_cache: Dict[Path, Any] = {}
+
+
+def read_log_stats(path: Path) -> LogStats:
+    """
+    Statistics for API reads
+
+    Uses the live statistics when this process runs the log pipeline,
+    otherwise the saved file (reloaded only when it changes).
+
+    Args:
+        path: Statistics file
+
+    Returns:
+        LogStats
+    """
+    from src.utils.logger import get_log_stats_handler
+    handler = get_log_stats_handler()
+    if handler is not None and handler.path == Path(path):
+        return handler.stats
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return LogStats()
+    cached = _cache.get(Path(path))
+    if cached is None or cached[0] != mtime:
+        cached = _cache[Path(path)] = (mtime, LogStats.load(path))
+    return cached[1]
+
+
+def reset_log_stats(path: Path) -> None:
+    """
+    Start counting afresh, e.g. after the log file is cleared
+
+    Resets the live statistics when this process runs the log pipeline,
+    otherwise the saved file.
+
+    Args:
+        path: Statistics file
+    """
+    from src.utils.logger import get_log_stats_handler
+    handler = get_log_stats_handler()
+    if handler is not None and handler.path == Path(path):
+        handler.stats.reset()
+        handler.flush()
+        return
+    _cache.pop(Path(path), None)
+    if Path(path).exists():
+        LogStats().save(path)
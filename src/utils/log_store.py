@@ -0,0 +1,501 @@
+"""
+Log Store
+Indexed queries over the JSON log file and its rotated backups
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# numpy is imported where segment indexes are used, so importing the log
+# routes (and with them the dashboard server) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LEVEL_CODES = {"DEBUG": 1, "INFO": 2, "WARNING": 3, "ERROR": 4, "CRITICAL": 5}
+
+BLOCK_SIZE = 64 * 1024
+# Largest contiguous span read in one call when fetching indexed lines
+MAX_SPAN_READ = 4 * 1024 * 1024
+# Bytes at the start of a segment used to detect a reused inode
+HEAD_BYTES = 256
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Fields matched by the plain-text search filter
+SEARCH_FIELDS = ("message", "logger", "module")
+
+
+def parse_record(line: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse one JSON log line
+
+    Args:
+        line: Raw line bytes
+
+    Returns:
+        Record dictionary, or None if the line is not a JSON object
+    """
+    try:
+        record = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def matches_search(record: Dict[str, Any], needle: str) -> bool:
+    """
+    Check a record for a search term
+
+    Args:
+        record: Parsed log record
+        needle: Lower-case search term
+
+    Returns:
+        True if message, logger or module contains the term (case-insensitive)
+    """
+    return any(needle in str(record.get(field, "")).lower() for field in SEARCH_FIELDS)
+
+
+class _TimestampParser:
+    """Parse log timestamps to epoch seconds, caching the last value"""
+
+    def __init__(self):
+        self._last_text = None
+        self._last_value = 0.0
+
+    def __call__(self, text: Any) -> Optional[float]:
+        if text == self._last_text:
+            return self._last_value
+        try:
+            value = time.mktime(time.strptime(text, TIMESTAMP_FORMAT))
+        except (TypeError, ValueError):
+            return None
+        self._last_text, self._last_value = text, value
+        return value
+
+
+def iter_lines_reverse(path: Path, end: Optional[int] = None, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Yield complete lines of a file newest first, reading backward in blocks
+
+    A partial last line (still being written) is skipped. Cost is
+    proportional to the bytes consumed, not the file size.
+
+    Args:
+        path: File path
+        end: Byte offset to treat as end of file (defaults to the file size)
+        block_size: Bytes read per step
+
+    Yields:
+        Non-empty lines without newlines
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        buffer = b""
+        trailing = True
+        while position > 0:
+            start = max(position - block_size, 0)
+            f.seek(start)
+            buffer = f.read(position - start) + buffer
+            position = start
+            if trailing:
+                cut = buffer.rfind(b"\n")
+                if cut < 0:
+                    continue
+                buffer = buffer[:cut]
+                trailing = False
+            parts = buffer.split(b"\n")
+            buffer = parts.pop(0) if position > 0 else b""
+            for line in reversed(parts):
+                if line:
+                    yield line
+
+
+def read_tail(path: Path, count: int, end: Optional[int] = None) -> List[bytes]:
+    """
+    Read the last complete lines of a file
+
+    Args:
+        path: File path
+        count: Number of lines wanted
+        end: Byte offset to treat as end of file
+
+    Returns:
+        Up to `count` lines, oldest first
+    """
+    lines = []
+    for line in iter_lines_reverse(path, end):
+        if len(lines) >= count:
+            break
+        lines.append(line)
+    lines.reverse()
+    return lines
+
+
+class SegmentIndex:
+    """
+    Sidecar index of one log segment
+
+    Column arrays with one entry per complete line: start offset, level code
+    and timestamp. Level and time filters become vectorised masks, and the
+    sorted timestamps turn time ranges into a binary search. The index is
+    extended incrementally from ``size`` (the end of the last indexed line).
+    """
+
+    __slots__ = ("offsets", "levels", "times", "size", "head")
+
+    def __init__(self):
+        import numpy as np
+        self.offsets = np.zeros(0, dtype=np.int64)
+        self.levels = np.zeros(0, dtype=np.uint8)
+        self.times = np.zeros(0, dtype=np.float64)
+        self.size = 0
+        self.head = b""
+
+    @property
+    def ends(self) -> "np.ndarray":
+        """End offset (exclusive, before the newline) of every line"""
+        if not len(self.offsets):
+            return self.offsets
+        import numpy as np
+        return np.append(self.offsets[1:], self.size) - 1
+
+    def extend(self, path: Path) -> bool:
+        """
+        Index lines appended since the last call
+
+        Args:
+            path: Segment file
+
+        Returns:
+            True if new lines were indexed
+        """
+        with open(path, "rb") as f:
+            if not self.head:
+                self.head = f.read(HEAD_BYTES)
+            f.seek(self.size)
+            data = f.read()
+        cut = data.rfind(b"\n")
+        if cut < 0:
+            return False
+        data = data[:cut + 1]
+
+        parse_time = _TimestampParser()
+        last_time = float(self.times[-1]) if len(self.times) else 0.0
+        offsets, levels, times = [], [], []
+        position = self.size
+        for line in data.split(b"\n")[:-1]:
+            record = parse_record(line) if line else None
+            if record is not None:
+                level = LEVEL_CODES.get(record.get("level"), 0)
+                timestamp = parse_time(record.get("timestamp"))
+                if timestamp is not None and timestamp >= last_time:
+                    last_time = timestamp
+                offsets.append(position)
+                levels.append(level)
+                times.append(last_time)
+            position += len(line) + 1
+
+        self.size = position
+        if offsets:
+            import numpy as np
+            self.offsets = np.concatenate((self.offsets, np.asarray(offsets, dtype=np.int64)))
+            self.levels = np.concatenate((self.levels, np.asarray(levels, dtype=np.uint8)))
+            self.times = np.concatenate((self.times, np.asarray(times, dtype=np.float64)))
+        return True
+
+    def select(self, level: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Find lines matching level and time filters
+
+        Args:
+            level: Exact level name
+            since: Earliest epoch seconds (inclusive)
+            until: Latest epoch seconds (inclusive)
+
+        Returns:
+            (start offsets, end offsets) of matching lines, oldest first
+        """
+        import numpy as np
+        lo = int(np.searchsorted(self.times, since, side="left")) if since is not None else 0
+        hi = int(np.searchsorted(self.times, until, side="right")) if until is not None else len(self.times)
+        starts, ends = self.offsets[lo:hi], self.ends[lo:hi]
+        if level:
+            mask = self.levels[lo:hi] == LEVEL_CODES.get(level.upper(), 255)
+            starts, ends = starts[mask], ends[mask]
+        return starts, ends
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically"""
+        import numpy as np
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, offsets=self.offsets, levels=self.levels, times=self.times,
+                     size=np.int64(self.size), head=np.frombuffer(self.head, dtype=np.uint8))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentIndex":
+        """Read an index written by save()"""
+        import numpy as np
+        index = cls()
+        with np.load(path) as data:
+            index.offsets = data["offsets"]
+            index.levels = data["levels"]
+            index.times = data["times"]
+            index.size = int(data["size"])
+            index.head = data["head"].tobytes()
+        return index
+
+
+class LogStore:
+    """
+    Log store
+
+    Answers dashboard log queries without reading whole files. Unfiltered
+    tail queries read backward from EOF in blocks; level and time filters
+    use a per-segment sidecar index (persisted under ``index_dir`` and keyed
+    by inode, so it survives rotation renames). The current file and the
+    rotated backups ``zema.log.1..N`` are queried newest first, then the
+    compressed archives in ``archive_dir``, decompressing only the frames
+    whose time range and levels can match.
+    """
+
+    def __init__(self, log_file: Path, backup_count: int = 5, index_dir: Optional[Path] = None,
+                 archive_dir: Optional[Path] = None):
+        """
+        Initialize log store
+
+        Args:
+            log_file: Current log file
+            backup_count: Number of rotated backups to include
+            index_dir: Directory for sidecar indexes (defaults to <log dir>/.index)
+            archive_dir: Directory of compressed archives (optional)
+        """
+        self.log_file = Path(log_file)
+        self.backup_count = backup_count
+        self.index_dir = Path(index_dir) if index_dir else self.log_file.parent / ".index"
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self._indexes: Dict[Tuple[int, int], SegmentIndex] = {}
+        self._archives: Dict[Path, Any] = {}
+        self._lock = threading.Lock()
+
+    def segments(self) -> List[Path]:
+        """
+        Existing segments, newest first
+
+        Returns:
+            Current file followed by rotated backups
+        """
+        candidates = [self.log_file] + [
+            self.log_file.with_name(f"{self.log_file.name}.{n}") for n in range(1, self.backup_count + 1)
+        ]
+        return [path for path in candidates if path.exists()]
+
+    def index(self, path: Path) -> SegmentIndex:
+        """
+        Get the up-to-date index of a segment
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Index covering every complete line
+        """
+        stat = path.stat()
+        key = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            index = self._indexes.get(key)
+            sidecar = self.index_dir / f"{stat.st_dev}-{stat.st_ino}.npz"
+            if index is None and sidecar.exists():
+                try:
+                    index = SegmentIndex.load(sidecar)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable log index {sidecar}: {e}")
+            if index is not None and (stat.st_size < index.size or not self._same_file(path, index)):
+                index = None  # Truncated or inode reused by a new file
+            if index is None:
+                index = SegmentIndex()
+                self._prune()
+            self._indexes[key] = index
+            if stat.st_size > index.size and index.extend(path):
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                index.save(sidecar)
+        return index
+
+    def query(
+        self,
+        limit: int = 100,
+        level: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        search: Optional[str] = None,
+        tail: bool = True,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query log records
+
+        Args:
+            limit: Maximum records
+            level: Exact level filter
+            since: Earliest epoch seconds
+            until: Latest epoch seconds
+            search: Case-insensitive substring of message, logger or module
+            tail: Newest records (True) or oldest records (False)
+            predicate: Extra filter applied to parsed records
+
+        Returns:
+            Matching records in chronological order
+        """
+        checks = []
+        if search:
+            needle = search.lower()
+            checks.append(lambda r: matches_search(r, needle))
+        if predicate:
+            checks.append(predicate)
+
+        def accept(record: Optional[Dict[str, Any]]) -> bool:
+            return record is not None and all(check(record) for check in checks)
+
+        results: List[Dict[str, Any]] = []
+        segments = self.segments() if tail else list(reversed(self.segments()))
+        if self.archive_dir is not None and not tail:
+            # Oldest first: archives precede the plain segments
+            results.extend(self._query_archives(limit, level, since, until, accept, tail))
+        for path in segments:
+            needed = limit - len(results)
+            if needed <= 0:
+                break
+            if tail and not (level or since is not None or until is not None):
+                found = self._scan_tail(path, needed, accept)
+            else:
+                starts, ends = self.index(path).select(level, since, until)
+                found = list(self._read_indexed(path, starts, ends, needed, accept, reverse=tail))
+            results.extend(found)
+        if self.archive_dir is not None and tail and len(results) < limit:
+            results.extend(self._query_archives(limit - len(results), level, since, until, accept, tail))
+        if tail:
+            results.reverse()
+        return results[:limit]
+
+    def _query_archives(self, needed: int, level: Optional[str], since: Optional[float],
+                        until: Optional[float], accept: Callable, tail: bool) -> List[Dict[str, Any]]:
+        """Matching records from compressed archives, in query order"""
+        from src.utils.log_archive import ArchiveSegment, list_archives
+
+        archives = list_archives(self.archive_dir)
+        if not tail:
+            archives.reverse()
+        parse_time = _TimestampParser()
+        found: List[Dict[str, Any]] = []
+        for path in archives:
+            archive = self._archives.get(path)
+            if archive is None:
+                archive = self._archives[path] = ArchiveSegment(path)
+            if (since is not None and archive.last_ts < since) or (until is not None and archive.first_ts > until):
+                continue
+            frames = archive.frames(level, since, until)
+            for frame in (reversed(frames) if tail else frames):
+                lines = archive.read_frame(int(frame))
+                for line in (reversed(lines) if tail else lines):
+                    record = parse_record(line)
+                    if record is None or (level and record.get("level") != level.upper()):
+                        continue
+                    if since is not None or until is not None:
+                        timestamp = parse_time(record.get("timestamp"))
+                        if timestamp is None or (since is not None and timestamp < since) \
+                                or (until is not None and timestamp > until):
+                            continue
+                    if accept(record):
+                        found.append(record)
+                        if len(found) >= needed:
+                            return found
+        self._archives = {path: self._archives[path] for path in archives if path in self._archives}
+        return found
+
+    def _scan_tail(self, path: Path, needed: int, accept: Callable) -> List[Dict[str, Any]]:
+        """Newest matching records of one segment, newest first, via backward reads"""
+        found: List[Dict[str, Any]] = []
+        for line in iter_lines_reverse(path):
+            record = parse_record(line)
+            if accept(record):
+                found.append(record)
+                if len(found) >= needed:
+                    break
+        return found
+
+    def _read_indexed(self, path: Path, starts: "np.ndarray", ends: "np.ndarray", needed: int,
+                      accept: Callable, reverse: bool) -> Iterator[Dict[str, Any]]:
+        """Read indexed lines in chunks, yielding accepted records"""
+        count = 0
+        total = len(starts)
+        chunk = max(needed, 64)
+        with open(path, "rb") as f:
+            position = total
+            done = 0
+            while count < needed and done < total:
+                if reverse:
+                    lo, hi = max(position - chunk, 0), position
+                    position = lo
+                else:
+                    lo, hi = done, min(done + chunk, total)
+                done += hi - lo
+                lines = _read_lines(f, starts[lo:hi], ends[lo:hi])
+                for line in (reversed(lines) if reverse else lines):
+                    record = parse_record(line)
+                    if accept(record):
+                        yield record
+                        count += 1
+                        if count >= needed:
+                            return
+                chunk = min(chunk * 4, 65536)
+
+    def _prune(self) -> None:
+        """Delete sidecar indexes of segments that no longer exist"""
+        live = set()
+        for path in self.segments():
+            stat = path.stat()
+            live.add(f"{stat.st_dev}-{stat.st_ino}.npz")
+        for key in [k for k in self._indexes if f"{k[0]}-{k[1]}.npz" not in live]:
+            del self._indexes[key]
+        if self.index_dir.exists():
+            for sidecar in self.index_dir.glob("*.npz"):
+                if sidecar.name not in live:
+                    sidecar.unlink(missing_ok=True)
+
+    @staticmethod
+    def _same_file(path: Path, index: SegmentIndex) -> bool:
+        """Check that a cached index belongs to this file's content"""
+        if not index.head:
+            return True
+        with open(path, "rb") as f:
+            return f.read(len(index.head)) == index.head
+
+
+def _read_lines(f, starts: "np.ndarray", ends: "np.ndarray") -> List[bytes]:
+    """Read lines by offset, coalescing nearby lines into one read"""
+    if not len(starts):
+        return []
+    if int(ends[-1]) - int(starts[0]) <= MAX_SPAN_READ:
+        base = int(starts[0])
+        f.seek(base)
+        data = f.read(int(ends[-1]) - base)
+        return [data[int(s) - base:int(e) - base] for s, e in zip(starts, ends)]
+    lines = []
+    for start, end in zip(starts, ends):
+        f.seek(int(start))
+        lines.append(f.read(int(end) - int(start)))
+    return lines
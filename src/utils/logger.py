@@ -3,14 +3,19 @@ Logging System for Zema AI
 Provides structured logging with console (rich) and file (JSON) handlers
 """
 
+import atexit
 import logging
 import asyncio
 import time
 import json
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from functools import wraps
-from typing import Callable, Any, TypeVar, Awaitable
+from typing import Callable, Any, Dict, Optional, TypeVar, Awaitable
+from src.utils.tracing import span_store
+from src.utils.log_index import FTS5_AVAILABLE, LogIndex, LogIndexHandler
+from src.utils.log_archive import ArchivingRotatingFileHandler, LogArchiver
+from src.utils.log_stats import LogStatsHandler
+from src.utils.log_pipeline import DROP_NEWEST, BatchRotatingFileHandler, LogPipeline, capture_stack, create_pipeline, skip_stack_file
 
 T = TypeVar('T')
 
@@ -21,8 +26,120 @@ except ImportError:
     RICH_AVAILABLE = False
     print("Warning: rich library not available. Using basic console handler.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional record attributes copied into JSON output
+CONTEXT_FIELDS = ("user_id", "request_id", "duration_ms", "memory_mb")
+
+# Formatter and decorator frames are noise in captured stacks
+skip_stack_file(__file__)
+
+# Active queue pipeline (set by setup_logging)
+_pipeline: Optional[LogPipeline] = None
+_archiver: Optional[LogArchiver] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    JSON formatter for structured logging - Industry Best Practices
+    
+    Built for throughput: static fields are computed once, timestamps are
+    cached per second, and records are encoded with orjson when installed.
+    Stack traces are only added when the call asks for one with
+    ``extra={"capture_stack": True}`` (captured on the calling thread by
+    the log pipeline) or ``stack_info=True``.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None,
+                 style: str = "%", static_fields: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """
+        Initialize JSON formatter
+        
+        Args:
+            fmt: Unused, accepted for dictConfig compatibility
+            datefmt: strftime format for the timestamp field
+            style: Unused, accepted for dictConfig compatibility
+            static_fields: Fields added to every record (e.g. host, app)
+        """
+        super().__init__(fmt, datefmt, style, **kwargs)
+        self.static_fields = dict(static_fields or {})
+        self._time_format = datefmt or "%Y-%m-%d %H:%M:%S"
+        self._last_second = -1
+        self._last_timestamp = ""
+    
+    def format_timestamp(self, created: float) -> str:
+        """Format a record time, reusing the string within the same second"""
+        second = int(created)
+        if second != self._last_second:
+            self._last_timestamp = time.strftime(self._time_format, self.converter(second))
+            self._last_second = second
+        return self._last_timestamp
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON with industry best practices"""
+        # Base log data structure (industry standard)
+        log_data = {
+            "timestamp": self.format_timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            "process": record.process,
+            **self.static_fields
+        }
+        
+        # Add exception info if present (with full traceback)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = {
+                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
+                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
+                "traceback": record.exc_text
+            }
+        
+        # Stack trace only on request
+        stack = getattr(record, "stack_trace", None)
+        if stack is None and getattr(record, "capture_stack", False):
+            stack = capture_stack()
+        if stack is not None:
+            log_data["stack_trace"] = stack
+        elif record.stack_info:
+            log_data["stack_info"] = record.stack_info
+        
+        # Add extra fields if present (for context)
+        extra = getattr(record, "extra", None)
+        if extra:
+            log_data.update(extra)
+        
+        # Add user and request context, performance metrics if available
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                log_data[field] = value
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, default=str).decode()
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
 
-def setup_logging(log_level: str = "INFO") -> None:
+def setup_logging(
+    log_level: str = "INFO",
+    queue_size: int = 10000,
+    drop_policy: str = DROP_NEWEST,
+    batch_size: int = 256,
+    flush_interval: float = 0.2,
+    index_path: Optional[str] = None,
+    retention_days: int = 30,
+    archive: bool = False
+) -> None:
     """
     Setup logging with console (rich) and file (JSON) handlers
     
@@ -30,15 +147,23 @@ def setup_logging(log_level: str = "INFO") -> None:
     
     Args:
         log_level: Minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        queue_size: Maximum records waiting for the listener thread
+        drop_policy: What to do when the queue is full (drop_newest, drop_oldest, block)
+        batch_size: Maximum records written to the file at once
+        flush_interval: Maximum seconds a record waits for its batch
+        index_path: SQLite database for the full-text log index (None disables it)
+        retention_days: Days of history kept in the log index and archive
+        archive: Compress rotated logs into data/logs/archive instead of deleting them
         
     Steps:
     1. Create logs directory if it doesn't exist
     2. Clear existing handlers
     3. Configure console handler (rich if available)
-    4. Configure file handler (JSON format)
+    4. Configure file handler (JSON format), statistics and the search index
     5. Set log levels
-    6. Add handlers to root logger
+    6. Route the root logger through a bounded queue to a listener thread
     """
+    global _pipeline, _archiver
     # Step 1: Create logs directory
     log_dir = Path("data/logs")
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -47,6 +172,12 @@ def setup_logging(log_level: str = "INFO") -> None:
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     logger.handlers.clear()
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
+    if _archiver is not None:
+        _archiver.stop()
+        _archiver = None
     
     # Step 3: Setup console handler
     if RICH_AVAILABLE:
@@ -67,148 +198,152 @@ def setup_logging(log_level: str = "INFO") -> None:
         console_handler.setFormatter(console_format)
     
     console_handler.setLevel(logging.INFO)
-    logger.addHandler(console_handler)
     
     # Step 4: Setup file handler with JSON formatting
     log_file = log_dir / "zema.log"
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
+    if archive:
+        # One plain backup stays fast to query; older segments are compressed
+        _archiver = LogArchiver(log_dir / "archive", retention_days)
+        _archiver.start()
+        file_handler = ArchivingRotatingFileHandler(
+            log_file,
+            _archiver,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=1,
+            encoding='utf-8'
+        )
+    else:
+        file_handler = BatchRotatingFileHandler(
+            log_file,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
     file_handler.setLevel(logging.DEBUG)
     
-    class JSONFormatter(logging.Formatter):
-        """JSON formatter for structured logging - Industry Best Practices"""
-        
-        def format(self, record: logging.LogRecord) -> str:
-            """Format log record as JSON with industry best practices"""
-            import traceback
-            import sys
-            
-            # Base log data structure (industry standard)
-            log_data = {
-                "timestamp": self.formatTime(record, self.datefmt),
-                "level": record.levelname,
-                "logger": record.name,
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno,
-                "message": record.getMessage(),
-                "thread": record.threadName if hasattr(record, 'threadName') else None,
-                "process": record.process if hasattr(record, 'process') else None
-            }
-            
-            # Add exception info if present (with full traceback)
-            if record.exc_info:
-                log_data["exception"] = {
-                    "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                    "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                    "traceback": self.formatException(record.exc_info)
-                }
-            
-            # Add stack trace for DEBUG level (useful for debugging)
-            if record.levelno == logging.DEBUG and not record.exc_info:
-                try:
-                    stack = traceback.extract_stack()
-                    log_data["stack_trace"] = [
-                        {
-                            "file": frame.filename,
-                            "line": frame.lineno,
-                            "function": frame.name,
-                            "code": frame.line
-                        }
-                        for frame in stack[-5:]  # Last 5 frames
-                    ]
-                except Exception:
-                    pass  # Don't fail if stack trace extraction fails
-            
-            # Add extra fields if present (for context)
-            if hasattr(record, 'extra'):
-                log_data.update(record.extra)
-            
-            # Add user context if available
-            if hasattr(record, 'user_id'):
-                log_data["user_id"] = record.user_id
-            if hasattr(record, 'request_id'):
-                log_data["request_id"] = record.request_id
-            
-            # Add performance metrics if available
-            if hasattr(record, 'duration_ms'):
-                log_data["duration_ms"] = record.duration_ms
-            if hasattr(record, 'memory_mb'):
-                log_data["memory_mb"] = record.memory_mb
-            
-            return json.dumps(log_data, ensure_ascii=False)
-    
     file_formatter = JSONFormatter(
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers = [console_handler, file_handler, LogStatsHandler(log_dir / "stats.json")]
+    
+    if index_path and FTS5_AVAILABLE:
+        index_handler = LogIndexHandler(LogIndex(Path(index_path)), retention_days)
+        index_handler.setFormatter(file_formatter)
+        handlers.append(index_handler)
+    
+    # Step 5: Formatting and file writes happen on the listener thread
+    _pipeline = create_pipeline(
+        handlers,
+        queue_size=queue_size,
+        policy=drop_policy,
+        batch_size=batch_size,
+        flush_interval=flush_interval
+    )
+    logger.addHandler(_pipeline.handler)
     
-    # Step 5: Log initialization
+    # Step 6: Log initialization
     logger.info(f"Logging initialized with level: {log_level}")
 
 
 def log_performance(func: Callable) -> Callable:
     """
-    Decorator to log function execution time
+    Decorator to trace function execution time
     
     Usage:
         @log_performance
         async def my_function():
             pass
     
-    Automatically detects if function is async or sync.
+    Automatically detects if function is async or sync. Each call becomes a
+    span in the trace store and a sample in the performance histograms.
+    When tracing is disabled no span is recorded, but failures are still
+    logged with their duration and traceback.
     """
+    func_name = f"{func.__module__}.{func.__qualname__}"
+    component = func.__module__.split(".")[1] if func.__module__.startswith("src.") else func.__module__
+    func_logger = logging.getLogger(func.__module__)
+
+    def finished(start: float, error: Optional[BaseException], traced: bool = True) -> None:
+        """Record the span (if tracing) and log the outcome"""
+        duration_ms = (time.perf_counter() - start) * 1000
+        if traced:
+            span_store.add(func.__qualname__, component, time.time() - duration_ms / 1000, duration_ms,
+                           type(error).__name__ if error else None)
+        if error is not None:
+            func_logger.error(f"{func_name} failed after {duration_ms:.2f}ms: {error}", exc_info=True)
+        elif func_logger.isEnabledFor(logging.DEBUG):
+            func_logger.debug(f"{func_name} completed in {duration_ms:.2f}ms", extra={"duration_ms": duration_ms})
+
     if asyncio.iscoroutinefunction(func):
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            """Internal async wrapper for performance logging"""
-            logger = logging.getLogger(func.__module__)
-            start = time.time()
-            func_name = f"{func.__module__}.{func.__name__}"
-            
+            """Internal async wrapper for performance tracing"""
+            traced = span_store.enabled
+            start = time.perf_counter()
             try:
-                logger.debug(f"Starting {func_name}")
                 result = await func(*args, **kwargs)
-                duration_ms = (time.time() - start) * 1000
-                logger.debug(f"{func_name} completed in {duration_ms:.2f}ms")
-                return result
             except Exception as e:
-                duration_ms = (time.time() - start) * 1000
-                logger.error(
-                    f"{func_name} failed after {duration_ms:.2f}ms: {e}",
-                    exc_info=True
-                )
+                finished(start, e, traced)
                 raise
+            if traced:
+                finished(start, None)
+            return result
         return async_wrapper
     else:
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            """Internal sync wrapper for performance logging"""
-            logger = logging.getLogger(func.__module__)
-            start = time.time()
-            func_name = f"{func.__module__}.{func.__name__}"
-            
+            """Internal sync wrapper for performance tracing"""
+            traced = span_store.enabled
+            start = time.perf_counter()
             try:
-                logger.debug(f"Starting {func_name}")
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start) * 1000
-                logger.debug(f"{func_name} completed in {duration_ms:.2f}ms")
-                return result
             except Exception as e:
-                duration_ms = (time.time() - start) * 1000
-                logger.error(
-                    f"{func_name} failed after {duration_ms:.2f}ms: {e}",
-                    exc_info=True
-                )
+                finished(start, e, traced)
                 raise
+            if traced:
+                finished(start, None)
+            return result
         return sync_wrapper
 
 
+def get_log_pipeline() -> Optional[LogPipeline]:
+    """
+    Get the active log pipeline
+    
+    Returns:
+        Pipeline installed by setup_logging, or None before setup
+    """
+    return _pipeline
+
+
+def get_log_stats_handler() -> Optional[LogStatsHandler]:
+    """
+    Get the statistics handler of the active log pipeline
+    
+    Returns:
+        LogStatsHandler, or None before setup
+    """
+    if _pipeline is None:
+        return None
+    for handler in _pipeline.listener.handlers:
+        if isinstance(handler, LogStatsHandler):
+            return handler
+    return None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _pipeline, _archiver
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
+    if _archiver is not None:
+        _archiver.stop()
+        _archiver = None
+    logging.getLogger().handlers.clear()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module
@@ -221,3 +356,5 @@ def get_logger(name: str) -> logging.Logger:
     """
     return logging.getLogger(name)
 
+
+atexit.register(shutdown_logging)
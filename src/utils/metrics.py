@@ -0,0 +1,278 @@
+"""
+Metrics Export
+Prometheus text exposition from preaggregated counters, gauges and histograms
+"""
+
+import bisect
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from src.utils.performance import BUCKET_BOUNDS_MS, PerformanceMonitor
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Exported histogram buckets in seconds; internal log buckets are folded into these
+EXPORT_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Index of the last internal bucket that fits under each exported bound
+_EXPORT_INDICES = [bisect.bisect_right(BUCKET_BOUNDS_MS, bound * 1000) - 1 for bound in EXPORT_BUCKETS_SECONDS]
+
+# One exposition line: (metric name, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+
+
+class MetricsRegistry:
+    """
+    Metrics registry
+
+    Counters and gauges are updated in place by instrumented code. Components
+    that already keep their own aggregates (performance histograms, executor
+    and event bus counters) register a collector that reads them at scrape
+    time, so rendering never touches raw samples.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+        self._collectors: List[Collector] = []
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        """
+        Declare a metric family
+
+        Args:
+            name: Metric name
+            kind: counter or gauge
+            help_text: HELP line text
+        """
+        with self._lock:
+            self._families[name] = (kind, help_text)
+            self._values.setdefault(name, {})
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Increase a counter"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+
+    def register_collector(self, collector: Collector) -> None:
+        """
+        Add a scrape-time collector
+
+        Args:
+            collector: Callable returning (name, kind, help, samples) families
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Collector) -> None:
+        """Remove a collector added with register_collector"""
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text format
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+        with self._lock:
+            families = [
+                (name, kind, help_text, [(name, dict(key), value) for key, value in self._values[name].items()])
+                for name, (kind, help_text) in self._families.items()
+            ]
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                logger.error(f"Metrics collector failed: {e}")
+        for name, kind, help_text, samples in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Format a label set"""
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value"""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def performance_collector(monitor: PerformanceMonitor) -> Collector:
+    """
+    Export PerformanceMonitor histograms
+
+    Args:
+        monitor: Performance monitor
+
+    Returns:
+        Collector producing zema_operation_duration_seconds
+    """
+    def collect():
+        name = "zema_operation_duration_seconds"
+        samples: List[Sample] = []
+        for (component, operation), counts, count, total in monitor.snapshot():
+            labels = {"component": component, "operation": operation}
+            cumulative = list(itertools.accumulate(counts.tolist()))
+            for bound, index in zip(EXPORT_BUCKETS_SECONDS, _EXPORT_INDICES):
+                samples.append((f"{name}_bucket", {**labels, "le": repr(bound)}, cumulative[index] if index >= 0 else 0))
+            samples.append((f"{name}_bucket", {**labels, "le": "+Inf"}, count))
+            samples.append((f"{name}_sum", labels, total / 1000))
+            samples.append((f"{name}_count", labels, count))
+        return [(name, "histogram", "Duration of recorded operations", samples)]
+    return collect
+
+
+def executor_collector(executor: Any) -> Collector:
+    """
+    Export InferenceExecutor counters
+
+    Args:
+        executor: InferenceExecutor
+
+    Returns:
+        Collector producing zema_inference_* families
+    """
+    def collect():
+        stats = executor.get_stats()
+        return [
+            ("zema_inference_queue_depth", "gauge", "Inference jobs waiting for a worker", [("zema_inference_queue_depth", {}, stats["queued"])]),
+            ("zema_inference_running", "gauge", "Inference jobs currently running", [("zema_inference_running", {}, stats["running"])]),
+            ("zema_inference_workers", "gauge", "Inference worker threads", [("zema_inference_workers", {}, stats["workers"])]),
+            ("zema_inference_jobs_total", "counter", "Finished inference jobs", [
+                ("zema_inference_jobs_total", {"result": "completed"}, stats["completed"]),
+                ("zema_inference_jobs_total", {"result": "failed"}, stats["failed"]),
+            ]),
+            ("zema_inference_busy_seconds_total", "counter", "Worker time spent running jobs", [("zema_inference_busy_seconds_total", {}, stats["busy_seconds"])]),
+        ]
+    return collect
+
+
+def event_bus_collector(bus: Any) -> Collector:
+    """
+    Export EventBus delivery counters and latencies
+
+    Args:
+        bus: EventBus
+
+    Returns:
+        Collector producing zema_event_* families
+    """
+    def collect():
+        metrics = bus.get_metrics()
+        topics = metrics["topics"].items()
+        families = []
+        for field, name, help_text in (
+            ("emitted", "zema_events_emitted_total", "Events emitted per topic"),
+            ("delivered", "zema_events_delivered_total", "Event deliveries per topic"),
+            ("dropped", "zema_events_dropped_total", "Events dropped by subscriber queues per topic"),
+        ):
+            families.append((name, "counter", help_text, [(name, {"topic": t}, s[field]) for t, s in topics]))
+        families.append((
+            "zema_event_delivery_latency_seconds_total", "counter", "Sum of emit-to-delivery latency per topic",
+            [("zema_event_delivery_latency_seconds_total", {"topic": t}, s["latency_sum_ms"] / 1000) for t, s in topics]
+        ))
+        families.append((
+            "zema_event_delivery_latency_max_seconds", "gauge", "Maximum emit-to-delivery latency per topic",
+            [("zema_event_delivery_latency_max_seconds", {"topic": t}, s["latency_max_ms"] / 1000) for t, s in topics]
+        ))
+        families.append((
+            "zema_event_queue_depth", "gauge", "Pending events per subscriber",
+            [
+                ("zema_event_queue_depth", {"topic": s["event_type"], "subscriber": s["subscriber"]}, s["queue_depth"])
+                for s in metrics["subscribers"]
+            ]
+        ))
+        return families
+    return collect
+
+
+def log_pipeline_collector() -> Collector:
+    """
+    Export log queue counters of the active pipeline
+
+    Returns:
+        Collector producing zema_log_* families (empty before setup_logging)
+    """
+    def collect():
+        from src.utils.logger import get_log_pipeline
+        pipeline = get_log_pipeline()
+        if pipeline is None:
+            return []
+        stats = pipeline.get_stats()
+        return [
+            ("zema_log_queue_depth", "gauge", "Log records waiting for the writer thread", [("zema_log_queue_depth", {}, stats["queue_depth"])]),
+            ("zema_log_records_written_total", "counter", "Log records written by the listener", [("zema_log_records_written_total", {}, stats["written"])]),
+            ("zema_log_records_dropped_total", "counter", "Log records dropped because the queue was full", [
+                ("zema_log_records_dropped_total", {"level": level}, count) for level, count in stats["dropped"].items()
+            ]),
+        ]
+    return collect
+
+
+def scene_cache_collector(analyzer: Any) -> Collector:
+    """
+    Export SceneAnalyzer description cache counters
+
+    Args:
+        analyzer: SceneAnalyzer
+
+    Returns:
+        Collector producing zema_scene_cache_* families
+    """
+    def collect():
+        stats = analyzer.get_cache_stats()
+        return [
+            ("zema_scene_cache_lookups_total", "counter", "Scene description lookups", [
+                ("zema_scene_cache_lookups_total", {"result": "hit"}, stats["hits"]),
+                ("zema_scene_cache_lookups_total", {"result": "miss"}, stats["misses"]),
+            ]),
+            ("zema_scene_cache_hit_ratio", "gauge", "Share of scene description lookups served without an LLM call",
+             [("zema_scene_cache_hit_ratio", {}, stats["hit_rate"])]),
+            ("zema_scene_cache_entries", "gauge", "Cached scene descriptions", [("zema_scene_cache_entries", {}, stats["size"])]),
+        ]
+    return collect
+
+
+# Process-wide registry scraped by GET /metrics
+registry = MetricsRegistry()
+
+registry.describe("zema_llm_tokens_total", "counter", "Tokens generated by the LLM")
+registry.describe("zema_llm_generation_seconds_total", "counter", "Time the LLM spent generating tokens")
+registry.describe("zema_llm_tokens_per_second", "gauge", "Generation speed of the most recent LLM response")
+registry.describe("zema_llm_time_to_first_token_seconds", "gauge", "Time to first token of the most recent streamed LLM response")
+registry.describe("zema_stt_audio_seconds_total", "counter", "Audio transcribed by speech-to-text")
+registry.describe("zema_stt_processing_seconds_total", "counter", "Time spent transcribing audio")
+registry.describe("zema_stt_real_time_factor", "gauge", "Processing time over audio duration of the most recent transcription")
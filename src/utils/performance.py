@@ -3,108 +3,266 @@ Performance Monitoring
 Tracks system and component performance metrics
 """
 
-import time
-import psutil
+import math
+import threading
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from src.utils.system_sampler import get_system_sampler
+
+# numpy is imported where histograms are built, so importing this module
+# (and with it the dashboard server) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Histogram range and resolution: log-spaced buckets with ~2.5% relative error
+HISTOGRAM_MIN_MS = 0.001
+HISTOGRAM_MAX_MS = 600_000.0
+HISTOGRAM_GROWTH = 1.05
+
+_LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+_BUCKET_COUNT = int(math.ceil(math.log(HISTOGRAM_MAX_MS / HISTOGRAM_MIN_MS) / _LOG_GROWTH)) + 1
+# Upper bound of every bucket; bucket 0 also absorbs values below the minimum
+BUCKET_BOUNDS_MS = tuple(HISTOGRAM_MIN_MS * HISTOGRAM_GROWTH ** i for i in range(1, _BUCKET_COUNT + 1))
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-bucketed latency histogram
+
+    Recording is O(1) and memory is constant regardless of sample count.
+    Quantiles are accurate to one bucket (about 5%) and clamped to the
+    exact observed min and max.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        import numpy as np
+        self.counts = np.zeros(_BUCKET_COUNT, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """
+        Add one observation
 
-@dataclass
-class PerformanceMetric:
-    """Single performance metric"""
-    component: str
-    operation: str
-    duration_ms: float
-    timestamp: datetime
-    memory_mb: float
-    cpu_percent: float
+        Args:
+            value_ms: Duration in milliseconds
+        """
+        if value_ms > HISTOGRAM_MIN_MS:
+            index = min(int(math.log(value_ms / HISTOGRAM_MIN_MS) / _LOG_GROWTH), _BUCKET_COUNT - 1)
+        else:
+            index = 0
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's observations to this one
+
+        Args:
+            other: Histogram to merge
+        """
+        self.counts += other.counts
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantiles(self, quantiles: Tuple[float, ...] = DEFAULT_QUANTILES) -> List[float]:
+        """
+        Estimate quantiles
+
+        Args:
+            quantiles: Quantiles in [0, 1]
+
+        Returns:
+            Estimated values in milliseconds (0.0 when empty)
+        """
+        if not self.count:
+            return [0.0 for _ in quantiles]
+        import numpy as np
+        cumulative = np.cumsum(self.counts)
+        ranks = np.ceil(np.asarray(quantiles) * self.count).clip(1, self.count)
+        indices = np.searchsorted(cumulative, ranks)
+        return [float(min(max(BUCKET_BOUNDS_MS[i], self.min), self.max)) for i in indices]
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Cumulative counts at each non-empty bucket's upper bound
+
+        Returns:
+            List of (upper_bound_ms, cumulative_count)
+        """
+        import numpy as np
+        cumulative = np.cumsum(self.counts)
+        return [(float(BUCKET_BOUNDS_MS[i]), int(cumulative[i])) for i in np.flatnonzero(self.counts)]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarise the histogram
+
+        Returns:
+            count, avg/min/max and p50/p90/p95/p99 in milliseconds
+        """
+        if not self.count:
+            return {}
+        p50, p90, p95, p99 = self.quantiles(DEFAULT_QUANTILES)
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count,
+            'min_ms': self.min,
+            'max_ms': self.max,
+            'p50_ms': p50,
+            'p90_ms': p90,
+            'p95_ms': p95,
+            'p99_ms': p99
+        }
 
 
 class PerformanceMonitor:
-    """Monitor system and component performance"""
-    
+    """
+    Monitor system and component performance
+
+    Durations go into one ``LatencyHistogram`` per (component, operation),
+    so recording is O(1) and memory does not grow with traffic. System
+    resource figures come from the background ``SystemSampler`` and are
+    never read on the record path.
+    """
+
     def __init__(self, alert_threshold_ms: float = 1000.0):
         """
         Initialize performance monitor
-        
+
         Args:
             alert_threshold_ms: Alert threshold in milliseconds
         """
-        self.metrics: List[PerformanceMetric] = []
         self.alert_threshold_ms = alert_threshold_ms
-        self.component_stats = defaultdict(list)
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
         logger.info("PerformanceMonitor initialized")
-    
+
     def record(self, component: str, operation: str, duration_ms: float):
         """
         Record a performance metric
-        
+
         Args:
             component: Component name
             operation: Operation name
             duration_ms: Duration in milliseconds
         """
-        metric = PerformanceMetric(
-            component=component,
-            operation=operation,
-            duration_ms=duration_ms,
-            timestamp=datetime.now(),
-            memory_mb=psutil.virtual_memory().used / 1024 / 1024,
-            cpu_percent=psutil.cpu_percent()
-        )
-        
-        self.metrics.append(metric)
-        self.component_stats[component].append(duration_ms)
-        
+        key = (component, operation)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(duration_ms)
+
         # Alert on slow operations
         if duration_ms > self.alert_threshold_ms:
             logger.warning(
                 f"Slow operation detected: {component}.{operation} "
                 f"took {duration_ms:.2f}ms"
             )
-        
-        # Keep only last 1000 metrics
-        if len(self.metrics) > 1000:
-            self.metrics = self.metrics[-1000:]
-    
+
     def get_component_stats(self, component: str) -> Dict[str, float]:
         """
         Get statistics for a component
-        
+
         Args:
             component: Component name
-            
+
         Returns:
-            Statistics dictionary
+            Statistics dictionary across all of the component's operations
         """
-        if component not in self.component_stats:
-            return {}
-        
-        durations = self.component_stats[component]
-        return {
-            'count': len(durations),
-            'avg_ms': sum(durations) / len(durations),
-            'min_ms': min(durations),
-            'max_ms': max(durations),
-            'p95_ms': sorted(durations)[int(len(durations) * 0.95)] if durations else 0
-        }
-    
+        merged = LatencyHistogram()
+        with self._lock:
+            for (name, _), histogram in self.histograms.items():
+                if name == component:
+                    merged.merge(histogram)
+        return merged.summary()
+
+    def get_operation_stats(self, component: str, operation: str) -> Dict[str, float]:
+        """
+        Get statistics for one operation of a component
+
+        Args:
+            component: Component name
+            operation: Operation name
+
+        Returns:
+            Statistics dictionary (empty if nothing was recorded)
+        """
+        with self._lock:
+            histogram = self.histograms.get((component, operation))
+            return histogram.summary() if histogram else {}
+
+    def get_all_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Get statistics for every recorded operation
+
+        Returns:
+            Nested mapping component -> operation -> statistics
+        """
+        stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        with self._lock:
+            for (component, operation), histogram in self.histograms.items():
+                stats.setdefault(component, {})[operation] = histogram.summary()
+        return stats
+
+    def snapshot(self) -> List[Tuple[Tuple[str, str], "np.ndarray", int, float]]:
+        """
+        Copy the raw histogram state for export
+
+        Returns:
+            List of ((component, operation), bucket counts, count, total_ms)
+        """
+        with self._lock:
+            return [(key, h.counts.copy(), h.count, h.total) for key, h in self.histograms.items()]
+
     def get_system_stats(self) -> Dict[str, float]:
         """
         Get current system statistics
-        
+
         Returns:
-            System stats dictionary
+            System stats dictionary (latest background sample)
         """
+        sample = get_system_sampler().latest()
         return {
-            'cpu_percent': psutil.cpu_percent(),
-            'memory_percent': psutil.virtual_memory().percent,
-            'memory_mb': psutil.virtual_memory().used / 1024 / 1024,
-            'disk_percent': psutil.disk_usage('/').percent
+            'cpu_percent': sample['cpu_percent'],
+            'memory_percent': sample['memory_percent'],
+            'memory_mb': sample['memory_mb'],
+            'disk_percent': sample['disk_percent'],
+            'temperature_c': sample['temperature_c'],
+            'process_rss_mb': sample['process_rss_mb']
         }
 
+
+_monitor: Optional[PerformanceMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_performance_monitor() -> PerformanceMonitor:
+    """
+    Get the process-wide performance monitor
+
+    Returns:
+        Shared PerformanceMonitor instance (created on first use)
+    """
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = PerformanceMonitor()
+    return _monitor
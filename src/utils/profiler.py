@@ -0,0 +1,125 @@
+"""
+Sampling Profiler
+Low-overhead stack sampling across all threads
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.005  # 200 Hz
+MAX_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler
+
+    A background thread snapshots every thread's stack with
+    ``sys._current_frames()`` at a fixed interval and counts identical
+    stacks. Profiled code is never traced or instrumented, so the overhead is
+    the sampling thread's own time (well under 5% at 200 Hz). Output is the
+    collapsed-stack format (``thread;outer;inner count``) understood by
+    flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize sampling profiler
+
+        Args:
+            interval: Seconds between stack samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+
+    def run(self, duration: float) -> str:
+        """
+        Sample all threads for a while (blocks the calling thread)
+
+        Args:
+            duration: Seconds to sample
+
+        Returns:
+            Collapsed stacks, one "frames count" line per unique stack
+        """
+        if not _profile_lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        try:
+            logger.info(f"Profiling all threads for {duration:.1f}s every {self.interval * 1000:.1f}ms")
+            own = threading.get_ident()
+            deadline = time.monotonic() + duration
+            next_sample = time.monotonic()
+            while next_sample < deadline:
+                self._sample(own)
+                next_sample += self.interval
+                delay = next_sample - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            logger.info(f"Profile finished: {self.samples} samples, {len(self._stacks)} unique stacks")
+            return self.collapsed()
+        finally:
+            _profile_lock.release()
+
+    def collapsed(self) -> str:
+        """
+        Render the collected samples in collapsed-stack format
+
+        Returns:
+            Text with one stack per line, most frequent first
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def _sample(self, own_thread: int) -> None:
+        """Record the current stack of every other thread"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_thread:
+                continue
+            frames = []
+            while frame is not None and len(frames) < MAX_DEPTH:
+                frames.append(self._label(frame.f_code))
+                frame = frame.f_back
+            frames.append(names.get(ident, f"thread-{ident}").replace(";", ":"))
+            self._stacks[";".join(reversed(frames))] += 1
+        self.samples += 1
+
+    def _label(self, code) -> str:
+        """Cached 'module:function:line' label for a code object"""
+        label = self._labels.get(code)
+        if label is None:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            label = self._labels[code] = f"{module}:{code.co_name}:{code.co_firstlineno}".replace(";", ":")
+        return label
+
+
+_profile_lock = threading.Lock()
+
+
+def profile(duration: float, interval: Optional[float] = None) -> str:
+    """
+    Profile all threads and return collapsed stacks
+
+    Args:
+        duration: Seconds to sample
+        interval: Seconds between samples (default 5 ms)
+
+    Returns:
+        Collapsed-stack text
+
+    Raises:
+        ProfilerBusyError: If another profile is running
+    """
+    return SamplingProfiler(interval or DEFAULT_INTERVAL).run(duration)
@@ -0,0 +1,213 @@
+"""
+System Sampler
+Background sampling of host and process resource usage
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+# numpy is imported when the sampler is created, so importing this module
+# (and with it the dashboard server) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Columns of the ring buffer, in order
+FIELDS = (
+    "timestamp",
+    "cpu_percent",
+    "memory_percent",
+    "memory_mb",
+    "disk_percent",
+    "temperature_c",
+    "process_rss_mb",
+)
+_COLUMN = {name: index for index, name in enumerate(FIELDS)}
+
+MB = 1024 * 1024
+
+
+class SystemSampler:
+    """
+    System sampler
+
+    A daemon thread reads CPU, memory, disk, temperature and process RSS at
+    a fixed cadence into a preallocated numpy ring buffer. Readers never
+    call psutil: ``latest()`` is O(1) and ``history()`` downsamples the
+    buffered window for charts.
+    """
+
+    def __init__(self, interval: float = 1.0, capacity: int = 3600, disk_path: str = "/"):
+        """
+        Initialize system sampler
+
+        Args:
+            interval: Seconds between samples
+            capacity: Samples kept in the ring buffer
+            disk_path: Mount point reported as disk usage
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self.disk_path = disk_path
+        import numpy as np
+        self._buffer = np.full((capacity, len(FIELDS)), np.nan)
+        self._next = 0
+        self._count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = psutil.Process(os.getpid()) if PSUTIL_AVAILABLE else None
+        self._has_temperatures = PSUTIL_AVAILABLE and hasattr(psutil, "sensors_temperatures")
+        if PSUTIL_AVAILABLE:
+            # Prime the counter so the first non-blocking reading is meaningful
+            psutil.cpu_percent(interval=None)
+        logger.info(f"SystemSampler initialized ({interval}s interval, {capacity} samples)")
+
+    @property
+    def running(self) -> bool:
+        """True while the sampling thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampling thread (takes one sample immediately)"""
+        if self.running:
+            return
+        self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def sample(self) -> None:
+        """Read all sources once and append a row"""
+        import numpy as np
+        row = np.full(len(FIELDS), np.nan)
+        row[0] = time.time()
+        if PSUTIL_AVAILABLE:
+            try:
+                memory = psutil.virtual_memory()
+                row[_COLUMN["cpu_percent"]] = psutil.cpu_percent(interval=None)
+                row[_COLUMN["memory_percent"]] = memory.percent
+                row[_COLUMN["memory_mb"]] = memory.used / MB
+                row[_COLUMN["disk_percent"]] = psutil.disk_usage(self.disk_path).percent
+                row[_COLUMN["process_rss_mb"]] = self._process.memory_info().rss / MB
+            except Exception as e:
+                logger.debug(f"System sample failed: {e}")
+            row[_COLUMN["temperature_c"]] = self._read_temperature()
+        self.append(row)
+
+    def append(self, row: "np.ndarray") -> None:
+        """
+        Write a row into the ring buffer
+
+        Args:
+            row: Values in FIELDS order
+        """
+        self._buffer[self._next] = row
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest(self) -> Dict[str, Optional[float]]:
+        """
+        Get the most recent sample in O(1)
+
+        Returns:
+            Mapping of field to value (None where unavailable)
+        """
+        if not self._count:
+            return {name: None for name in FIELDS}
+        row = self._buffer[(self._next - 1) % self.capacity]
+        return {name: _value(row[index]) for index, name in enumerate(FIELDS)}
+
+    def history(self, window: float = 300.0, points: int = 120) -> Dict[str, List[Optional[float]]]:
+        """
+        Get downsampled series for the recent window
+
+        Args:
+            window: Seconds of history
+            points: Maximum points per series (samples are averaged per bucket)
+
+        Returns:
+            Mapping of field to list of values, oldest first
+        """
+        rows = self._ordered()
+        if len(rows):
+            rows = rows[rows[:, 0] >= rows[-1, 0] - window]
+        if len(rows) > points > 0:
+            import numpy as np
+            starts = (np.arange(points) * len(rows)) // points
+            valid = ~np.isnan(rows)
+            sums = np.add.reduceat(np.where(valid, rows, 0.0), starts, axis=0)
+            counts = np.add.reduceat(valid, starts, axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rows = sums / counts
+        return {name: [_value(v) for v in rows[:, index]] for index, name in enumerate(FIELDS)}
+
+    def _ordered(self) -> "np.ndarray":
+        """Buffered rows, oldest first"""
+        if self._count < self.capacity:
+            return self._buffer[:self._count]
+        import numpy as np
+        return np.concatenate((self._buffer[self._next:], self._buffer[:self._next]))
+
+    def _read_temperature(self) -> float:
+        """Hottest sensor reading in Celsius, or NaN"""
+        if not self._has_temperatures:
+            return math.nan
+        try:
+            readings = [entry.current for entries in psutil.sensors_temperatures().values() for entry in entries]
+        except Exception:
+            self._has_temperatures = False
+            return math.nan
+        if not readings:
+            self._has_temperatures = False
+            return math.nan
+        return max(readings)
+
+    def _run(self) -> None:
+        """Sampling loop"""
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def _value(value: float) -> Optional[float]:
+    """Convert a buffer cell to a JSON-friendly value"""
+    return None if math.isnan(value) else round(float(value), 2)
+
+
+_sampler: Optional[SystemSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """
+    Get the process-wide system sampler, starting it on first use
+
+    Returns:
+        Running SystemSampler
+    """
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                from src.config.settings import settings
+                sampler = SystemSampler(settings.system_sample_interval, settings.system_history_size)
+                sampler.start()
+                _sampler = sampler
+    return _sampler
@@ -0,0 +1,150 @@
+"""
+Tracing
+In-memory span store for timing instrumented functions
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from src.utils.performance import get_performance_monitor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SPANS = 2048
+
+# Innermost open span in the current thread or task
+_current_span: ContextVar[Optional[str]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """A finished timed operation"""
+
+    __slots__ = ("name", "component", "start", "duration_ms", "thread", "error", "parent")
+
+    def __init__(self, name: str, component: str, start: float, duration_ms: float,
+                 thread: str, error: Optional[str], parent: Optional[str]):
+        self.name = name
+        self.component = component
+        self.start = start
+        self.duration_ms = duration_ms
+        self.thread = thread
+        self.error = error
+        self.parent = parent
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dictionary"""
+        return {
+            "name": self.name,
+            "component": self.component,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 3),
+            "thread": self.thread,
+            "error": self.error,
+            "parent": self.parent,
+        }
+
+
+class SpanStore:
+    """
+    Span store
+
+    Keeps the most recent finished spans in a bounded ring and feeds each
+    duration into the shared ``PerformanceMonitor`` histograms, so slow
+    spans show up in both the trace view and ``/metrics``.
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS, enabled: bool = True):
+        """
+        Initialize span store
+
+        Args:
+            max_spans: Number of recent spans to keep
+            enabled: Whether instrumentation records anything
+        """
+        self.enabled = enabled
+        self._spans: deque = deque(maxlen=max_spans)
+
+    def configure(self, enabled: bool, max_spans: Optional[int] = None) -> None:
+        """
+        Enable or disable tracing and resize the ring
+
+        Args:
+            enabled: Whether instrumentation records anything
+            max_spans: New ring size (keeps the newest spans)
+        """
+        self.enabled = enabled
+        if max_spans and max_spans != self._spans.maxlen:
+            self._spans = deque(self._spans, maxlen=max_spans)
+        logger.info(f"Tracing {'enabled' if enabled else 'disabled'} ({self._spans.maxlen} spans)")
+
+    @contextmanager
+    def span(self, name: str, component: str = "app") -> Iterator[None]:
+        """
+        Time a block as a span
+
+        Args:
+            name: Operation name
+            component: Component name used for the performance histogram
+        """
+        parent = _current_span.get()
+        token = _current_span.set(name)
+        wall = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            self.add(name, component, wall, (time.perf_counter() - start) * 1000, error, parent)
+
+    def add(self, name: str, component: str, start: float, duration_ms: float,
+            error: Optional[str] = None, parent: Optional[str] = None) -> None:
+        """
+        Record a finished span
+
+        Args:
+            name: Operation name
+            component: Component name
+            start: Wall-clock start time
+            duration_ms: Duration in milliseconds
+            error: Exception type name if the span failed
+            parent: Name of the enclosing span in the same thread or task
+        """
+        self._spans.append(Span(name, component, start, duration_ms, threading.current_thread().name, error, parent))
+        get_performance_monitor().record(component, name, duration_ms)
+
+    def recent(self, limit: int = 100, min_duration_ms: float = 0.0, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get recent spans, newest first
+
+        Args:
+            limit: Maximum spans to return
+            min_duration_ms: Only spans at least this slow
+            name: Only spans whose name contains this text
+
+        Returns:
+            List of span dictionaries
+        """
+        result = []
+        for span in reversed(list(self._spans)):
+            if span.duration_ms < min_duration_ms or (name and name not in span.name):
+                continue
+            result.append(span.to_dict())
+            if len(result) >= limit:
+                break
+        return result
+
+    def clear(self) -> None:
+        """Drop all stored spans"""
+        self._spans.clear()
+
+
+# Process-wide span store used by log_performance
+span_store = SpanStore()
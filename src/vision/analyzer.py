@@ -3,44 +3,236 @@ Scene Analyzer
 Analyzes scenes and generates natural language descriptions
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.core.event_bus import EventBus
+from src.utils.constants import MAX_CACHE_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Events that make every cached description stale (camera moved, lights
+# switched, user asked for a fresh look, ...)
+SCENE_INVALIDATION_EVENTS = ("scene_changed",)
+
+# Canonical detection signature: ((label, ((col, row), ...)), ...)
+SceneSignature = Tuple[Tuple[str, Tuple[Tuple[int, int], ...]], ...]
+
+_GRID_NAMES = {
+    3: (("top-left", "top", "top-right"),
+        ("left", "center", "right"),
+        ("bottom-left", "bottom", "bottom-right")),
+}
+
 
 class SceneAnalyzer:
     """
     Analyze scenes and describe them
-    
-    Combines object detection with LLM to generate descriptions
+
+    Combines object detection with LLM to generate descriptions.
+
+    Descriptions are cached by a canonical detection signature (labels,
+    counts and coarse grid positions), so repeated questions about an
+    unchanged scene are answered without another LLM round-trip.
     """
-    
-    def __init__(self, settings: Settings):
+
+    def __init__(self, settings: Settings, event_bus: Optional[EventBus] = None):
         """
         Initialize scene analyzer
-        
+
         Args:
             settings: Application settings
+            event_bus: Optional event bus; scene-change events invalidate the cache
         """
         self.settings = settings
-        logger.info("SceneAnalyzer initialized")
-    
+        self.cache_ttl = settings.vision_description_cache_ttl
+        self.grid_size = settings.vision_description_grid
+        self.confidence_threshold = settings.vision_confidence_threshold
+
+        self._cache: "OrderedDict[SceneSignature, Tuple[str, float]]" = OrderedDict()
+        self._inflight: Dict[SceneSignature, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+
+        self.event_bus = event_bus
+        if event_bus is not None:
+            for event_type in SCENE_INVALIDATION_EVENTS:
+                event_bus.subscribe(event_type, self._on_scene_changed)
+
+        logger.info(f"SceneAnalyzer initialized (cache ttl: {self.cache_ttl}s)")
+
     async def analyze(self, frame: np.ndarray, detector=None, llm_client=None) -> str:
         """
         Analyze scene and generate description
-        
+
         Args:
             frame: Camera frame
             detector: Optional detector instance
             llm_client: Optional LLM client
-            
+
         Returns:
             Natural language description of the scene
         """
-        # TODO: Implement scene analysis
-        logger.info("Analyzing scene...")
-        return "Scene analysis not yet implemented"
+        detections = await detector.detect(frame) if detector is not None else []
+        return await self.describe(detections, frame.shape[:2], llm_client)
+
+    @log_performance
+    async def describe(
+        self,
+        detections: List[Dict[str, Any]],
+        frame_size: Tuple[int, int],
+        llm_client=None
+    ) -> str:
+        """
+        Describe a set of detections, using the cache when possible
+
+        Args:
+            detections: Detection dictionaries with bbox, label, confidence
+            frame_size: Frame (height, width) in pixels
+            llm_client: Optional LLM client used on cache misses
+
+        Returns:
+            Natural language description of the scene
+        """
+        signature = self.signature(detections, frame_size)
+
+        cached = self._lookup(signature)
+        if cached is not None:
+            self._hits += 1
+            logger.debug("Scene description cache hit")
+            return cached
+
+        # Concurrent callers asking about the same scene share one LLM call
+        pending = self._inflight.get(signature)
+        if pending is not None:
+            self._hits += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading call was cancelled, not this one: take over the generation
+                self._hits -= 1
+                return await self.describe(detections, frame_size, llm_client)
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[signature] = future
+        try:
+            description = await self._generate_description(signature, llm_client)
+            self._store(signature, description)
+            future.set_result(description)
+            return description
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not warn at shutdown
+            future.exception()
+            raise
+        finally:
+            # Cancellation skips the handlers above; never leave followers waiting
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(signature, None)
+
+    def signature(self, detections: List[Dict[str, Any]], frame_size: Tuple[int, int]) -> SceneSignature:
+        """
+        Build the canonical cache key for a detection set
+
+        Objects are reduced to their label and the grid cell holding the
+        box centre, so small jitter between frames maps to the same key.
+
+        Args:
+            detections: Detection dictionaries with bbox, label, confidence
+            frame_size: Frame (height, width) in pixels
+
+        Returns:
+            Hashable, order-independent signature
+        """
+        height, width = frame_size
+        cells: Dict[str, List[Tuple[int, int]]] = {}
+        for detection in detections:
+            if detection.get("confidence", 1.0) < self.confidence_threshold:
+                continue
+            x1, y1, x2, y2 = detection["bbox"]
+            col = min(int((x1 + x2) / 2 / max(width, 1) * self.grid_size), self.grid_size - 1)
+            row = min(int((y1 + y2) / 2 / max(height, 1) * self.grid_size), self.grid_size - 1)
+            cells.setdefault(detection["label"], []).append((max(col, 0), max(row, 0)))
+        return tuple(sorted((label, tuple(sorted(positions))) for label, positions in cells.items()))
+
+    def invalidate(self) -> None:
+        """Drop all cached descriptions"""
+        self._cache.clear()
+        logger.debug("Scene description cache invalidated")
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        """
+        Get description cache statistics
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and size
+        """
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "size": len(self._cache),
+        }
+
+    def _on_scene_changed(self, data: Any) -> None:
+        """Event bus callback for scene-change events"""
+        self.invalidate()
+
+    def _lookup(self, signature: SceneSignature) -> Optional[str]:
+        """Return a fresh cached description or None"""
+        entry = self._cache.get(signature)
+        if entry is None:
+            return None
+        description, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[signature]
+            return None
+        self._cache.move_to_end(signature)
+        return description
+
+    def _store(self, signature: SceneSignature, description: str) -> None:
+        """Insert a description, evicting the least recently used entry when full"""
+        if self.cache_ttl <= 0:
+            return
+        self._cache[signature] = (description, time.monotonic() + self.cache_ttl)
+        self._cache.move_to_end(signature)
+        while len(self._cache) > MAX_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _summarize(self, signature: SceneSignature) -> str:
+        """Turn a signature into a compact, deterministic object summary"""
+        names = _GRID_NAMES.get(self.grid_size)
+        parts = []
+        for label, positions in signature:
+            if names:
+                where = ", ".join(sorted({names[row][col] for col, row in positions}))
+            else:
+                where = ", ".join(f"cell {col},{row}" for col, row in positions)
+            parts.append(f"{len(positions)} {label} ({where})")
+        return "; ".join(parts)
+
+    async def _generate_description(self, signature: SceneSignature, llm_client) -> str:
+        """Describe a signature, with the LLM when available"""
+        if not signature:
+            return "I don't see any objects I can recognize right now."
+
+        summary = self._summarize(signature)
+        if llm_client is None:
+            return f"I can see: {summary}."
 
+        logger.info("Generating scene description with LLM...")
+        prompt = (
+            "Describe this scene in one or two natural sentences for a voice reply. "
+            f"Detected objects with their positions in the camera frame: {summary}."
+        )
+        return await llm_client.generate(prompt, remember=False)
@@ -0,0 +1,297 @@
+"""
+Camera Calibration
+Computes, persists and applies camera intrinsics
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+CAMERA_MATRIX_FILE = "camera_matrix.npy"
+DIST_COEFFS_FILE = "dist_coeffs.npy"
+MAP_X_FILE = "undistort_map_x.npy"
+MAP_Y_FILE = "undistort_map_y.npy"
+METADATA_FILE = "calibration.json"
+
+
+class CameraCalibration:
+    """
+    Camera intrinsics with precomputed undistortion maps
+
+    Calibration is computed once from a checkerboard session and stored as
+    plain ``.npy`` files, so the (large) undistortion maps can be
+    memory-mapped at startup instead of recomputed. Undistorting a frame is
+    then a single ``cv2.remap`` call.
+
+    Frames at another resolution of the same sensor (same aspect ratio) use
+    intrinsics scaled to that size; other frame sizes are rejected.
+    """
+
+    def __init__(
+        self,
+        camera_matrix: np.ndarray,
+        dist_coeffs: np.ndarray,
+        image_size: Tuple[int, int],
+        map_x: Optional[np.ndarray] = None,
+        map_y: Optional[np.ndarray] = None,
+        rms_error: Optional[float] = None
+    ):
+        """
+        Initialize calibration
+
+        Args:
+            camera_matrix: 3x3 intrinsic matrix
+            dist_coeffs: Distortion coefficients
+            image_size: Calibrated image (width, height)
+            map_x: Optional precomputed undistortion x-map
+            map_y: Optional precomputed undistortion y-map
+            rms_error: Reprojection error reported by calibration
+        """
+        self.camera_matrix = np.asarray(camera_matrix, dtype=np.float64)
+        self.dist_coeffs = np.asarray(dist_coeffs, dtype=np.float64)
+        self.image_size = (int(image_size[0]), int(image_size[1]))
+        self.rms_error = rms_error
+        self.map_x = map_x
+        self.map_y = map_y
+        self._resized: Dict[Tuple[int, int], "CameraCalibration"] = {}
+        expected_shape = (self.image_size[1], self.image_size[0])
+        if self.map_x is not None and (self.map_x.shape != expected_shape or self.map_y is None
+                                       or self.map_y.shape != expected_shape):
+            logger.warning(f"Stored undistortion maps do not match {self.image_size}, rebuilding")
+            self.map_x = self.map_y = None
+        if self.map_x is None and self.dist_coeffs.any():
+            self._build_maps()
+
+    @property
+    def fx(self) -> float:
+        """Focal length along x in pixels"""
+        return float(self.camera_matrix[0, 0])
+
+    @property
+    def fy(self) -> float:
+        """Focal length along y in pixels"""
+        return float(self.camera_matrix[1, 1])
+
+    def scaled_matrix(self, image_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Intrinsic matrix for another resolution of the calibrated sensor
+
+        Args:
+            image_size: Frame (width, height)
+
+        Returns:
+            3x3 matrix with fx, cx scaled by the width ratio and fy, cy by the height ratio
+
+        Raises:
+            ValueError: If the aspect ratio differs from the calibrated one
+        """
+        width, height = int(image_size[0]), int(image_size[1])
+        scale_x, scale_y = width / self.image_size[0], height / self.image_size[1]
+        if abs(scale_x - scale_y) > 0.01 * max(scale_x, scale_y):
+            raise ValueError(
+                f"Frame size {width}x{height} does not match the calibrated aspect ratio "
+                f"({self.image_size[0]}x{self.image_size[1]}); recalibrate at this resolution"
+            )
+        matrix = self.camera_matrix.copy()
+        matrix[0] *= scale_x
+        matrix[1] *= scale_y
+        return matrix
+
+    def resized(self, image_size: Tuple[int, int]) -> "CameraCalibration":
+        """
+        Calibration for another resolution of the calibrated sensor
+
+        Scaled calibrations (and their undistortion maps) are cached per size.
+
+        Args:
+            image_size: Frame (width, height)
+
+        Returns:
+            This calibration if the size matches, otherwise a scaled copy
+
+        Raises:
+            ValueError: If the aspect ratio differs from the calibrated one
+        """
+        image_size = (int(image_size[0]), int(image_size[1]))
+        if image_size == self.image_size:
+            return self
+        if image_size not in self._resized:
+            self._resized[image_size] = CameraCalibration(
+                self.scaled_matrix(image_size), self.dist_coeffs, image_size, rms_error=self.rms_error
+            )
+        return self._resized[image_size]
+
+    @classmethod
+    def from_checkerboard(
+        cls,
+        frames: List[np.ndarray],
+        board_size: Tuple[int, int] = (9, 6),
+        square_size_mm: float = 25.0
+    ) -> "CameraCalibration":
+        """
+        Calibrate from frames showing a checkerboard
+
+        Args:
+            frames: BGR or grayscale frames of the board in varied poses
+            board_size: Inner corners per row and per column (cv2 patternSize)
+            square_size_mm: Board square size in millimetres
+
+        Returns:
+            New calibration
+
+        Raises:
+            RuntimeError: If OpenCV is missing or too few boards were found
+        """
+        if not CV2_AVAILABLE:
+            raise RuntimeError("opencv is required for camera calibration")
+
+        board = np.zeros((board_size[0] * board_size[1], 3), np.float32)
+        board[:, :2] = np.mgrid[0:board_size[0], 0:board_size[1]].T.reshape(-1, 2) * square_size_mm
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+
+        object_points, image_points = [], []
+        image_size = None
+        for frame in frames:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            image_size = gray.shape[::-1]
+            found, corners = cv2.findChessboardCorners(gray, board_size, None)
+            if not found:
+                continue
+            object_points.append(board)
+            image_points.append(cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria))
+
+        if len(image_points) < 3:
+            raise RuntimeError(f"Checkerboard found in only {len(image_points)} frames (need at least 3)")
+
+        rms, camera_matrix, dist_coeffs, _, _ = cv2.calibrateCamera(
+            object_points, image_points, image_size, None, None
+        )
+        logger.info(f"Camera calibrated from {len(image_points)} frames (rms error {rms:.3f}px)")
+        return cls(camera_matrix, dist_coeffs, image_size, rms_error=rms)
+
+    @classmethod
+    def from_fov(cls, image_size: Tuple[int, int], hfov_degrees: float) -> "CameraCalibration":
+        """
+        Approximate distortion-free intrinsics from the field of view
+
+        Args:
+            image_size: Image (width, height)
+            hfov_degrees: Horizontal field of view in degrees
+
+        Returns:
+            Pinhole calibration without undistortion maps
+        """
+        width, height = image_size
+        focal = (width / 2) / np.tan(np.radians(hfov_degrees) / 2)
+        camera_matrix = np.array([[focal, 0, width / 2], [0, focal, height / 2], [0, 0, 1]])
+        return cls(camera_matrix, np.zeros(5), image_size)
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["CameraCalibration"]:
+        """
+        Load a saved calibration, memory-mapping the undistortion maps
+
+        Args:
+            directory: Calibration directory
+
+        Returns:
+            Calibration or None if none is stored
+        """
+        directory = Path(directory)
+        metadata_file = directory / METADATA_FILE
+        if not metadata_file.exists():
+            return None
+        try:
+            metadata = json.loads(metadata_file.read_text())
+            map_x = map_y = None
+            if (directory / MAP_X_FILE).exists() and (directory / MAP_Y_FILE).exists():
+                map_x = np.load(directory / MAP_X_FILE, mmap_mode="r")
+                map_y = np.load(directory / MAP_Y_FILE, mmap_mode="r")
+            calibration = cls(
+                np.load(directory / CAMERA_MATRIX_FILE),
+                np.load(directory / DIST_COEFFS_FILE),
+                tuple(metadata["image_size"]),
+                map_x=map_x,
+                map_y=map_y,
+                rms_error=metadata.get("rms_error"),
+            )
+            logger.info(f"Camera calibration loaded from {directory}")
+            return calibration
+        except Exception as e:
+            logger.error(f"Failed to load camera calibration: {e}")
+            return None
+
+    def save(self, directory: Path) -> None:
+        """
+        Persist calibration and undistortion maps
+
+        Args:
+            directory: Calibration directory
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / CAMERA_MATRIX_FILE, self.camera_matrix)
+        np.save(directory / DIST_COEFFS_FILE, self.dist_coeffs)
+        if self.map_x is not None and self.map_y is not None:
+            np.save(directory / MAP_X_FILE, np.ascontiguousarray(self.map_x))
+            np.save(directory / MAP_Y_FILE, np.ascontiguousarray(self.map_y))
+        (directory / METADATA_FILE).write_text(json.dumps({
+            "image_size": list(self.image_size),
+            "rms_error": self.rms_error,
+            "created": datetime.now().isoformat(),
+        }, indent=2))
+        logger.info(f"Camera calibration saved to {directory}")
+
+    def undistort(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Undistort a frame with the precomputed maps
+
+        Args:
+            frame: Camera frame at the calibrated resolution or a scaled one
+
+        Returns:
+            Undistorted frame (unchanged if there is no distortion)
+
+        Raises:
+            ValueError: If the frame's aspect ratio differs from the calibrated one
+        """
+        if frame.shape[1::-1] != self.image_size:
+            return self.resized(frame.shape[1::-1]).undistort(frame)
+        if self.map_x is None:
+            return frame
+        return cv2.remap(frame, self.map_x, self.map_y, cv2.INTER_LINEAR)
+
+    def undistort_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Undistort pixel coordinates
+
+        Args:
+            points: (N, 2) pixel coordinates
+
+        Returns:
+            (N, 2) undistorted pixel coordinates
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if not CV2_AVAILABLE or points.size == 0 or not self.dist_coeffs.any():
+            return points
+        undistorted = cv2.undistortPoints(points.reshape(-1, 1, 2), self.camera_matrix, self.dist_coeffs, P=self.camera_matrix)
+        return undistorted.reshape(-1, 2)
+
+    def _build_maps(self) -> None:
+        """Precompute the undistortion remap tables for image_size"""
+        if not CV2_AVAILABLE:
+            return
+        self.map_x, self.map_y = cv2.initUndistortRectifyMap(
+            self.camera_matrix, self.dist_coeffs, None, self.camera_matrix, self.image_size, cv2.CV_32FC1
+        )
@@ -21,6 +21,10 @@ class Camera:
     - Autofocus
     - Frame capture
     """
+
+    # Frame rate can be changed on an open capture; resolution and device cannot
+    LIVE_SETTINGS = {"camera_fps": "set_fps"}
+    RELOAD_SETTINGS = ("camera_device", "camera_device_path", "camera_width", "camera_height")
     
     def __init__(self, settings: Settings):
         """
@@ -31,6 +35,7 @@ class Camera:
         """
         self.settings = settings
         self.device_index = settings.camera_device
+        self.device_path = settings.camera_device_path  # e.g. /dev/video0, overrides the index
         self.width = settings.camera_width
         self.height = settings.camera_height
         self.fps = settings.camera_fps
@@ -46,7 +51,7 @@ class Camera:
             True if successful
         """
         # TODO: Implement camera opening
-        logger.info(f"Opening camera device {self.device_index}")
+        logger.info(f"Opening camera device {self.device_path or self.device_index}")
         return False
     
     def capture_frame(self) -> Optional[np.ndarray]:
@@ -74,6 +79,19 @@ class Camera:
         # TODO: Implement PTZ control
         logger.info(f"Setting PTZ: pan={pan}, tilt={tilt}")
         return False
+
+    def set_fps(self, fps: int) -> None:
+        """
+        Update capture frame rate
+
+        Args:
+            fps: Frames per second
+        """
+        self.fps = fps
+        if self.cap is not None:
+            import cv2
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        logger.info(f"Camera frame rate set to: {fps}")
     
     def close(self) -> None:
         """Close camera"""
@@ -4,9 +4,11 @@ Detects objects using YOLOv8
 """
 
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.core.inference import InferenceExecutor, get_inference_executor
 
 logger = logging.getLogger(__name__)
 
@@ -15,22 +17,26 @@ class Detector:
     """
     Object detector using YOLOv8
     
-    Detects objects in camera frames and returns bounding boxes
+    Detects objects in camera frames and returns bounding boxes.
+    Inference runs on the shared inference executor, off the event loop.
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, executor: Optional[InferenceExecutor] = None):
         """
         Initialize detector
         
         Args:
             settings: Application settings
+            executor: Inference executor (defaults to the shared one)
         """
         self.settings = settings
+        self.executor = executor or get_inference_executor()
         self.model = None  # Will be initialized when ultralytics is available
         self.confidence_threshold = settings.vision_confidence_threshold
         
         logger.info(f"Detector initialized with threshold: {self.confidence_threshold}")
     
+    @log_performance
     async def detect(self, frame: np.ndarray) -> List[Dict]:
         """
         Detect objects in frame
@@ -41,6 +47,10 @@ class Detector:
         Returns:
             List of detection dictionaries with bbox, label, confidence
         """
+        return await self.executor.run(self._detect, frame)
+
+    def _detect(self, frame: np.ndarray) -> List[Dict]:
+        """Run the model on one frame (inference worker thread)"""
         # TODO: Implement object detection
         logger.debug("Detecting objects in frame...")
         return []
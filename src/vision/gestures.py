@@ -4,42 +4,303 @@ Detects gestures from Insta360 Link 2 camera
 """
 
 import logging
-from typing import Optional
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.core.event_bus import EventBus
+from src.core.inference import InferenceExecutor, get_inference_executor
 
 logger = logging.getLogger(__name__)
 
+try:
+    import mediapipe as mp
+    MEDIAPIPE_AVAILABLE = True
+except ImportError:
+    MEDIAPIPE_AVAILABLE = False
+
+# Longest side of the ROI handed to the hand model; larger crops are strided down
+MAX_ROI_SIDE = 320
+
+# MediaPipe hand landmark indices
+WRIST = 0
+THUMB_MCP, THUMB_TIP = 2, 4
+FINGER_PIPS = np.array([6, 10, 14, 18])  # index, middle, ring, pinky
+FINGER_TIPS = np.array([8, 12, 16, 20])
+
+# Wave detection: wrist x-positions over this window (seconds)
+WAVE_WINDOW_SECONDS = 1.2
+WAVE_MIN_DIRECTION_CHANGES = 2
+WAVE_MIN_AMPLITUDE = 0.04  # fraction of frame width
+
+Box = Tuple[int, int, int, int]
+
 
 class GestureDetector:
     """
-    Detect gestures from camera
-    
-    Primary method: LED blink detection
-    Fallback: MediaPipe hand detection
+    Detect gestures from camera using MediaPipe hand landmarks
+
+    Hand detection runs only on a cropped region of interest around the last
+    known hand (or the detector's person box), at a high rate while a hand is
+    visible and a low rate otherwise. Gestures are debounced before they are
+    reported and published on the event bus as ``gesture_detected``.
     """
-    
-    def __init__(self, settings: Settings):
+
+    def __init__(
+        self,
+        settings: Settings,
+        event_bus: Optional[EventBus] = None,
+        executor: Optional[InferenceExecutor] = None
+    ):
         """
         Initialize gesture detector
-        
+
         Args:
             settings: Application settings
+            event_bus: Optional event bus for publishing gesture events
+            executor: Inference executor (defaults to the shared one)
         """
         self.settings = settings
+        self.event_bus = event_bus
+        self.executor = executor or get_inference_executor()
+        self.active_interval = 1.0 / settings.gesture_active_fps
+        self.idle_interval = 1.0 / settings.gesture_idle_fps
+        self.debounce_frames = settings.gesture_debounce_frames
+        self.cooldown = settings.gesture_cooldown_seconds
+        self.roi_margin = settings.gesture_roi_margin
+
+        self.hands = None  # Created on first use when mediapipe is available
+        self._roi: Optional[Box] = None
+        self._person_roi: Optional[Box] = None  # Where to look again once the hand is lost
+        self._hand_visible = False
+        self._next_run = 0.0
+        self._busy = False
+
+        self._wrist_history: deque = deque(maxlen=64)
+        self._candidate: Optional[str] = None
+        self._candidate_count = 0
+        self._last_gesture: Optional[str] = None
+        self._last_gesture_time = 0.0
+
+        if not MEDIAPIPE_AVAILABLE:
+            logger.warning("mediapipe not installed - hand gesture detection disabled")
         logger.info("GestureDetector initialized")
-    
-    async def detect_gesture(self, frame: np.ndarray) -> Optional[str]:
+
+    @log_performance
+    async def detect_gesture(
+        self,
+        frame: np.ndarray,
+        detections: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[str]:
         """
         Detect gesture in frame
-        
+
+        Frames arriving before the next scheduled run are skipped cheaply,
+        so this can be called at full camera rate.
+
         Args:
             frame: Camera frame
-            
+            detections: Optional detector output used to seed the ROI
+
         Returns:
             Gesture type (wave, thumbs_up, peace_sign) or None
         """
-        # TODO: Implement gesture detection
-        logger.debug("Detecting gestures...")
+        if not self.settings.camera_gestures:
+            return None
+
+        if detections:
+            self.update_roi(detections, frame.shape[:2])
+
+        now = time.monotonic()
+        if self._busy or not self.should_process(now):
+            return None
+
+        crop, origin = self._crop(frame)
+        self._busy = True
+        try:
+            landmarks = await self.executor.run(self._detect_hand, crop)
+        finally:
+            self._busy = False
+
+        if landmarks is None:
+            if self._hand_visible:
+                logger.debug("Hand lost")
+            self._hand_visible = False
+            # Widen the search: the hand may come back anywhere around the person
+            self._roi = self._person_roi
+            self._wrist_history.clear()
+            self._candidate, self._candidate_count = None, 0
+            self._next_run = now + self.idle_interval
+            return None
+
+        points = self._to_frame_coords(landmarks, crop.shape[:2], origin)
+        self._hand_visible = True
+        # Scheduled from this result, so a hand found in idle mode is followed at the active rate
+        self._next_run = now + self.active_interval
+        self._track(points, frame.shape[:2])
+        self._wrist_history.append((now, points[WRIST, 0] / frame.shape[1]))
+
+        return self._debounce(self.classify(points, now), now)
+
+    def should_process(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the adaptive frame schedule allows a run
+
+        Args:
+            now: Monotonic timestamp (defaults to current time)
+
+        Returns:
+            True if the next frame should be processed
+        """
+        return (time.monotonic() if now is None else now) >= self._next_run
+
+    def update_roi(self, detections: List[Dict[str, Any]], frame_size: Tuple[int, int]) -> None:
+        """
+        Seed the ROI from detector output
+
+        A detected hand box wins; otherwise the upper half of the largest
+        person box is used, which is where raised hands appear. That person
+        region is also where the search resumes when a tracked hand is lost.
+
+        Args:
+            detections: Detection dictionaries with bbox and label
+            frame_size: Frame (height, width) in pixels
+        """
+        hands = [d for d in detections if d.get("label") == "hand"]
+        people = [d for d in detections if d.get("label") == "person"]
+        if people:
+            x1, y1, x2, y2 = max(people, key=lambda d: (d["bbox"][2] - d["bbox"][0]) * (d["bbox"][3] - d["bbox"][1]))["bbox"]
+            self._person_roi = self._expand((x1, y1, x2, y1 + (y2 - y1) / 2), frame_size)
+
+        if self._hand_visible:
+            return  # Landmark tracking is more precise than detector boxes
+        if hands:
+            self._roi = self._expand(max(hands, key=lambda d: d.get("confidence", 0.0))["bbox"], frame_size)
+        elif people:
+            self._roi = self._person_roi
+
+    def classify(self, points: np.ndarray, now: Optional[float] = None) -> Optional[str]:
+        """
+        Classify a single hand pose
+
+        Args:
+            points: (21, 2) landmark array in frame pixels
+            now: Monotonic timestamp used for wave detection
+
+        Returns:
+            Raw gesture label or None
+        """
+        wrist = points[WRIST]
+        tip_dist = np.linalg.norm(points[FINGER_TIPS] - wrist, axis=1)
+        pip_dist = np.linalg.norm(points[FINGER_PIPS] - wrist, axis=1)
+        extended = tip_dist > pip_dist * 1.1  # index, middle, ring, pinky
+
+        hand_size = max(float(np.linalg.norm(points[9] - wrist)), 1.0)
+        thumb_up = (points[THUMB_MCP, 1] - points[THUMB_TIP, 1]) > 0.5 * hand_size
+
+        if thumb_up and not extended.any():
+            return "thumbs_up"
+        if extended[0] and extended[1] and not extended[2] and not extended[3]:
+            return "peace_sign"
+        if extended.all() and self._is_waving(time.monotonic() if now is None else now):
+            return "wave"
         return None
 
+    def _is_waving(self, now: float) -> bool:
+        """Detect side-to-side wrist oscillation in the recent history"""
+        xs = np.array([x for t, x in self._wrist_history if now - t <= WAVE_WINDOW_SECONDS])
+        if xs.size < 4 or np.ptp(xs) < WAVE_MIN_AMPLITUDE:
+            return False
+        steps = np.sign(np.diff(xs))
+        steps = steps[steps != 0]
+        return int(np.count_nonzero(np.diff(steps))) >= WAVE_MIN_DIRECTION_CHANGES
+
+    def _debounce(self, gesture: Optional[str], now: float) -> Optional[str]:
+        """Report a gesture once it is stable and outside its cooldown"""
+        if gesture != self._candidate:
+            self._candidate, self._candidate_count = gesture, 0
+        self._candidate_count += 1
+
+        if gesture is None or self._candidate_count < self.debounce_frames:
+            return None
+        if gesture == self._last_gesture and now - self._last_gesture_time < self.cooldown:
+            return None
+
+        self._last_gesture = gesture
+        self._last_gesture_time = now
+        logger.info(f"Gesture detected: {gesture}")
+        if self.event_bus is not None:
+            self.event_bus.emit("gesture_detected", {"gesture": gesture, "roi": self._roi})
+        return gesture
+
+    def _expand(self, box, frame_size: Tuple[int, int]) -> Box:
+        """Grow a box by the ROI margin and clamp it to the frame"""
+        height, width = frame_size
+        x1, y1, x2, y2 = box
+        mx = (x2 - x1) * self.roi_margin
+        my = (y2 - y1) * self.roi_margin
+        return (
+            max(int(x1 - mx), 0),
+            max(int(y1 - my), 0),
+            min(int(x2 + mx), width),
+            min(int(y2 + my), height),
+        )
+
+    def _crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int, int]]:
+        """
+        Crop (and stride down) the ROI
+
+        Returns:
+            Tuple of (crop, (x_offset, y_offset, stride))
+        """
+        if self._roi is not None:
+            x1, y1, x2, y2 = self._roi
+            if x2 - x1 > 8 and y2 - y1 > 8:
+                crop = frame[y1:y2, x1:x2]
+            else:
+                crop, x1, y1 = frame, 0, 0
+        else:
+            crop, x1, y1 = frame, 0, 0
+        stride = max(1, -(-max(crop.shape[:2]) // MAX_ROI_SIDE))
+        return crop[::stride, ::stride], (x1, y1, stride)
+
+    def _track(self, points: np.ndarray, frame_size: Tuple[int, int]) -> None:
+        """Follow the hand with the ROI using its landmark bounding box"""
+        x1, y1 = points.min(axis=0)
+        x2, y2 = points.max(axis=0)
+        side = max(x2 - x1, y2 - y1)
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        self._roi = self._expand((cx - side / 2, cy - side / 2, cx + side / 2, cy + side / 2), frame_size)
+
+    @staticmethod
+    def _to_frame_coords(landmarks: np.ndarray, crop_size: Tuple[int, int], origin: Tuple[int, int, int]) -> np.ndarray:
+        """Map normalised crop landmarks to full-frame pixel coordinates"""
+        x_offset, y_offset, stride = origin
+        height, width = crop_size
+        scale = np.array([width * stride, height * stride], dtype=np.float32)
+        return landmarks * scale + np.array([x_offset, y_offset], dtype=np.float32)
+
+    def _detect_hand(self, crop: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Run the hand landmark model on a crop (worker thread)
+
+        Returns:
+            (21, 2) normalised landmarks or None
+        """
+        if not MEDIAPIPE_AVAILABLE:
+            return None
+        if self.hands is None:
+            self.hands = mp.solutions.hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                model_complexity=0,
+                min_detection_confidence=0.5,
+            )
+        # Camera frames are BGR; MediaPipe expects contiguous RGB
+        result = self.hands.process(np.ascontiguousarray(crop[..., ::-1]))
+        if not result.multi_hand_landmarks:
+            return None
+        hand = result.multi_hand_landmarks[0].landmark
+        return np.array([(lm.x, lm.y) for lm in hand], dtype=np.float32)
@@ -4,42 +4,205 @@ Measures object dimensions using camera
 """
 
 import logging
-from typing import Optional, Tuple, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.core.inference import InferenceExecutor, get_inference_executor
+from src.vision.calibration import CameraCalibration
 
 logger = logging.getLogger(__name__)
 
+# Real-world widths (mm) of common reference objects
+KNOWN_OBJECT_WIDTHS_MM = {
+    "credit card": 85.6,
+    "a4 paper": 210.0,
+    "letter paper": 215.9,
+    "cell phone": 71.5,
+    "book": 150.0,
+}
+
 
 class Measurement:
     """
     Measure object dimensions
-    
-    Uses camera calibration and distance estimation
+
+    Uses camera calibration and distance estimation.
+
+    Intrinsics come from a one-off checkerboard calibration stored under
+    ``calibration_path`` (memory-mapped at startup), or are approximated from
+    the camera's field of view. All detected boxes in a frame are converted
+    to millimetres in one vectorised pass.
     """
-    
-    def __init__(self, settings: Settings):
+
+    def __init__(self, settings: Settings, executor: Optional[InferenceExecutor] = None):
         """
         Initialize measurement system
-        
+
         Args:
             settings: Application settings
+            executor: Inference executor for per-frame measurement (defaults to the shared one)
         """
         self.settings = settings
-        logger.info("Measurement system initialized")
-    
-    async def measure_object(self, frame: np.ndarray, reference_object: Optional[Dict] = None) -> Dict[str, float]:
+        self.executor = executor or get_inference_executor()
+        self.calibration_dir = Path(settings.calibration_path)
+        self.default_distance_mm = settings.measurement_default_distance_mm
+        self.calibration = CameraCalibration.load(self.calibration_dir)
+        self.calibrated = self.calibration is not None
+        if self.calibration is None:
+            self.calibration = CameraCalibration.from_fov(
+                (settings.camera_width, settings.camera_height),
+                settings.camera_hfov_degrees
+            )
+        logger.info(f"Measurement system initialized (calibrated: {self.calibrated})")
+
+    def calibrate(
+        self,
+        frames: List[np.ndarray],
+        board_size: Tuple[int, int] = (9, 6),
+        square_size_mm: float = 25.0
+    ) -> float:
+        """
+        Calibrate the camera from a checkerboard session and persist it
+
+        Args:
+            frames: Frames showing the checkerboard in varied poses
+            board_size: Inner corners per row and per column
+            square_size_mm: Board square size in millimetres
+
+        Returns:
+            RMS reprojection error in pixels
+        """
+        calibration = CameraCalibration.from_checkerboard(frames, board_size, square_size_mm)
+        calibration.save(self.calibration_dir)
+        self.calibration = calibration
+        self.calibrated = True
+        return calibration.rms_error
+
+    def undistort(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Undistort a frame (single remap with precomputed maps)
+
+        Args:
+            frame: Camera frame
+
+        Returns:
+            Undistorted frame
+        """
+        return self.calibration.undistort(frame)
+
+    def measure_boxes(
+        self,
+        boxes: np.ndarray,
+        distance_mm: Union[float, np.ndarray, None] = None,
+        reference_box: Optional[np.ndarray] = None,
+        reference_width_mm: Optional[float] = None,
+        image_size: Optional[Tuple[int, int]] = None
+    ) -> np.ndarray:
+        """
+        Convert pixel boxes to metric sizes in one vectorised pass
+
+        With a reference object, every box is scaled by the reference's
+        millimetres-per-pixel (objects assumed to share its depth plane).
+        Otherwise the pinhole model is used with the given distance.
+
+        Args:
+            boxes: (N, 4) array of x1, y1, x2, y2 pixel boxes
+            distance_mm: Scalar or (N,) object distances
+            reference_box: Optional (4,) pixel box of a reference object
+            reference_width_mm: Real width of the reference object
+            image_size: (width, height) of the frame the boxes are from (default: calibrated size)
+
+        Returns:
+            (N, 2) array of (width_mm, height_mm)
+
+        Raises:
+            ValueError: If image_size has a different aspect ratio than the calibration
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if boxes.shape[0] == 0:
+            return np.empty((0, 2))
+
+        calibration = self.calibration if image_size is None else self.calibration.resized(image_size)
+        sizes_px = self._undistorted_sizes(calibration, boxes)
+
+        if reference_box is not None and reference_width_mm:
+            reference_px = self._undistorted_sizes(
+                calibration, np.asarray(reference_box, dtype=np.float64).reshape(1, 4)
+            )[0, 0]
+            if reference_px > 0:
+                return sizes_px * (reference_width_mm / reference_px)
+
+        distance = np.asarray(self.default_distance_mm if distance_mm is None else distance_mm, dtype=np.float64)
+        focal = np.array([calibration.fx, calibration.fy])
+        return sizes_px * (distance.reshape(-1, 1) if distance.ndim else distance) / focal
+
+    def measure_objects(
+        self,
+        detections: List[Dict[str, Any]],
+        reference_object: Optional[Dict] = None,
+        distance_mm: Optional[float] = None,
+        image_size: Optional[Tuple[int, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Measure every detected object
+
+        Args:
+            detections: Detection dictionaries with bbox and label
+            reference_object: Optional reference with bbox and width_mm (or a known label)
+            distance_mm: Optional object distance when no reference is given
+            image_size: (width, height) of the frame the detections are from
+
+        Returns:
+            List of dictionaries with label, width and height in mm
+        """
+        if not detections:
+            return []
+        boxes = np.array([d["bbox"] for d in detections], dtype=np.float64)
+
+        reference_box, reference_width = None, None
+        if reference_object:
+            reference_box = reference_object.get("bbox")
+            reference_width = reference_object.get("width_mm") or KNOWN_OBJECT_WIDTHS_MM.get(reference_object.get("label", ""))
+
+        sizes = self.measure_boxes(boxes, distance_mm, reference_box, reference_width, image_size)
+        return [
+            {"label": d.get("label"), "width": float(w), "height": float(h)}
+            for d, (w, h) in zip(detections, sizes)
+        ]
+
+    @log_performance
+    async def measure_object(
+        self,
+        frame: np.ndarray,
+        reference_object: Optional[Dict] = None,
+        detections: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, float]:
         """
         Measure object dimensions
-        
+
         Args:
             frame: Camera frame with object
             reference_object: Optional reference object for scale
-            
+            detections: Detector output for the frame
+
         Returns:
             Dictionary with measurements (width, height, depth)
         """
-        # TODO: Implement measurement
-        logger.info("Measuring object...")
-        return {}
+        candidates = [d for d in (detections or []) if not reference_object or d.get("bbox") != reference_object.get("bbox")]
+        if not candidates:
+            logger.debug("No object to measure")
+            return {}
+
+        # Measure the most prominent object
+        target = max(candidates, key=lambda d: (d["bbox"][2] - d["bbox"][0]) * (d["bbox"][3] - d["bbox"][1]))
+        image_size = frame.shape[1::-1] if frame is not None else None
+        result = (await self.executor.run(self.measure_objects, [target], reference_object, None, image_size))[0]
+        return {"width": result["width"], "height": result["height"], "depth": 0.0}
 
+    @staticmethod
+    def _undistorted_sizes(calibration: CameraCalibration, boxes: np.ndarray) -> np.ndarray:
+        """Width/height in pixels of boxes after undistorting their corners"""
+        corners = calibration.undistort_points(boxes.reshape(-1, 2)).reshape(-1, 4)
+        return np.abs(corners[:, 2:4] - corners[:, 0:2])
@@ -3,44 +3,630 @@
 Generates 3D models from photos
 """
 
+import asyncio
 import logging
-from typing import Optional
-import numpy as np
+import shutil
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
 from src.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+FINALIZING = "finalizing"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Finished jobs kept for status queries, whatever their age
+MAX_FINISHED_JOBS = 50
+
+# Points a pair must share with the previous pair to carry the scale over
+MIN_SHARED_POINTS = 5
+
+
+def extract_features(frame_path: str, features_path: str, max_features: int) -> int:
+    """
+    Extract ORB features from a frame stored on disk (worker process)
+
+    The frame file is removed once its features are written, so raw frames
+    never accumulate.
+
+    Args:
+        frame_path: Path of the .npy frame
+        features_path: Output .npz path for keypoints and descriptors
+        max_features: Maximum ORB features per frame
+
+    Returns:
+        Number of keypoints found
+    """
+    import cv2
+
+    frame = np.load(frame_path, mmap_mode="r")
+    gray = cv2.cvtColor(np.asarray(frame), cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else np.asarray(frame)
+    orb = cv2.ORB_create(nfeatures=max_features)
+    keypoints, descriptors = orb.detectAndCompute(gray, None)
+    points = np.array([kp.pt for kp in keypoints], dtype=np.float32).reshape(-1, 2)
+    if descriptors is None:
+        descriptors = np.empty((0, 32), dtype=np.uint8)
+    np.savez(features_path, points=points, descriptors=descriptors)
+    Path(frame_path).unlink(missing_ok=True)
+    return len(points)
+
+
+def match_pair(
+    previous_path: str,
+    current_path: str,
+    camera_matrix: np.ndarray,
+    cloud_path: str
+) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Match two frames and triangulate their shared points (worker process)
+
+    Points are written in the previous camera's coordinate frame, in units
+    of this pair's translation (which has unit length), together with the
+    feature index of each point in both frames.
+
+    Args:
+        previous_path: Features of the earlier frame
+        current_path: Features of the later frame
+        camera_matrix: 3x3 intrinsic matrix
+        cloud_path: Output .npz path for the (N, 3) partial point cloud and feature indices
+
+    Returns:
+        Tuple of (rotation, translation, point count) or None if the pair
+        could not be registered
+    """
+    import cv2
+
+    previous = np.load(previous_path)
+    current = np.load(current_path)
+    if len(previous["descriptors"]) < 8 or len(current["descriptors"]) < 8:
+        return None
+
+    matcher = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
+    matches = matcher.match(previous["descriptors"], current["descriptors"])
+    if len(matches) < 8:
+        return None
+    idx_prev = np.array([m.queryIdx for m in matches])
+    idx_curr = np.array([m.trainIdx for m in matches])
+    pts_prev = previous["points"][idx_prev].astype(np.float64)
+    pts_curr = current["points"][idx_curr].astype(np.float64)
+
+    essential, mask = cv2.findEssentialMat(pts_prev, pts_curr, camera_matrix, method=cv2.RANSAC, threshold=1.0)
+    if essential is None or essential.shape != (3, 3):
+        return None
+    _, rotation, translation, pose_mask = cv2.recoverPose(essential, pts_prev, pts_curr, camera_matrix, mask=mask)
+    inliers = pose_mask.ravel() > 0
+    if inliers.sum() < 8:
+        return None
+
+    projection_prev = camera_matrix @ np.hstack([np.eye(3), np.zeros((3, 1))])
+    projection_curr = camera_matrix @ np.hstack([rotation, translation])
+    homogeneous = cv2.triangulatePoints(projection_prev, projection_curr, pts_prev[inliers].T, pts_curr[inliers].T)
+    points = (homogeneous[:3] / homogeneous[3]).T
+    keep = np.isfinite(points).all(axis=1) & (points[:, 2] > 0)
+    np.savez(
+        cloud_path, points=points[keep].astype(np.float32),
+        previous_index=idx_prev[inliers][keep], current_index=idx_curr[inliers][keep]
+    )
+    return rotation, translation, int(keep.sum())
+
+
+def relative_scale(
+    carried: Tuple[np.ndarray, np.ndarray],
+    cloud: Dict[str, np.ndarray]
+) -> Optional[float]:
+    """
+    Scale that brings a pair's cloud into the units of the previous pair
+
+    Both pairs see the shared frame; points triangulated by both must lie at
+    the same distance from that camera.
+
+    Args:
+        carried: Feature indices in the shared frame and the previous pair's
+            points in that camera's coordinate frame
+        cloud: This pair's points (in the shared camera's frame) and feature indices
+
+    Returns:
+        Scale factor, or None if too few points are shared
+    """
+    carried_index, carried_points = carried
+    _, ours, theirs = np.intersect1d(carried_index, cloud["previous_index"], return_indices=True)
+    if len(ours) < MIN_SHARED_POINTS:
+        return None
+    distances = np.linalg.norm(cloud["points"][theirs], axis=1)
+    ratios = np.linalg.norm(carried_points[ours], axis=1)[distances > 0] / distances[distances > 0]
+    if len(ratios) < MIN_SHARED_POINTS:
+        return None
+    scale = float(np.median(ratios))
+    return scale if np.isfinite(scale) and scale > 0 else None
+
+
+def write_point_cloud(path: Path, points: np.ndarray) -> None:
+    """
+    Write points as a binary PLY, or OBJ vertices for a .obj path
+
+    Args:
+        path: Output path
+        points: (N, 3) points
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".obj":
+        with open(path, "w") as f:
+            np.savetxt(f, points, fmt="v %.5f %.5f %.5f")
+    else:
+        with open(path, "wb") as f:
+            f.write((
+                "ply\nformat binary_little_endian 1.0\n"
+                f"element vertex {len(points)}\n"
+                "property float x\nproperty float y\nproperty float z\nend_header\n"
+            ).encode("ascii"))
+            f.write(np.asarray(points).astype("<f4").tobytes())
+
+
+class ReconstructionJob:
+    """
+    Streaming 3D reconstruction job
+
+    Frames are spilled to disk as they arrive, feature extraction and pair
+    matching run in a process pool while capture continues, and each pair's
+    partial point cloud is written to the job directory. Only poses and
+    counters are held in memory.
+
+    Consecutive pairs are chained into one coordinate frame and scale as
+    long as each pair registers and shares enough points with the previous
+    one. A break starts a new sub-chain: the first is written to
+    ``output_path``, later ones to ``<stem>_part<N>`` next to it. Each
+    sub-chain is consistent up to one global scale; sub-chains are not
+    aligned with each other.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        work_dir: Path,
+        output_path: Path,
+        pool: ProcessPoolExecutor,
+        camera_matrix: np.ndarray,
+        max_features: int,
+        expected_frames: Optional[int] = None
+    ):
+        """
+        Initialize reconstruction job
+
+        Args:
+            job_id: Unique job identifier
+            work_dir: Directory for intermediate files
+            output_path: Output point cloud path (.ply or .obj)
+            pool: Process pool for feature work
+            camera_matrix: 3x3 intrinsic matrix
+            max_features: Maximum ORB features per frame
+            expected_frames: Optional frame count used for progress
+        """
+        self.job_id = job_id
+        self.work_dir = work_dir
+        self.output_path = output_path
+        self.camera_matrix = camera_matrix
+        self.max_features = max_features
+        self.expected_frames = expected_frames
+        self.status = PENDING
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.finished: Optional[float] = None
+
+        self.frames_received = 0
+        self.frames_processed = 0
+        self.pairs_matched = 0
+        self.pairs_failed = 0
+        self.points = 0
+        self.segments: List[Path] = []
+
+        self._pool = pool
+        self._features: Dict[int, asyncio.Future] = {}
+        self._pairs: Dict[int, asyncio.Task] = {}
+        self._poses: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._cancelled = False
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+
+    async def add_frame(self, frame: np.ndarray) -> None:
+        """
+        Feed the next frame into the job
+
+        Args:
+            frame: Camera frame
+        """
+        if self.status not in (PENDING, RUNNING):
+            raise RuntimeError(f"Job {self.job_id} is {self.status}")
+        self.status = RUNNING
+
+        index = self.frames_received
+        self.frames_received += 1
+        frame_path = self.work_dir / f"frame_{index:05d}.npy"
+        await asyncio.to_thread(np.save, frame_path, frame)
+
+        loop = asyncio.get_running_loop()
+        features = loop.run_in_executor(
+            self._pool, extract_features, str(frame_path), str(self._features_path(index)), self.max_features
+        )
+        features.add_done_callback(self._on_features)
+        self._features[index] = features
+        if index > 0:
+            self._pairs[index] = asyncio.create_task(self._match(index))
+
+    async def finish(self) -> Path:
+        """
+        Wait for outstanding work and merge partial clouds into the output
+
+        Returns:
+            Output path
+        """
+        try:
+            await asyncio.gather(*self._features.values(), *self._pairs.values())
+            if self._cancelled:
+                raise asyncio.CancelledError()
+            self.status = FINALIZING
+            await asyncio.to_thread(self._merge)
+            self.status = COMPLETED
+            logger.info(f"3D reconstruction {self.job_id} completed: {self.points} points in "
+                        f"{len(self.segments)} part(s) -> {self.output_path}")
+            return self.output_path
+        except asyncio.CancelledError:
+            self.status = CANCELLED
+            raise
+        except Exception as e:
+            self.fail(e)
+            raise
+        finally:
+            self.finished = self.finished or time.time()
+            self.cleanup()
+
+    def fail(self, error: Exception) -> None:
+        """
+        Mark the job failed and discard intermediate work
+
+        Args:
+            error: Cause of the failure
+        """
+        if self.status in FINISHED_STATES:
+            return
+        self.status = FAILED
+        self.error = str(error)
+        self.finished = time.time()
+        self.cleanup()
+        logger.error(f"3D reconstruction {self.job_id} failed: {error}")
+
+    def cancel(self) -> None:
+        """Cancel the job and discard intermediate files"""
+        if self.status in FINISHED_STATES:
+            return
+        self._cancelled = True
+        self.status = CANCELLED
+        self.finished = time.time()
+        self.cleanup()
+        logger.info(f"3D reconstruction {self.job_id} cancelled")
+
+    def cleanup(self) -> None:
+        """Cancel outstanding feature and pair work and remove intermediate files"""
+        for future in self._features.values():
+            future.cancel()
+        for task in self._pairs.values():
+            task.cancel()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of expected work done (0.0 - 1.0)"""
+        if self.status == COMPLETED:
+            return 1.0
+        total = self.expected_frames or self.frames_received
+        if not total:
+            return 0.0
+        done = self.frames_processed + self.pairs_matched + self.pairs_failed
+        return min(done / (2 * total - 1), 0.99) if total > 1 else 0.0
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get job status
+
+        Returns:
+            Dictionary with state, progress and counters
+        """
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+            "frames_received": self.frames_received,
+            "frames_processed": self.frames_processed,
+            "pairs_matched": self.pairs_matched,
+            "pairs_failed": self.pairs_failed,
+            "points": self.points,
+            "output_path": str(self.output_path),
+            "segments": [str(path) for path in self.segments],
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+        }
+
+    def _features_path(self, index: int) -> Path:
+        """Features file for a frame"""
+        return self.work_dir / f"features_{index:05d}.npz"
+
+    def _cloud_path(self, index: int) -> Path:
+        """Partial cloud file for the pair ending at a frame"""
+        return self.work_dir / f"cloud_{index:05d}.npz"
+
+    def _on_features(self, future: asyncio.Future) -> None:
+        """Count finished feature extractions"""
+        if not future.cancelled() and future.exception() is None:
+            self.frames_processed += 1
+
+    async def _match(self, index: int) -> None:
+        """Match a frame with its predecessor once both have features"""
+        await asyncio.gather(self._features[index - 1], self._features[index])
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._pool, match_pair,
+            str(self._features_path(index - 1)), str(self._features_path(index)),
+            self.camera_matrix, str(self._cloud_path(index))
+        )
+        if result is None:
+            self.pairs_failed += 1
+            return
+        rotation, translation, count = result
+        self._poses[index] = (rotation, translation)
+        self.pairs_matched += 1
+        self.points += count
+
+    def _merge(self) -> None:
+        """Chain pair poses and scales and stream each sub-chain's clouds into its output"""
+        chains: List[List[np.ndarray]] = []
+        # Feature indices and points (chain units) in the last chained camera's frame
+        carried: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        for index in range(1, self.frames_received):
+            pose = self._poses.get(index)
+            cloud_file = self._cloud_path(index)
+            if pose is None or not cloud_file.exists():
+                carried = None  # Unregistered pair: the next one cannot be placed in this chain
+                continue
+            with np.load(cloud_file) as data:
+                cloud = {key: data[key] for key in data.files}
+            scale = relative_scale(carried, cloud) if carried is not None else None
+            if scale is None:
+                # New sub-chain in this pair's first camera frame and scale
+                chains.append([])
+                scale = 1.0
+                # World-from-camera transform of the pair's first camera
+                rotation_world = np.eye(3)
+                translation_world = np.zeros((3, 1))
+            rotation, translation = pose
+            translation = translation * scale
+            local = cloud["points"].astype(np.float64).T * scale
+            chains[-1].append((rotation_world @ local + translation_world).T.astype(np.float32))
+            carried = (cloud["current_index"], (rotation @ local + translation).T)
+            # x_curr = R x_prev + t  ->  x_prev = R^T (x_curr - t)
+            rotation_world = rotation_world @ rotation.T
+            translation_world = translation_world - rotation_world @ translation
+
+        self.segments = []
+        self.points = 0
+        for number, clouds in enumerate(chains or [[]]):
+            path = self.output_path if number == 0 else self.output_path.with_name(
+                f"{self.output_path.stem}_part{number + 1}{self.output_path.suffix}"
+            )
+            points = np.concatenate(clouds) if clouds else np.empty((0, 3), dtype=np.float32)
+            write_point_cloud(path, points)
+            self.segments.append(path)
+            self.points += len(points)
+        if len(chains) > 1:
+            logger.warning(f"3D reconstruction {self.job_id} split into {len(chains)} parts "
+                           f"(pairs without registration or shared points)")
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
 
 class Model3DGenerator:
     """
     Generate 3D models from photos
-    
-    Uses photogrammetry techniques for basic 3D reconstruction
+
+    Uses photogrammetry techniques for basic 3D reconstruction.
+
+    Reconstruction runs as background jobs that consume frames incrementally,
+    so long captures neither hold every frame in RAM nor block the API.
+    The output is a sparse point cloud (.ply or .obj vertices).
     """
-    
+
     def __init__(self, settings: Settings):
         """
         Initialize 3D model generator
-        
+
         Args:
             settings: Application settings
         """
         self.settings = settings
+        self.work_root = Path(settings.model3d_work_path)
+        self.max_workers = settings.model3d_workers
+        self.max_features = settings.model3d_max_features
+        self.job_ttl = settings.model3d_job_ttl
+        self.jobs: Dict[str, ReconstructionJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
         logger.info("Model3DGenerator initialized")
-    
+
+    def create_job(
+        self,
+        output_path: Path,
+        expected_frames: Optional[int] = None,
+        camera_matrix: Optional[np.ndarray] = None
+    ) -> ReconstructionJob:
+        """
+        Create a streaming reconstruction job
+
+        Args:
+            output_path: Output file path (.ply or .obj)
+            expected_frames: Optional frame count used for progress
+            camera_matrix: Optional 3x3 intrinsics (defaults to stored calibration)
+
+        Returns:
+            New job ready to receive frames
+        """
+        self.prune_jobs()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        if camera_matrix is None:
+            camera_matrix = self._camera_matrix()
+        job_id = uuid.uuid4().hex[:12]
+        job = ReconstructionJob(
+            job_id, self.work_root / job_id, Path(output_path), self._pool,
+            camera_matrix, self.max_features, expected_frames
+        )
+        self.jobs[job_id] = job
+        logger.info(f"3D reconstruction job created: {job_id}")
+        return job
+
+    def start_capture(
+        self,
+        read_frame: Callable[[], Awaitable[Optional[np.ndarray]]],
+        frame_count: int,
+        interval: float,
+        output_path: Path
+    ) -> ReconstructionJob:
+        """
+        Start a background job that captures frames from the camera
+
+        Args:
+            read_frame: Returns the next camera frame without blocking the loop
+            frame_count: Number of frames to capture
+            interval: Seconds between captured frames
+            output_path: Output file path (.ply or .obj)
+
+        Returns:
+            Running job (poll get_status for progress)
+        """
+        job = self.create_job(output_path, expected_frames=frame_count)
+
+        async def run() -> None:
+            try:
+                captured = 0
+                while captured < frame_count and job.status in (PENDING, RUNNING):
+                    frame = await read_frame()
+                    if frame is None:
+                        raise RuntimeError("Camera returned no frame")
+                    await job.add_frame(frame)
+                    captured += 1
+                    await asyncio.sleep(interval)
+                await job.finish()
+            except asyncio.CancelledError:
+                job.cancel()
+            except Exception as e:
+                job.fail(e)
+            finally:
+                job.cleanup()
+
+        self._tasks[job.job_id] = asyncio.create_task(run(), name=f"model3d-{job.job_id}")
+        return job
+
+    def cancel_job(self, job_id: str) -> Optional[str]:
+        """
+        Cancel a job
+
+        A job that already finished keeps its final state.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job's state after the call, or None if unknown
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status not in FINISHED_STATES:
+            task = self._tasks.pop(job_id, None)
+            if task is not None:
+                task.cancel()
+            job.cancel()
+        return job.status
+
+    def prune_jobs(self, now: Optional[float] = None) -> int:
+        """
+        Forget finished jobs older than model3d_job_ttl, keeping at most MAX_FINISHED_JOBS
+
+        Args:
+            now: Epoch seconds (defaults to current time)
+
+        Returns:
+            Number of jobs removed
+        """
+        now = time.time() if now is None else now
+        finished = sorted(
+            (job for job in self.jobs.values() if job.status in FINISHED_STATES and job.finished is not None),
+            key=lambda job: job.finished
+        )
+        expired = [job for job in finished if now - job.finished > self.job_ttl]
+        expired += [job for job in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)] if job not in expired]
+        for job in expired:
+            del self.jobs[job.job_id]
+            self._tasks.pop(job.job_id, None)
+        return len(expired)
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Status dictionary or None if unknown
+        """
+        self.prune_jobs()
+        job = self.jobs.get(job_id)
+        return job.get_status() if job else None
+
     async def generate_model(self, frames: List[np.ndarray], output_path: Path) -> bool:
         """
         Generate 3D model from multiple frames
-        
+
         Args:
             frames: List of camera frames
-            output_path: Output file path (.stl or .obj)
-            
+            output_path: Output file path (.ply or .obj)
+
         Returns:
             True if successful
         """
-        # TODO: Implement 3D model generation
         logger.info(f"Generating 3D model to {output_path}...")
-        return False
+        job = self.create_job(output_path, expected_frames=len(frames))
+        try:
+            for frame in frames:
+                await job.add_frame(frame)
+            await job.finish()
+            return True
+        except Exception as e:
+            job.fail(e)
+            return False
+        finally:
+            job.cleanup()
+
+    def shutdown(self) -> None:
+        """Cancel running jobs and stop the process pool"""
+        for job_id in list(self._tasks):
+            self.cancel_job(job_id)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _camera_matrix(self) -> np.ndarray:
+        """Intrinsics from the stored calibration or the field of view"""
+        from src.vision.calibration import CameraCalibration
 
+        calibration = CameraCalibration.load(Path(self.settings.calibration_path)) or CameraCalibration.from_fov(
+            (self.settings.camera_width, self.settings.camera_height), self.settings.camera_hfov_degrees
+        )
+        return calibration.scaled_matrix((self.settings.camera_width, self.settings.camera_height))
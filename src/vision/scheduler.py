@@ -0,0 +1,299 @@
+"""
+Vision Scheduler
+Shares the camera frame stream between vision consumers
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+import numpy as np
+from src.config.settings import Settings
+from src.core.inference import InferenceExecutor, get_inference_executor
+from src.core.reconfigure import Reloadable
+from src.vision.camera import Camera
+
+logger = logging.getLogger(__name__)
+
+FrameCallback = Callable[[np.ndarray], Awaitable[Any]]
+
+# Completion timestamps kept per consumer for the achieved-FPS estimate
+FPS_WINDOW = 32
+
+
+@dataclass
+class VisionConsumer:
+    """A registered frame consumer and its scheduling state"""
+    name: str
+    callback: FrameCallback
+    target_fps: float
+    priority: int = 0
+    next_due: float = 0.0
+    busy: bool = False
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    last_result: Any = None
+    last_latency_ms: float = 0.0
+    completions: deque = field(default_factory=lambda: deque(maxlen=FPS_WINDOW))
+
+    @property
+    def interval(self) -> float:
+        """Seconds between frames at the target rate"""
+        return 1.0 / self.target_fps
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames per second actually processed over the recent window"""
+        if len(self.completions) < 2:
+            return 0.0
+        span = self.completions[-1] - self.completions[0]
+        return (len(self.completions) - 1) / span if span > 0 else 0.0
+
+
+class VisionScheduler:
+    """
+    Vision scheduler
+
+    Owns the camera stream and hands the latest frame to each consumer at its
+    own target rate. A consumer that is still busy when its next frame is due
+    has that frame dropped instead of queued, so a slow model never builds a
+    backlog. When the inference executor is saturated, only the
+    highest-priority consumer is dispatched. Other readers of the camera
+    (e.g. a 3D capture) take frames with ``next_frame()`` instead of opening
+    the device a second time.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        camera: Union[Camera, Reloadable],
+        executor: Optional[InferenceExecutor] = None
+    ):
+        """
+        Initialize vision scheduler
+
+        Args:
+            settings: Application settings
+            camera: Camera providing frames, or the container's reloadable camera
+            executor: Inference executor (defaults to the shared one)
+        """
+        self.settings = settings
+        self.camera = camera
+        self.executor = executor or get_inference_executor()
+        self.consumers: Dict[str, VisionConsumer] = {}
+        self._ordered: List[VisionConsumer] = []
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+        self.running = False
+        self.frames_captured = 0
+        self.latest_frame: Optional[np.ndarray] = None
+        self._frame_waiters: List[asyncio.Future] = []
+        logger.info("VisionScheduler initialized")
+
+    def register(self, name: str, callback: FrameCallback, target_fps: float, priority: int = 0) -> VisionConsumer:
+        """
+        Register a frame consumer
+
+        Args:
+            name: Unique consumer name
+            callback: Async callable receiving the frame
+            target_fps: Desired processing rate
+            priority: Higher values are dispatched first and survive saturation
+
+        Returns:
+            The registered consumer
+        """
+        if target_fps <= 0:
+            raise ValueError("target_fps must be positive")
+        consumer = VisionConsumer(name=name, callback=callback, target_fps=target_fps, priority=priority)
+        self.consumers[name] = consumer
+        self._reorder()
+        logger.info(f"Vision consumer registered: {name} @ {target_fps}fps (priority {priority})")
+        return consumer
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a frame consumer
+
+        Args:
+            name: Consumer name
+        """
+        if self.consumers.pop(name, None) is not None:
+            self._reorder()
+            logger.info(f"Vision consumer unregistered: {name}")
+
+    def attach_pipeline(self, detector=None, gesture_detector=None, measurement=None, analyzer=None, llm_client=None) -> None:
+        """
+        Register the standard vision components
+
+        Gestures, measurement and scene analysis reuse the detector's most
+        recent result instead of running detection again.
+
+        Args:
+            detector: Detector instance
+            gesture_detector: GestureDetector instance
+            measurement: Measurement instance
+            analyzer: SceneAnalyzer instance
+            llm_client: Optional LLM client for scene descriptions
+        """
+        if detector is not None:
+            self.register("detector", detector.detect, self.settings.vision_detection_fps, priority=30)
+
+        if gesture_detector is not None:
+            async def gestures(frame: np.ndarray) -> Any:
+                return await gesture_detector.detect_gesture(frame, self.latest_result("detector"))
+            self.register("gestures", gestures, self.settings.gesture_active_fps, priority=20)
+
+        if measurement is not None:
+            async def measure(frame: np.ndarray) -> Any:
+                return await measurement.measure_object(frame, detections=self.latest_result("detector"))
+            self.register("measurement", measure, self.settings.vision_measurement_fps, priority=10)
+
+        if analyzer is not None:
+            async def analyze(frame: np.ndarray) -> Any:
+                return await analyzer.describe(self.latest_result("detector") or [], frame.shape[:2], llm_client)
+            self.register("analyzer", analyze, self.settings.vision_analysis_fps, priority=0)
+
+    def latest_result(self, name: str) -> Any:
+        """
+        Get the most recent result of a consumer
+
+        Args:
+            name: Consumer name
+
+        Returns:
+            Last result or None
+        """
+        consumer = self.consumers.get(name)
+        return consumer.last_result if consumer else None
+
+    async def start(self) -> None:
+        """Start the capture and dispatch loop"""
+        if self.running:
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run(), name="vision-scheduler")
+        logger.info("VisionScheduler started")
+
+    async def stop(self) -> None:
+        """Stop the loop and wait for in-flight consumers"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        logger.info("VisionScheduler stopped")
+
+    async def next_frame(self, timeout: float = 5.0) -> Optional[np.ndarray]:
+        """
+        Wait for the next captured frame
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            Frame, or None if none was captured in time
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._frame_waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if waiter in self._frame_waiters:
+                self._frame_waiters.remove(waiter)
+
+    def _read_frame(self) -> Optional[np.ndarray]:
+        """Read one frame (worker thread); a reloadable camera is borrowed per frame"""
+        if isinstance(self.camera, Reloadable):
+            with self.camera.use() as camera:
+                return camera.capture_frame()
+        return self.camera.capture_frame()
+
+    async def _run(self) -> None:
+        """Capture frames and dispatch them until stopped"""
+        while self.running:
+            frame = await asyncio.to_thread(self._read_frame)
+            if frame is None:
+                camera = self.camera.current if isinstance(self.camera, Reloadable) else self.camera
+                await asyncio.sleep(1.0 / max(camera.fps, 1))
+                continue
+            self.frames_captured += 1
+            self.latest_frame = frame
+            waiters, self._frame_waiters = self._frame_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(frame)
+            self.dispatch(frame)
+            # Yield so consumer tasks can start before the next blocking read
+            await asyncio.sleep(0)
+
+    def dispatch(self, frame: np.ndarray, now: Optional[float] = None) -> None:
+        """
+        Hand a frame to every consumer that is due
+
+        Args:
+            frame: Camera frame
+            now: Monotonic timestamp (defaults to current time)
+        """
+        now = time.monotonic() if now is None else now
+        for index, consumer in enumerate(self._ordered):
+            if now < consumer.next_due:
+                continue
+            if consumer.busy or (index > 0 and self.executor.saturated):
+                consumer.dropped += 1
+                consumer.next_due = now + consumer.interval
+                continue
+            consumer.busy = True
+            consumer.next_due = max(consumer.next_due + consumer.interval, now)
+            task = asyncio.create_task(self._invoke(consumer, frame), name=f"vision-{consumer.name}")
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _invoke(self, consumer: VisionConsumer, frame: np.ndarray) -> None:
+        """Run one consumer on one frame"""
+        start = time.monotonic()
+        try:
+            consumer.last_result = await consumer.callback(frame)
+            consumer.processed += 1
+        except Exception as e:
+            consumer.errors += 1
+            logger.error(f"Vision consumer {consumer.name} failed: {e}")
+        finally:
+            end = time.monotonic()
+            consumer.last_latency_ms = (end - start) * 1000
+            consumer.completions.append(end)
+            consumer.busy = False
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-consumer scheduling statistics
+
+        Returns:
+            Mapping of consumer name to target/achieved FPS, drops and errors
+        """
+        return {
+            consumer.name: {
+                "priority": consumer.priority,
+                "target_fps": consumer.target_fps,
+                "achieved_fps": round(consumer.achieved_fps, 2),
+                "processed": consumer.processed,
+                "dropped": consumer.dropped,
+                "errors": consumer.errors,
+                "last_latency_ms": round(consumer.last_latency_ms, 2),
+            }
+            for consumer in self._ordered
+        }
+
+    def _reorder(self) -> None:
+        """Keep consumers sorted by descending priority"""
+        self._ordered = sorted(self.consumers.values(), key=lambda c: -c.priority)
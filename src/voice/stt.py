@@ -4,9 +4,13 @@ Converts audio to text using Whisper
 """
 
 import logging
+import time
 from typing import Optional, Tuple
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
+from src.utils.metrics import registry
+from src.utils.performance import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,10 @@ class SpeechToText:
     
     Supports multiple languages (English, Amharic)
     """
+
+    # Language is a decode option; a new model size means loading a new model
+    LIVE_SETTINGS = {"stt_language": "update_language"}
+    RELOAD_SETTINGS = ("stt_model",)
     
     def __init__(self, settings: Settings):
         """
@@ -43,9 +51,41 @@ class SpeechToText:
         Returns:
             Tuple of (transcription, confidence)
         """
-        # TODO: Implement transcription
+        if self.model is None:
+            # TODO: Load faster-whisper. Nothing is transcribed until then, so
+            # there is no latency or real-time factor to report either.
+            logger.debug("No STT model loaded, skipping transcription")
+            return "", 0.0
+        start = time.perf_counter()
         logger.info("Transcribing audio...")
-        return "", 0.0
+        text, confidence = self._transcribe(audio_data)
+        self._record_timing(time.perf_counter() - start, len(audio_data) / sample_rate)
+        return text, confidence
+
+    @log_performance
+    def _transcribe(self, audio_data: np.ndarray) -> Tuple[str, float]:
+        """Decode audio with the loaded model"""
+        segments, _ = self.model.transcribe(audio_data, language=None if self.language == "auto" else self.language)
+        segments = list(segments)  # decoding happens while the segments are consumed
+        text = " ".join(segment.text.strip() for segment in segments)
+        confidence = float(np.mean([np.exp(segment.avg_logprob) for segment in segments])) if segments else 0.0
+        return text, confidence
+
+    def _record_timing(self, processing_seconds: float, audio_seconds: float) -> None:
+        """
+        Export transcription latency and real-time factor
+
+        Args:
+            processing_seconds: Wall time spent transcribing
+            audio_seconds: Duration of the transcribed audio
+        """
+        get_performance_monitor().record("stt", "transcribe", processing_seconds * 1000)
+        if audio_seconds <= 0:
+            return
+        labels = {"model": self.model_size}
+        registry.inc("zema_stt_audio_seconds_total", audio_seconds, **labels)
+        registry.inc("zema_stt_processing_seconds_total", processing_seconds, **labels)
+        registry.set("zema_stt_real_time_factor", processing_seconds / audio_seconds, **labels)
     
     def update_language(self, language: str):
         """
@@ -4,9 +4,10 @@ Converts text to speech using Piper TTS
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 import numpy as np
 from src.config.settings import Settings
+from src.utils.logger import log_performance
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,10 @@ class TextToSpeech:
     
     Supports multiple voices and configurable speed
     """
+
+    # Speed is a synthesis option; each Piper voice is its own model
+    LIVE_SETTINGS = {"tts_speed": "update_speed"}
+    RELOAD_SETTINGS = ("tts_voice",)
     
     def __init__(self, settings: Settings):
         """
@@ -32,6 +37,7 @@ class TextToSpeech:
         
         logger.info(f"TextToSpeech initialized with voice: {self.voice}, speed: {self.speed}")
     
+    @log_performance
     async def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
         """
         Synthesize speech from text
@@ -17,6 +17,9 @@ class WakeWordDetector:
     
     Supports multiple wake words with configurable sensitivity
     """
+
+    # Keywords and sensitivities are fixed when the detector engine is created
+    RELOAD_SETTINGS = ("wakeword_keywords", "wakeword_sensitivity")
     
     def __init__(self, settings: Settings, audio_io: AudioIO):
         """
@@ -0,0 +1,45 @@
+"""Tests for the dashboard BroadcastHub."""
+import asyncio
+from src.api.broadcast import BroadcastHub
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed = False
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_slow_client_is_dropped_without_stalling_others():
+    """One serialisation per message; a stalled client is disconnected."""
+    hub = BroadcastHub(send_timeout=0.05)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=10)
+    hub.register(fast)
+    hub.register(slow)
+    hub.publish({"type": "status", "data": {"cpu_percent": 1}})
+    await asyncio.sleep(0.1)
+    hub.publish({"type": "status", "data": {"cpu_percent": 2}})
+    await asyncio.sleep(0.01)
+    assert len(fast.sent) == 2 and '"cpu_percent": 2' in fast.sent[1]
+    assert slow.closed and slow not in hub.clients
+    assert hub.get_stats()["dropped_clients"] == 1
+    await hub.close()
+
+
+async def test_new_client_gets_latest_snapshot():
+    """Late joiners receive the last message for each key right away."""
+    hub = BroadcastHub()
+    hub.publish({"type": "status", "data": 1})
+    hub.publish({"type": "status", "data": 2})
+    client = FakeWebSocket()
+    hub.register(client)
+    await asyncio.sleep(0.01)
+    assert client.sent == ['{"type": "status", "data": 2}']
+    await hub.close()
@@ -0,0 +1,65 @@
+"""Tests for camera calibration persistence and undistortion."""
+import numpy as np
+import pytest
+
+from src.vision.calibration import MAP_X_FILE, CameraCalibration
+
+cv2 = pytest.importorskip("cv2")
+
+CAMERA_MATRIX = np.array([[400.0, 0, 320], [0, 400.0, 240], [0, 0, 1]])
+DIST_COEFFS = np.array([-0.2, 0.05, 0, 0, 0])
+
+
+def checkerboard(width, height, square):
+    """Checkerboard test pattern"""
+    ys, xs = np.mgrid[0:height, 0:width]
+    board = (((xs // square) + (ys // square)) % 2 * 255).astype(np.uint8)
+    return cv2.cvtColor(board, cv2.COLOR_GRAY2BGR)
+
+
+def test_save_and_load_memory_maps_undistortion_maps(tmp_path):
+    """Saved maps are memory-mapped on load and give the same undistortion."""
+    calibration = CameraCalibration(CAMERA_MATRIX, DIST_COEFFS, (640, 480), rms_error=0.3)
+    calibration.save(tmp_path)
+    assert (tmp_path / MAP_X_FILE).exists()
+
+    loaded = CameraCalibration.load(tmp_path)
+    assert isinstance(loaded.map_x, np.memmap) and isinstance(loaded.map_y, np.memmap)
+    assert loaded.image_size == (640, 480) and loaded.rms_error == 0.3
+    np.testing.assert_array_equal(loaded.camera_matrix, CAMERA_MATRIX)
+
+    frame = checkerboard(640, 480, 40)
+    np.testing.assert_array_equal(loaded.undistort(frame), calibration.undistort(frame))
+    assert not np.array_equal(loaded.undistort(frame), frame)
+
+    assert CameraCalibration.load(tmp_path / "missing") is None
+
+
+def test_mismatched_stored_maps_are_rebuilt(tmp_path):
+    """Maps that do not match the calibrated size are not used for remapping."""
+    CameraCalibration(CAMERA_MATRIX, DIST_COEFFS, (640, 480)).save(tmp_path)
+    np.save(tmp_path / MAP_X_FILE, np.zeros((10, 10), np.float32))
+    loaded = CameraCalibration.load(tmp_path)
+    assert loaded.map_x.shape == (480, 640)
+
+
+def test_undistort_scales_intrinsics_to_frame_size():
+    """A half-resolution frame is undistorted like a downscaled full-resolution one."""
+    calibration = CameraCalibration(CAMERA_MATRIX, DIST_COEFFS, (640, 480))
+    half = calibration.resized((320, 240))
+    np.testing.assert_allclose(half.camera_matrix, [[200, 0, 160], [0, 200, 120], [0, 0, 1]])
+    assert calibration.resized((320, 240)) is half
+    assert calibration.resized((640, 480)) is calibration
+
+    frame = checkerboard(640, 480, 40)
+    expected = cv2.resize(calibration.undistort(frame), (320, 240), interpolation=cv2.INTER_AREA)
+    result = calibration.undistort(cv2.resize(frame, (320, 240), interpolation=cv2.INTER_AREA))
+    assert result.shape == (240, 320, 3)
+    assert np.abs(result.astype(int) - expected.astype(int)).mean() < 5
+
+
+def test_undistort_rejects_other_aspect_ratio():
+    """A frame cropped to another aspect ratio cannot reuse the calibration."""
+    calibration = CameraCalibration(CAMERA_MATRIX, DIST_COEFFS, (640, 480))
+    with pytest.raises(ValueError, match="aspect ratio"):
+        calibration.undistort(np.zeros((360, 640, 3), np.uint8))
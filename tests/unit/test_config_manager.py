@@ -0,0 +1,41 @@
+"""Tests for transactional ConfigManager updates."""
+import json
+
+import pytest
+
+from src.config.config_manager import ConfigManager, ConfigValidationError
+from src.config.settings import Settings
+
+
+class RecordingBus:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event_type, data=None, priority=0):
+        self.events.append((event_type, data))
+
+
+def test_batch_update_is_atomic_debounced_and_emits_one_diff(tmp_path):
+    """A batch is validated as a whole, written once, and announced once."""
+    bus = RecordingBus()
+    config_file = tmp_path / "settings.json"
+    manager = ConfigManager(Settings(), bus, config_file=config_file, save_delay=60)
+
+    changes = manager.update_settings({"llm_temperature": "0.3", "tts_speed": 1.2, "log_level": manager.settings.log_level})
+    assert changes == {
+        "llm_temperature": {"old_value": 0.7, "new_value": 0.3},
+        "tts_speed": {"old_value": Settings().tts_speed, "new_value": 1.2},
+    }
+    manager.update_settings({"llm_temperature": 0.4})
+    assert [event for event, _ in bus.events] == ["config_changed", "config_changed"]
+    assert manager.saves == 0 and not config_file.exists()
+
+    with pytest.raises(ConfigValidationError) as error:
+        manager.update_settings({"llm_temperature": 0.9, "llm_max_tokens": "many"})
+    assert set(error.value.errors) == {"llm_max_tokens"}
+    assert manager.settings.llm_temperature == 0.4
+
+    manager.flush()
+    assert manager.saves == 1
+    assert json.loads(config_file.read_text()) == {"llm_temperature": 0.4, "tts_speed": 1.2}
+    assert not manager.update_setting("no_such_setting", 1)
@@ -0,0 +1,119 @@
+"""Tests for the application container."""
+import asyncio
+import json
+
+import numpy as np
+
+from src.config.config_manager import ConfigManager
+from src.config.settings import Settings
+from src.core.container import Container
+from src.core.event_bus import EventBus
+from src.vision.camera import Camera
+
+
+async def test_config_changes_reach_running_components(tmp_path):
+    """An update through the shared manager is applied to the live LLM client and saved on stop."""
+    settings = Settings()
+    bus = EventBus()
+    config_file = tmp_path / "settings.json"
+    container = Container(settings, bus, ConfigManager(settings, bus, config_file=config_file, save_delay=60))
+    await container.start()
+    llm = container.llm_client
+    assert container.llm_client is llm
+
+    container.config_manager.update_settings({"llm_temperature": 0.1, "llm_model": "tiny"})
+    for _ in range(50):
+        if llm.model == "tiny":
+            break
+        await asyncio.sleep(0.01)
+    assert (llm.model, llm.temperature) == ("tiny", 0.1)
+
+    await container.stop()
+    assert json.loads(config_file.read_text()) == {"llm_temperature": 0.1, "llm_model": "tiny"}
+
+
+async def test_camera_and_wakeword_follow_settings(tmp_path):
+    """Camera frame rate changes apply in place; new wake words rebuild the detector."""
+    settings = Settings()
+    bus = EventBus()
+    container = Container(settings, bus, ConfigManager(settings, bus, config_file=tmp_path / "settings.json", save_delay=60))
+    await container.start()
+    camera = container.camera.current
+    detector = container.wake_word.current
+
+    container.config_manager.update_settings({"camera_fps": 15, "wakeword_keywords": ["hello zema"]})
+    for _ in range(50):
+        if container.wake_word.generation:
+            break
+        await asyncio.sleep(0.01)
+    await container.reconfigurator.wait_idle()
+    assert container.camera.current is camera and camera.fps == 15
+    assert container.wake_word.current is not detector
+    assert container.wake_word.current.keywords == ["hello zema"]
+    await container.stop()
+
+
+async def test_vision_pipeline_runs_on_the_shared_camera(tmp_path, monkeypatch):
+    """Starting vision attaches every component to the shared camera and stopping the container stops it."""
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    monkeypatch.setattr(Camera, "open", lambda self: True)
+    monkeypatch.setattr(Camera, "capture_frame", lambda self: frame)
+    settings = Settings(calibration_path=str(tmp_path / "calibration"))
+    bus = EventBus()
+    container = Container(settings, bus, ConfigManager(settings, bus, config_file=tmp_path / "settings.json", save_delay=60))
+    await container.start()
+    completed = container.inference_executor.get_stats()["completed"]
+
+    assert await container.start_vision()
+    scheduler = container.vision_scheduler
+    assert container.vision_running and scheduler.camera is container.camera
+    assert set(scheduler.consumers) == {"detector", "gestures", "measurement", "analyzer"}
+    assert await scheduler.next_frame() is frame
+    for _ in range(100):
+        if scheduler.consumers["detector"].processed:
+            break
+        await asyncio.sleep(0.01)
+    assert container.inference_executor.get_stats()["completed"] > completed
+
+    await container.stop()
+    assert not container.vision_running
+
+
+async def test_vision_not_started_without_camera(tmp_path):
+    """Without a camera the vision step reports unavailable and nothing runs."""
+    settings = Settings()
+    bus = EventBus()
+    container = Container(settings, bus, ConfigManager(settings, bus, config_file=tmp_path / "settings.json", save_delay=60))
+    assert not await container.start_vision()
+    assert not container.vision_running and not container.vision_scheduler.consumers
+
+
+async def test_config_route_applies_component_settings(tmp_path):
+    """Settings that components declare as live or reloadable can be changed through POST /api/config."""
+    import httpx
+    from fastapi import FastAPI
+    from src.api.routes import config
+
+    settings = Settings()
+    bus = EventBus()
+    container = Container(settings, bus, ConfigManager(settings, bus, config_file=tmp_path / "settings.json", save_delay=60))
+    await container.start()
+    llm, camera, stt = container.llm_client, container.camera.current, container.speech_to_text.current
+    app = FastAPI()
+    app.include_router(config.router)
+    app.state.container = container
+
+    updates = {"ollama_url": "http://127.0.0.1:11500", "camera_fps": 15, "stt_model": "tiny"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        for key, value in updates.items():
+            response = await client.post("/api/config", json={"key": key, "value": value})
+            assert response.status_code == 200 and response.json()["value"] == value
+    for _ in range(50):
+        if container.speech_to_text.generation:
+            break
+        await asyncio.sleep(0.01)
+    await container.reconfigurator.wait_idle()
+
+    assert llm.base_url == "http://127.0.0.1:11500" and camera.fps == 15
+    assert container.speech_to_text.current is not stt and container.speech_to_text.current.model_size == "tiny"
+    await container.stop()
@@ -0,0 +1,108 @@
+"""Tests for EventBus delivery modes."""
+import asyncio
+import threading
+from src.core.event_bus import EventBus, COALESCE, DROP_NEWEST
+
+
+def test_sync_delivery_before_start():
+    """An unstarted bus calls subscribers in the emitter's thread."""
+    bus = EventBus()
+    received = []
+    bus.subscribe("config_changed", received.append)
+    bus.emit("config_changed", {"key": "tts_speed"})
+    assert received == [{"key": "tts_speed"}]
+
+
+async def test_async_subscriber_and_priority():
+    """Queued events are delivered highest priority first."""
+    bus = EventBus()
+    received = []
+    gate = asyncio.Event()
+
+    async def slow(data):
+        await gate.wait()
+        received.append(data)
+
+    bus.subscribe("audio", slow)
+    await bus.start()
+    bus.emit("audio", "first")
+    await asyncio.sleep(0)
+    bus.emit("audio", "low", priority=0)
+    bus.emit("audio", "high", priority=5)
+    gate.set()
+    await bus.stop()
+    assert received == ["first", "high", "low"]
+
+
+async def test_overflow_policies():
+    """Full queues drop or coalesce instead of growing."""
+    bus = EventBus()
+    gate = asyncio.Event()
+    newest, coalesced = [], []
+
+    async def reject(data):
+        await gate.wait()
+        newest.append(data)
+
+    async def latest(data):
+        await gate.wait()
+        coalesced.append(data)
+
+    bus.subscribe("level", reject, max_queue=2, policy=DROP_NEWEST)
+    bus.subscribe("level", latest, policy=COALESCE)
+    await bus.start()
+    for value in range(5):
+        bus.emit("level", value)
+    gate.set()
+    await bus.stop()
+    assert newest == [0, 1]
+    assert coalesced == [4]
+    assert bus.get_metrics()["topics"]["level"]["dropped"] == 7
+
+
+async def test_emit_from_other_thread():
+    """emit() is safe from non-loop threads once started."""
+    bus = EventBus()
+    received = asyncio.Event()
+    bus.subscribe("wake", lambda data: received.set())
+    await bus.start()
+    threading.Thread(target=bus.emit, args=("wake",)).start()
+    await asyncio.wait_for(received.wait(), timeout=1)
+    await bus.stop()
+
+
+def test_wildcard_routing_and_handle_unsubscribe():
+    """Patterns resolve per topic and handles unsubscribe directly."""
+    bus = EventBus()
+    voice, vision = [], []
+    handle = bus.subscribe("voice.*", voice.append)
+    bus.subscribe("vision.**", vision.append)
+
+    bus.emit("voice.wake", 1)
+    bus.emit("voice.stt.final", 2)
+    bus.emit("vision.detection.person", 3)
+    bus.emit("vision", 4)
+    assert voice == [1]
+    assert vision == [3, 4]
+
+    handle.unsubscribe()
+    bus.emit("voice.wake", 5)
+    assert voice == [1]
+    assert bus.subscribers_for("voice.wake") == ()
+
+
+async def test_rate_limited_batches_keep_latest_per_key():
+    """Rate-limited subscribers get one batch of the latest value per key."""
+    bus = EventBus()
+    batches = []
+    bus.subscribe("vision.**", batches.append, max_rate_hz=20, batch=True)
+    bus.emit("vision.detection", 0)  # Buffered until start
+    await bus.start()
+    for value in range(1, 50):
+        bus.emit("vision.detection", value)
+        bus.emit("vision.fps", value)
+    await asyncio.sleep(0.2)
+    await bus.stop()
+    assert len(batches) <= 5
+    latest = {e["event_type"]: e["data"] for batch in batches for e in batch}
+    assert latest == {"vision.detection": 49, "vision.fps": 49}
@@ -0,0 +1,134 @@
+"""Tests for GestureDetector pose classification, debouncing and ROI scheduling."""
+import time
+
+import numpy as np
+
+from src.core.event_bus import EventBus
+from src.vision.gestures import GestureDetector
+
+FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+PERSON = {"bbox": [200, 40, 440, 480], "label": "person", "confidence": 0.9}
+
+
+class InlineExecutor:
+    """Runs jobs in the calling thread."""
+
+    async def run(self, func, *args):
+        return func(*args)
+
+
+def make_hand(extended=(False, False, False, False), thumb_up=False, x=100.0):
+    """(21, 2) landmarks in pixels; wrist at (x, 200), hand size 50."""
+    points = np.tile(np.array([x, 200.0], dtype=np.float32), (21, 1))
+    points[9] = (x, 150)
+    for i, is_extended in enumerate(extended):
+        points[6 + 4 * i] = (x - 20 + 10 * i, 140)
+        points[8 + 4 * i] = (x - 20 + 10 * i, 100 if is_extended else 170)
+    points[2] = (x + 30, 180)
+    points[4] = (x + 30, 140) if thumb_up else (x + 40, 180)
+    return points
+
+
+def make_detector(settings, hand=None, bus=None):
+    """Detector whose hand model returns the given frame-pixel landmarks (or None)."""
+    detector = GestureDetector(settings, bus, executor=InlineExecutor())
+    detector.landmarks = hand
+
+    def detect_hand(crop):
+        if detector.landmarks is None:
+            return None
+        # Normalise to the crop the detector actually passed in
+        x, y, stride = detector.last_origin
+        return (detector.landmarks - (x, y)) / (np.array(crop.shape[1::-1]) * stride)
+
+    crop = detector._crop
+
+    def tracked_crop(frame):
+        result, origin = crop(frame)
+        detector.last_origin = origin
+        return result, origin
+
+    detector._crop = tracked_crop
+    detector._detect_hand = detect_hand
+    return detector
+
+
+def test_classify_poses(settings):
+    """Thumbs up, peace sign and open hand are told apart; waving needs wrist motion."""
+    detector = GestureDetector(settings, executor=InlineExecutor())
+    assert detector.classify(make_hand(thumb_up=True), 0.0) == "thumbs_up"
+    assert detector.classify(make_hand(extended=(True, True, False, False)), 0.0) == "peace_sign"
+    open_hand = make_hand(extended=(True, True, True, True))
+    assert detector.classify(open_hand, 0.0) is None
+
+    for i, x in enumerate((0.40, 0.50, 0.40, 0.50, 0.40)):
+        detector._wrist_history.append((i * 0.1, x))
+    assert detector.classify(open_hand, 0.4) == "wave"
+
+
+def test_debounce_and_cooldown(settings):
+    """A gesture is reported after debounce_frames stable frames and not again within the cooldown."""
+    bus = EventBus()
+    seen = []
+    bus.subscribe("gesture_detected", seen.append)
+    detector = GestureDetector(settings, bus, executor=InlineExecutor())
+    frames = detector.debounce_frames
+
+    results = [detector._debounce("peace_sign", 0.1 * i) for i in range(frames + 1)]
+    assert results == [None] * (frames - 1) + ["peace_sign", None]
+    assert detector._debounce(None, 1.0) is None
+    later = 1.0 + detector.cooldown
+    assert [detector._debounce("peace_sign", later + 0.1 * i) for i in range(frames)][-1] == "peace_sign"
+    assert [event["gesture"] for event in seen] == ["peace_sign", "peace_sign"]
+
+
+def test_roi_expand_and_crop(settings):
+    """The person box seeds an expanded, clamped ROI; crops are strided to the model size."""
+    detector = GestureDetector(settings, executor=InlineExecutor())
+    detector.update_roi([PERSON], FRAME.shape[:2])
+    x1, y1, x2, y2 = detector._roi
+    assert (x1, y1, x2) == (140, 0, 500) and y2 == int(260 + 220 * detector.roi_margin)
+
+    crop, (ox, oy, stride) = detector._crop(FRAME)
+    assert (ox, oy, stride) == (140, 0, 2)
+    assert crop.shape[:2] == (-(-y2 // 2), 180)
+
+
+async def test_hand_lost_resets_roi_and_interval(settings):
+    """Tracking narrows the ROI and runs fast; losing the hand widens the ROI and slows down."""
+    detector = make_detector(settings, hand=make_hand(extended=(True, True, False, False), x=300))
+    detector.update_roi([PERSON], FRAME.shape[:2])
+    person_roi = detector._roi
+
+    await detector.detect_gesture(FRAME)
+    assert detector._hand_visible
+    assert detector._roi != person_roi
+    assert detector._roi[2] - detector._roi[0] < person_roi[2] - person_roi[0]
+    assert detector._next_run - time.monotonic() <= detector.active_interval
+
+    detector._next_run = 0.0
+    detector.landmarks = None
+    await detector.detect_gesture(FRAME)
+    assert not detector._hand_visible
+    assert detector._roi == person_roi
+    assert detector._next_run - time.monotonic() > detector.active_interval
+
+    # With no person seen, the search falls back to the full frame
+    plain = make_detector(settings, hand=make_hand(x=300))
+    await plain.detect_gesture(FRAME)
+    plain._next_run = 0.0
+    plain.landmarks = None
+    await plain.detect_gesture(FRAME)
+    assert plain._roi is None
+
+
+async def test_frames_are_skipped_between_runs(settings):
+    """Calls before the next scheduled run return immediately without running the model."""
+    detector = make_detector(settings, hand=None)
+    calls = []
+    inner = detector._detect_hand
+    detector._detect_hand = lambda crop: calls.append(1) or inner(crop)
+    await detector.detect_gesture(FRAME)
+    await detector.detect_gesture(FRAME)
+    assert len(calls) == 1
+    assert not detector.should_process()
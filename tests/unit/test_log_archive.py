@@ -0,0 +1,60 @@
+"""Tests for compressed log archives."""
+import gzip
+import json
+import logging
+import time
+
+from src.utils import log_archive
+from src.utils.log_archive import ArchiveSegment, ArchivingRotatingFileHandler, LogArchiver, compress_segment
+from src.utils.log_store import LogStore
+
+BASE = 1_700_000_000
+
+
+def write_records(path, start, count):
+    with open(path, "a") as f:
+        for i in range(start, start + count):
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(BASE + i)),
+                "level": "ERROR" if i == 150 else "INFO",
+                "logger": "test",
+                "message": f"event {i}",
+            }) + "\n")
+
+
+def test_frames_are_selected_by_time_and_level(tmp_path, monkeypatch):
+    """Only frames overlapping the filters are decompressed; gzip output stays zcat-compatible."""
+    monkeypatch.setattr(log_archive, "FRAME_SIZE", 2000)
+    segment = tmp_path / "segment.log"
+    write_records(segment, 0, 200)
+    archive_path = compress_segment(segment, tmp_path / "archive", codec="gzip")
+
+    archive = ArchiveSegment(archive_path)
+    assert len(archive.offsets) > 5
+    assert gzip.decompress(archive_path.read_bytes()) == segment.read_bytes()
+    assert len(archive.frames(level="ERROR")) == 1
+    assert len(archive.frames(since=BASE + 100, until=BASE + 101)) == 1
+
+    store = LogStore(tmp_path / "zema.log", archive_dir=tmp_path / "archive")
+    write_records(tmp_path / "zema.log", 200, 10)
+    assert [r["message"] for r in store.query(limit=12)][:3] == ["event 198", "event 199", "event 200"]
+    assert [r["message"] for r in store.query(level="ERROR")] == ["event 150"]
+    assert [r["message"] for r in store.query(since=BASE + 100, until=BASE + 102)] == ["event 100", "event 101", "event 102"]
+
+
+def test_rotation_archives_oldest_backup(tmp_path):
+    """The backup that rotation would delete is compressed instead."""
+    archiver = LogArchiver(tmp_path / "archive", retention_days=100000, codec="gzip")
+    archiver.start()
+    handler = ArchivingRotatingFileHandler(tmp_path / "zema.log", archiver, maxBytes=2000, backupCount=1)
+    handler.setFormatter(logging.Formatter('{"timestamp": "%(asctime)s", "level": "%(levelname)s", "message": "%(message)s"}'))
+    for i in range(100):
+        handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, f"line {i}", None, None))
+    handler.close()
+    archiver.stop()
+
+    archived = log_archive.list_archives(tmp_path / "archive")
+    assert archived and not list((tmp_path / "archive").glob("pending-*"))
+    store = LogStore(tmp_path / "zema.log", backup_count=1, archive_dir=tmp_path / "archive")
+    messages = [r["message"] for r in store.query(limit=100, tail=False)]
+    assert messages == [f"line {i}" for i in range(100)]
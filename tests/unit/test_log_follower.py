@@ -0,0 +1,45 @@
+"""Tests for the shared log follower."""
+import asyncio
+import json
+import os
+
+from src.utils.log_follower import LogFollower
+
+
+def append(path, level, message):
+    with open(path, "a") as f:
+        f.write(json.dumps({"level": level, "logger": "test", "message": message}) + "\n")
+
+
+async def next_message(subscriber):
+    record = await asyncio.wait_for(subscriber.queue.get(), timeout=2.0)
+    return record["message"]
+
+
+async def test_follower_fans_out_with_filters_and_survives_rotation(tmp_path):
+    """New lines reach matching subscribers once; rotation switches to the new file."""
+    log_file = tmp_path / "zema.log"
+    append(log_file, "INFO", "before start")
+    follower = LogFollower(log_file, poll_interval=0.05)
+    everything = follower.subscribe()
+    errors = follower.subscribe(level="ERROR")
+    camera = follower.subscribe(search="CAMERA")
+
+    append(log_file, "INFO", "camera ready")
+    append(log_file, "ERROR", "model failed")
+    assert await next_message(everything) == "camera ready"
+    assert await next_message(everything) == "model failed"
+    assert await next_message(errors) == "model failed"
+    assert await next_message(camera) == "camera ready"
+
+    append(log_file, "ERROR", "last line of old file")
+    os.rename(log_file, tmp_path / "zema.log.1")
+    append(log_file, "ERROR", "first line of new file")
+    assert await next_message(errors) == "last line of old file"
+    assert await next_message(errors) == "first line of new file"
+    assert follower.get_stats()["rotations"] == 1
+    assert camera.queue.empty()
+
+    for subscriber in (everything, errors, camera):
+        follower.unsubscribe(subscriber)
+    assert follower.mode == "stopped"
@@ -0,0 +1,60 @@
+"""Tests for the FTS5 log index."""
+import logging
+import time
+
+import pytest
+
+from src.utils.log_index import FTS5_AVAILABLE, LogIndex, LogIndexHandler, QueryError, parse_query
+from src.utils.logger import JSONFormatter
+
+pytestmark = pytest.mark.skipif(not FTS5_AVAILABLE, reason="SQLite built without FTS5")
+
+
+def make_record(name, level, message, created):
+    record = logging.LogRecord(name, level, __file__, 1, message, None, None, "run")
+    record.created = created
+    return record
+
+
+def test_parse_query_fields():
+    """Column fields become SQL filters; text becomes an FTS5 expression."""
+    conditions, params, match = parse_query('level:error,warning logger:src.ai* "model load" time*')
+    assert conditions == ["l.level IN (?,?)", "l.logger GLOB ?"]
+    assert params == ["ERROR", "WARNING", "src.ai*"]
+    assert match == '"model load" AND "time"*'
+    with pytest.raises(QueryError):
+        parse_query("color:red")
+
+
+def test_handler_indexes_batches_and_search_paginates(tmp_path):
+    """Records written through the handler are searchable by field, text, time and cursor."""
+    base = time.time() - 100
+    index = LogIndex(tmp_path / "logs.db")
+    handler = LogIndexHandler(index)
+    handler.setFormatter(JSONFormatter())
+    records = []
+    for i in range(30):
+        name = "src.ai.llm_client" if i % 2 else "src.voice.stt"
+        level = logging.ERROR if i % 5 == 0 else logging.INFO
+        records.append(make_record(name, level, f"request {i} timeout" if i % 3 == 0 else f"request {i} ok", base + i))
+    handler.emit_batch(records)
+    handler.close()
+
+    assert index.count() == 30
+    errors = index.search("level:ERROR")["logs"]
+    assert [r["message"] for r in errors] == [f"request {i} {'timeout' if i % 3 == 0 else 'ok'}" for i in (25, 20, 15, 10, 5, 0)]
+
+    ai_timeouts = index.search("logger:src.ai* timeout")["logs"]
+    assert [r["message"] for r in ai_timeouts] == ["request 27 timeout", "request 21 timeout", "request 15 timeout",
+                                                    "request 9 timeout", "request 3 timeout"]
+    assert all(r["logger"] == "src.ai.llm_client" for r in ai_timeouts)
+
+    first = index.search("timeout", limit=4)
+    second = index.search("timeout", limit=4, cursor=first["next_cursor"])
+    assert [r["message"].split()[1] for r in first["logs"] + second["logs"]] == ["27", "24", "21", "18", "15", "12", "9", "6"]
+
+    assert len(index.search("", since=base + 10, until=base + 14)["logs"]) == 5
+
+    assert index.clear() == 30
+    assert index.count() == 0
+    assert index.search("timeout")["logs"] == []
@@ -0,0 +1,62 @@
+"""Tests for the queued, batching log pipeline."""
+import logging
+import queue
+import threading
+import time
+from src.utils.log_pipeline import (
+    DROP_OLDEST, BatchingQueueListener, BatchRotatingFileHandler, BoundedQueueHandler, create_pipeline
+)
+
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_full_queue_counts_drops_per_policy():
+    """Overflow never blocks; drops are counted by level."""
+    newest = BoundedQueueHandler(queue.Queue(maxsize=2))
+    oldest = BoundedQueueHandler(queue.Queue(maxsize=2), DROP_OLDEST)
+    for handler in (newest, oldest):
+        for i, level in enumerate((logging.DEBUG, logging.INFO, logging.ERROR)):
+            handler.handle(make_record(f"m{i}", level))
+    assert [r.msg for r in newest.queue.queue] == ["m0", "m1"]
+    assert dict(newest.dropped) == {"ERROR": 1}
+    assert [r.msg for r in oldest.queue.queue] == ["m1", "m2"]
+    assert dict(oldest.dropped) == {"DEBUG": 1}
+
+
+def test_listener_writes_batches_to_file(tmp_path):
+    """Queued records reach the file in batches and are flushed on stop."""
+    file_handler = BatchRotatingFileHandler(tmp_path / "zema.log", maxBytes=10**6, backupCount=1)
+    pipeline = create_pipeline([file_handler], batch_size=50, flush_interval=0.05)
+    for i in range(120):
+        pipeline.handler.handle(make_record("line %d" % i))
+    pipeline.stop()
+    lines = (tmp_path / "zema.log").read_text().splitlines()
+    assert lines == [f"line {i}" for i in range(120)]
+    assert pipeline.get_stats()["written"] == 120
+    assert pipeline.listener.batches < 120
+    file_handler.close()
+
+
+def test_stop_returns_when_the_listener_is_stuck():
+    """A full queue and a blocked handler delay stop by at most its timeout."""
+    release = threading.Event()
+
+    class BlockedHandler(logging.Handler):
+        def emit(self, record):
+            release.wait(5)
+
+    log_queue = queue.Queue(maxsize=2)
+    listener = BatchingQueueListener(log_queue, [BlockedHandler()], batch_size=1, flush_interval=0.01)
+    listener.start()
+    thread = listener._thread
+    for i in range(3):
+        log_queue.put(make_record(f"m{i}"), timeout=1)
+
+    start = time.monotonic()
+    listener.stop(timeout=0.2)
+    assert time.monotonic() - start < 1
+    release.set()
+    thread.join(1)
+    assert not thread.is_alive()
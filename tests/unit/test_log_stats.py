@@ -0,0 +1,57 @@
+"""Tests for incremental log statistics."""
+import logging
+import time
+
+from src.utils.log_stats import LogStats, LogStatsHandler, error_key, read_log_stats, reset_log_stats
+
+
+def test_counts_series_and_persistence(tmp_path):
+    """Counters, per-minute errors and top errors survive a save/load round trip."""
+    now = time.time()
+    stats = LogStats()
+    stats.add("INFO", "src.voice.stt", "ready", now)
+    stats.add("ERROR", "src.ai.llm_client", "Request 12 timed out after 30.5s", now - 120)
+    stats.add("ERROR", "src.ai.llm_client", "Request 13 timed out after 31.0s", now)
+    stats.add("CRITICAL", "src.vision.camera", "Camera 'usb0' lost", now)
+
+    path = tmp_path / "stats.json"
+    stats.save(path)
+    restored = LogStats.load(path)
+    snapshot = restored.snapshot()
+
+    assert snapshot["total"] == 4
+    assert snapshot["level_counts"]["ERROR"] == 2
+    assert snapshot["top_loggers"][0] == ("src.ai.llm_client", 2)
+    assert snapshot["top_errors"][0] == ("Request # timed out after #s", 2)
+    assert snapshot["errors_last_hour"] == 3
+    series = restored.error_series(5)
+    assert len(series["errors"]) == 5 and sum(series["errors"]) == 3 and series["errors"][-1] == 2
+    assert error_key("Camera 'usb0' lost\nTraceback ...") == "Camera # lost"
+
+
+def test_handler_restores_and_saves_on_close(tmp_path):
+    """The pipeline handler resumes from the saved file."""
+    path = tmp_path / "stats.json"
+    for _ in range(2):
+        handler = LogStatsHandler(path)
+        handler.emit_batch([logging.LogRecord("test", logging.WARNING, __file__, 1, "slow", None, None)])
+        handler.close()
+    assert LogStats.load(path).snapshot()["level_counts"]["WARNING"] == 2
+
+
+def test_reset_after_clear(tmp_path):
+    """Clearing the log resets the counts, including the saved file read by other processes."""
+    path = tmp_path / "stats.json"
+    stats = LogStats()
+    stats.add("ERROR", "src.ai.llm_client", "timeout", time.time())
+    stats.save(path)
+    assert read_log_stats(path).snapshot()["total"] == 1
+
+    before = time.time()
+    reset_log_stats(path)
+    snapshot = read_log_stats(path).snapshot()
+    assert snapshot["total"] == 0 and snapshot["errors_last_hour"] == 0
+    assert snapshot["top_errors"] == [] and snapshot["since"] >= before
+
+    stats.reset()
+    assert stats.snapshot()["level_counts"]["ERROR"] == 0
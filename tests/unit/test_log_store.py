@@ -0,0 +1,52 @@
+"""Tests for the indexed log reader."""
+import json
+import time
+
+from src.utils.log_store import LogStore, read_tail
+
+BASE = 1_700_000_000
+
+
+def write_records(path, start, count):
+    """Append JSON log lines, one per second, every third one an ERROR."""
+    with open(path, "a") as f:
+        for i in range(start, start + count):
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(BASE + i)),
+                "level": "ERROR" if i % 3 == 0 else "INFO",
+                "logger": "test",
+                "message": f"event {i}",
+            }) + "\n")
+
+
+def test_query_spans_rotated_segments_with_filters(tmp_path):
+    """Tail, level and time filters read across zema.log and its backups."""
+    log_file = tmp_path / "zema.log"
+    write_records(tmp_path / "zema.log.1", 0, 50)
+    write_records(log_file, 50, 50)
+    store = LogStore(log_file)
+
+    assert [r["message"] for r in store.query(limit=3)] == ["event 97", "event 98", "event 99"]
+    assert [r["message"] for r in store.query(limit=2, tail=False)] == ["event 0", "event 1"]
+
+    errors = store.query(limit=100, level="ERROR")
+    assert len(errors) == 34 and all(r["level"] == "ERROR" for r in errors)
+
+    window = store.query(limit=100, since=BASE + 45, until=BASE + 54)
+    assert [r["message"] for r in window] == [f"event {i}" for i in range(45, 55)]
+
+    assert [r["message"] for r in store.query(limit=5, search="event 7")] == [
+        "event 75", "event 76", "event 77", "event 78", "event 79"]
+
+
+def test_index_extends_incrementally(tmp_path):
+    """Appended lines are indexed without re-reading the file."""
+    log_file = tmp_path / "zema.log"
+    write_records(log_file, 0, 10)
+    store = LogStore(log_file)
+    assert len(store.query(limit=100, level="ERROR")) == 4
+
+    write_records(log_file, 10, 10)
+    assert len(store.index(log_file).offsets) == 20
+    assert len(store.query(limit=100, level="ERROR")) == 7
+    assert read_tail(log_file, 1)[0].endswith(b'"event 19"}')
@@ -0,0 +1,49 @@
+"""Tests for metric object measurement."""
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.vision.calibration import CameraCalibration
+from src.vision.measurement import Measurement
+
+pytest.importorskip("cv2")
+
+
+@pytest.fixture
+def measurement(tmp_path):
+    """Distortion-free 640x480 calibration with a 500px focal length"""
+    calibration = CameraCalibration(np.array([[500.0, 0, 320], [0, 500.0, 240], [0, 0, 1]]), np.zeros(5), (640, 480))
+    calibration.save(tmp_path)
+    measurement = Measurement(Settings(calibration_path=str(tmp_path), measurement_default_distance_mm=500.0))
+    assert measurement.calibrated
+    return measurement
+
+
+def test_reference_object_scales_all_boxes(measurement):
+    """Boxes are scaled by the reference object's millimetres per pixel."""
+    card = [100, 100, 185.6, 154]
+    results = measurement.measure_objects(
+        [{"label": "cup", "bbox": [200, 100, 280, 220]}, {"label": "book", "bbox": [0, 0, 300, 200]}],
+        reference_object={"label": "credit card", "bbox": card},
+    )
+    assert results[0] == {"label": "cup", "width": pytest.approx(80.0), "height": pytest.approx(120.0)}
+    assert results[1]["width"] == pytest.approx(300.0)
+
+
+def test_pinhole_measurement_uses_frame_resolution(measurement):
+    """Pixel sizes from a half-resolution frame use intrinsics scaled to that frame."""
+    full = measurement.measure_boxes([[0, 0, 100, 50]])
+    half = measurement.measure_boxes([[0, 0, 50, 25]], image_size=(320, 240))
+    np.testing.assert_allclose(full, [[100.0, 50.0]])
+    np.testing.assert_allclose(half, full)
+    with pytest.raises(ValueError):
+        measurement.measure_boxes([[0, 0, 50, 25]], image_size=(640, 360))
+
+
+async def test_measure_object_reads_frame_size(measurement):
+    """The most prominent detection is measured at the frame's resolution."""
+    frame = np.zeros((240, 320, 3), np.uint8)
+    result = await measurement.measure_object(frame, detections=[
+        {"label": "cup", "bbox": [0, 0, 10, 10]}, {"label": "box", "bbox": [0, 0, 50, 25]}
+    ])
+    assert result == {"width": pytest.approx(100.0), "height": pytest.approx(50.0), "depth": 0.0}
@@ -0,0 +1,50 @@
+"""Tests for Prometheus metrics rendering."""
+from src.utils.metrics import MetricsRegistry, performance_collector
+from src.utils.performance import PerformanceMonitor
+
+
+def test_render_counters_and_histograms():
+    """Counters render with labels; histograms fold into export buckets."""
+    registry = MetricsRegistry()
+    registry.describe("zema_llm_tokens_total", "counter", "Tokens")
+    registry.inc("zema_llm_tokens_total", 12, model='llama"3')
+    monitor = PerformanceMonitor()
+    for ms in (0.5, 3, 40, 2000):
+        monitor.record("vision", "detect", ms)
+    registry.register_collector(performance_collector(monitor))
+
+    text = registry.render()
+    assert '# TYPE zema_llm_tokens_total counter' in text
+    assert 'zema_llm_tokens_total{model="llama\\"3"} 12.0' in text
+    bucket = 'zema_operation_duration_seconds_bucket{component="vision",operation="detect",le="%s"}'
+    assert f'{bucket % "0.005"} 2' in text
+    assert f'{bucket % "0.05"} 3' in text
+    assert f'{bucket % "+Inf"} 4' in text
+    assert 'zema_operation_duration_seconds_count{component="vision",operation="detect"} 4' in text
+
+
+async def test_stt_records_timing_only_for_real_transcriptions():
+    """Without a loaded model nothing is transcribed, so no latency or real-time factor is exported."""
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from src.config.settings import Settings
+    from src.utils.metrics import registry
+    from src.utils.performance import get_performance_monitor
+    from src.voice.stt import SpeechToText
+
+    stt = SpeechToText(Settings(stt_model="tiny"))
+    audio = np.zeros(16000, dtype=np.float32)
+    assert await stt.transcribe(audio) == ("", 0.0)
+    assert 'zema_stt_real_time_factor{model="tiny"}' not in registry.render()
+    assert not get_performance_monitor().get_operation_stats("stt", "transcribe")
+
+    class FakeWhisper:
+        def transcribe(self, audio_data, language=None):
+            return iter([SimpleNamespace(text=" hello ", avg_logprob=0.0)]), None
+
+    stt.model = FakeWhisper()
+    text, confidence = await stt.transcribe(audio)
+    assert (text, confidence) == ("hello", 1.0)
+    assert 'zema_stt_real_time_factor{model="tiny"}' in registry.render()
@@ -0,0 +1,177 @@
+"""Tests for streaming 3D reconstruction jobs."""
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.vision.model3d import (
+    CANCELLED, COMPLETED, FAILED, MAX_FINISHED_JOBS, RUNNING, Model3DGenerator, ReconstructionJob
+)
+
+cv2 = pytest.importorskip("cv2")
+
+CAMERA_MATRIX = np.array([[500.0, 0, 160], [0, 500.0, 120], [0, 0, 1]])
+
+
+def synthetic_frames(count=4, step=6):
+    """Overlapping views of one textured scene, shifted a few pixels per frame."""
+    rng = np.random.default_rng(0)
+    scene = np.zeros((240, 320 + step * count, 3), dtype=np.uint8)
+    for _ in range(150):
+        x, y = int(rng.integers(0, scene.shape[1])), int(rng.integers(0, 240))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.rectangle(scene, (x, y), (x + int(rng.integers(5, 30)), y + int(rng.integers(5, 30))), color, -1)
+    return [np.ascontiguousarray(scene[:, i * step:i * step + 320]) for i in range(count)]
+
+
+def read_ply(path):
+    """Points of a binary PLY written by the generator"""
+    header, body = path.read_bytes().split(b"end_header\n", 1)
+    return np.frombuffer(body, dtype="<f4").reshape(-1, 3)
+
+
+def rotation_y(degrees):
+    """Rotation about the camera's vertical axis"""
+    a = np.radians(degrees)
+    return np.array([[np.cos(a), 0, np.sin(a)], [0, 1, 0], [-np.sin(a), 0, np.cos(a)]])
+
+
+def write_pairs(job, scene, poses, registered):
+    """
+    Store what match_pair would produce for cameras at known poses
+
+    Each pair sees an overlapping subset of the scene and, like the essential
+    matrix, knows its translation only up to scale (unit length).
+    """
+    for index in range(1, len(poses)):
+        (r0, t0), (r1, t1) = poses[index - 1], poses[index]
+        rotation, translation = r1 @ r0.T, t1 - r1 @ r0.T @ t0
+        ids = np.arange(index * 20, index * 20 + 60)
+        unit = np.linalg.norm(translation)
+        local = (r0 @ scene[ids].T + t0).T / unit
+        np.savez(job._cloud_path(index), points=local.astype(np.float32), previous_index=ids, current_index=ids)
+        if index in registered:
+            job._poses[index] = (rotation, translation / unit)
+    job.frames_received = len(poses)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    generator = Model3DGenerator(Settings(model3d_work_path=str(tmp_path / "work"), model3d_workers=1))
+    generator._camera_matrix = lambda: CAMERA_MATRIX
+    yield generator
+    generator.shutdown()
+
+
+async def test_generate_model_writes_point_cloud(generator, tmp_path):
+    """A short capture is processed end to end into a PLY file and the work dir is removed."""
+    output = tmp_path / "model.ply"
+    assert await generator.generate_model(synthetic_frames(), output)
+    (job,) = generator.jobs.values()
+    assert job.status == COMPLETED and job.progress == 1.0
+    assert job.frames_processed == 4 and job.pairs_matched + job.pairs_failed == 3
+    header = output.read_bytes().split(b"end_header\n")[0].decode()
+    assert f"element vertex {len(read_ply(output))}" in header
+    assert job.points == sum(len(read_ply(path)) for path in job.segments)
+    assert not job.work_dir.exists()
+
+
+def test_merge_chains_pairs_in_one_frame_and_scale(tmp_path):
+    """Pair clouds with unrelated scales are merged into the first camera's frame and scale."""
+    rng = np.random.default_rng(1)
+    scene = rng.uniform([-1, -1, 4], [1, 1, 6], size=(200, 3))
+    poses = [(rotation_y(3 * i), np.array([[-0.3 * i], [0.05 * i], [0.0]])) for i in range(5)]
+    job = ReconstructionJob("merge", tmp_path / "work", tmp_path / "out.ply", None, CAMERA_MATRIX, 100)
+    write_pairs(job, scene, poses, registered={1, 2, 3, 4})
+    job._merge()
+
+    assert job.segments == [tmp_path / "out.ply"]
+    first_unit = np.linalg.norm(poses[1][1])
+    expected = np.concatenate([scene[np.arange(i * 20, i * 20 + 60)] for i in range(1, 5)]) / first_unit
+    np.testing.assert_allclose(read_ply(tmp_path / "out.ply"), expected, atol=1e-3)
+
+
+def test_unregistered_pair_starts_new_part(tmp_path):
+    """Clouds after a pair that failed to register go to a separate file, not a wrong frame."""
+    rng = np.random.default_rng(2)
+    scene = rng.uniform([-1, -1, 4], [1, 1, 6], size=(200, 3))
+    poses = [(rotation_y(2 * i), np.array([[-0.2 * i], [0.0], [0.0]])) for i in range(5)]
+    job = ReconstructionJob("split", tmp_path / "work", tmp_path / "out.ply", None, CAMERA_MATRIX, 100)
+    write_pairs(job, scene, poses, registered={1, 3, 4})
+    job._merge()
+
+    assert job.segments == [tmp_path / "out.ply", tmp_path / "out_part2.ply"]
+    assert len(read_ply(job.segments[0])) == 60 and len(read_ply(job.segments[1])) == 120
+    # The second part is expressed in camera 2's frame and pair 3's scale
+    (r2, t2), unit = poses[2], np.linalg.norm(poses[3][1] - poses[3][0] @ poses[2][0].T @ poses[2][1])
+    expected = (r2 @ scene[np.arange(60, 120)].T + t2).T / unit
+    np.testing.assert_allclose(read_ply(job.segments[1])[:60], expected, atol=1e-3)
+
+
+async def test_capture_failure_discards_work(generator, tmp_path):
+    """A capture that loses the camera fails and leaves no pending work or files behind."""
+    frames = iter(synthetic_frames(3))
+
+    async def read_frame():
+        return next(frames, None)
+
+    job = generator.start_capture(read_frame, 5, 0.0, tmp_path / "c.ply")
+    await generator._tasks[job.job_id]
+    assert job.status == FAILED and "no frame" in job.error
+    assert all(f.done() for f in job._features.values())
+    pairs = await asyncio.wait_for(asyncio.gather(*job._pairs.values(), return_exceptions=True), 1.0)
+    assert all(isinstance(result, asyncio.CancelledError) for result in pairs)
+    assert not job.work_dir.exists()
+
+
+async def test_job_status_and_cancel(generator, tmp_path):
+    """Running jobs report counters and can be cancelled; finished jobs keep their state."""
+    job = generator.create_job(tmp_path / "a.ply", expected_frames=10)
+    await job.add_frame(synthetic_frames(1)[0])
+    status = generator.get_job_status(job.job_id)
+    assert status["status"] == RUNNING and status["frames_received"] == 1
+
+    assert generator.cancel_job(job.job_id) == CANCELLED
+    assert not job.work_dir.exists()
+    assert generator.cancel_job("missing") is None
+
+    done = generator.create_job(tmp_path / "b.ply")
+    for frame in synthetic_frames(2):
+        await done.add_frame(frame)
+    await done.finish()
+    assert generator.cancel_job(done.job_id) == COMPLETED
+
+
+async def test_finished_jobs_are_pruned(generator, tmp_path):
+    """Finished jobs expire after the TTL and are capped in number; running jobs are kept."""
+    running = generator.create_job(tmp_path / "running.ply")
+    old = generator.create_job(tmp_path / "old.ply")
+    old.cancel()
+    old.finished -= generator.job_ttl + 1
+    assert generator.get_job_status(old.job_id) is None
+    assert generator.get_job_status(running.job_id) is not None
+
+    for i in range(MAX_FINISHED_JOBS + 5):
+        generator.create_job(tmp_path / f"{i}.ply").cancel()
+    generator.prune_jobs()
+    assert len(generator.jobs) == MAX_FINISHED_JOBS + 1
+
+
+def test_cancel_route_reports_real_state(generator, tmp_path):
+    """DELETE returns 409 for a job that already finished."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from src.api.routes import vision
+
+    job = generator.create_job(tmp_path / "x.ply")
+    asyncio.run(job.finish())
+    vision._model3d_generator = generator
+    try:
+        client = TestClient(FastAPI())
+        client.app.include_router(vision.router)
+        response = client.delete(f"/api/vision/model3d/jobs/{job.job_id}")
+        assert response.status_code == 409 and "completed" in response.json()["detail"]
+        assert client.delete("/api/vision/model3d/jobs/unknown").status_code == 404
+    finally:
+        vision._model3d_generator = None
@@ -0,0 +1,27 @@
+"""Tests for histogram-based PerformanceMonitor."""
+import numpy as np
+from src.utils.performance import LatencyHistogram, PerformanceMonitor
+
+
+def test_histogram_quantiles_within_bucket_error():
+    """Quantiles stay within the 5% bucket resolution."""
+    values = np.random.default_rng(0).lognormal(mean=3, sigma=1, size=20000)
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(float(value))
+    for q, estimate in zip((0.5, 0.9, 0.99), histogram.quantiles((0.5, 0.9, 0.99))):
+        exact = np.quantile(values, q)
+        assert abs(estimate - exact) / exact < 0.06
+    assert histogram.quantiles((1.0,))[0] == values.max()
+
+
+def test_monitor_stats_per_operation_and_component():
+    """Stats are kept per operation and merged per component."""
+    monitor = PerformanceMonitor()
+    for ms in (10, 20, 30):
+        monitor.record("voice", "stt", ms)
+    monitor.record("voice", "tts", 100)
+    assert monitor.get_operation_stats("voice", "stt")["count"] == 3
+    stats = monitor.get_component_stats("voice")
+    assert stats["count"] == 4 and stats["max_ms"] == 100 and stats["avg_ms"] == 40
+    assert monitor.get_component_stats("vision") == {}
@@ -0,0 +1,70 @@
+"""Tests for live reconfiguration."""
+import threading
+
+from src.config.settings import Settings
+from src.core.event_bus import EventBus
+from src.core.reconfigure import Reconfigurator, Reloadable
+
+
+class FakeModel:
+    """Component with one cheap and one expensive setting."""
+
+    LIVE_SETTINGS = {"stt_language": "language"}
+    RELOAD_SETTINGS = ("stt_model",)
+
+    def __init__(self, settings, gate=None):
+        if gate is not None:
+            gate.wait(5)
+        self.size = settings.stt_model
+        self.language = settings.stt_language
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+async def test_reload_swaps_without_dropping_in_flight_work():
+    """A turn that started on the old model finishes on it; new turns get the new one."""
+    settings = Settings(stt_model="base", stt_language="en")
+    gate = threading.Event()
+    gate.set()
+    holder = Reloadable("stt", lambda s: FakeModel(s, gate), settings)
+    reconfigurator = Reconfigurator(settings)
+    reconfigurator.register("stt", holder)
+    old = holder.current
+
+    gate.clear()
+    with holder.use() as in_flight:
+        settings.stt_model, settings.stt_language = "small", "am"
+        await reconfigurator.on_config_changed({"changes": {
+            "stt_model": {"old_value": "base", "new_value": "small"},
+            "stt_language": {"old_value": "en", "new_value": "am"},
+        }})
+        # Cheap setting applied in place; the current model keeps serving while the new one loads
+        assert in_flight is old and old.language == "am"
+        assert holder.current is old
+        gate.set()
+        await reconfigurator.wait_idle()
+        assert holder.current.size == "small" and holder.generation == 1
+        assert not old.closed
+    assert old.closed
+
+    with holder.use() as model:
+        assert model.size == "small"
+    assert reconfigurator.get_stats()["stt"]["reloads"] == 1
+
+
+async def test_changes_reach_only_dependent_handlers():
+    """Only handlers that follow a changed setting are called."""
+    settings = Settings()
+    bus = EventBus()
+    await bus.start()
+    reconfigurator = Reconfigurator(settings)
+    reconfigurator.attach(bus)
+    seen = []
+    reconfigurator.register_callback("fps", ("camera_fps",), seen.append)
+    reconfigurator.register_callback("other", ("tts_speed",), seen.append)
+
+    await reconfigurator.on_config_changed({"changes": {"camera_fps": {"old_value": 30, "new_value": 15}}})
+    assert seen == [{"camera_fps": {"old_value": 30, "new_value": 15}}]
+    await bus.stop()
@@ -0,0 +1,87 @@
+"""Tests for SceneAnalyzer description caching."""
+import asyncio
+from src.core.event_bus import EventBus
+from src.vision.analyzer import SceneAnalyzer
+
+
+class FakeLLM:
+    """Counts one-shot generate calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, context=None, remember=True):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"description {self.calls}"
+
+
+PERSON = {"bbox": [100, 100, 300, 500], "label": "person", "confidence": 0.9}
+CUP = {"bbox": [1500, 800, 1600, 900], "label": "cup", "confidence": 0.8}
+
+
+def test_signature_ignores_order_and_jitter(settings):
+    """Same objects in the same grid cells map to one signature."""
+    analyzer = SceneAnalyzer(settings)
+    moved = dict(PERSON, bbox=[110, 95, 310, 505])
+    assert analyzer.signature([PERSON, CUP], (1080, 1920)) == analyzer.signature([CUP, moved], (1080, 1920))
+
+
+async def test_repeated_describe_hits_cache(settings):
+    """Unchanged scenes reuse the cached LLM description."""
+    analyzer = SceneAnalyzer(settings)
+    llm = FakeLLM()
+    first = await analyzer.describe([PERSON, CUP], (1080, 1920), llm)
+    second = await analyzer.describe([CUP, PERSON], (1080, 1920), llm)
+    assert first == second
+    assert llm.calls == 1
+    assert analyzer.get_cache_stats()["hit_rate"] == 0.5
+
+
+async def test_scene_changed_event_invalidates(settings):
+    """A scene_changed event forces a fresh description."""
+    bus = EventBus()
+    analyzer = SceneAnalyzer(settings, bus)
+    llm = FakeLLM()
+    await analyzer.describe([PERSON], (1080, 1920), llm)
+    bus.emit("scene_changed")
+    await analyzer.describe([PERSON], (1080, 1920), llm)
+    assert llm.calls == 2
+
+
+async def test_cancelled_leader_does_not_strand_followers(settings):
+    """A follower waiting on a cancelled leader generates the description itself."""
+    analyzer = SceneAnalyzer(settings)
+    started = asyncio.Event()
+
+    class SlowLLM(FakeLLM):
+        async def generate(self, prompt, context=None, remember=True):
+            self.calls += 1
+            if self.calls == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return f"description {self.calls}"
+
+    llm = SlowLLM()
+    leader = asyncio.create_task(analyzer.describe([PERSON], (1080, 1920), llm))
+    await started.wait()
+    follower = asyncio.create_task(analyzer.describe([PERSON], (1080, 1920), llm))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await asyncio.wait_for(follower, 1) == "description 2"
+    assert leader.cancelled()
+    assert not analyzer._inflight
+
+
+async def test_cache_stats_exported(settings):
+    """The description cache hit rate appears on the metrics registry."""
+    from src.utils.metrics import MetricsRegistry, scene_cache_collector
+    analyzer = SceneAnalyzer(settings)
+    llm = FakeLLM()
+    await analyzer.describe([PERSON], (1080, 1920), llm)
+    await analyzer.describe([PERSON], (1080, 1920), llm)
+    registry = MetricsRegistry()
+    registry.register_collector(scene_cache_collector(analyzer))
+    text = registry.render()
+    assert 'zema_scene_cache_lookups_total{result="hit"} 1' in text
+    assert "zema_scene_cache_hit_ratio 0.5" in text
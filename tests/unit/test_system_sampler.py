@@ -0,0 +1,19 @@
+"""Tests for the SystemSampler ring buffer."""
+import numpy as np
+from src.utils.system_sampler import FIELDS, SystemSampler
+
+
+def test_ring_buffer_latest_and_downsampled_history():
+    """The ring keeps the newest rows; history averages into buckets."""
+    sampler = SystemSampler(interval=1.0, capacity=10)
+    for t in range(25):
+        row = np.full(len(FIELDS), np.nan)
+        row[0], row[1] = 1000.0 + t, float(t)
+        sampler.append(row)
+
+    assert sampler.latest()["cpu_percent"] == 24.0
+    assert sampler.latest()["temperature_c"] is None
+
+    history = sampler.history(window=100, points=5)
+    assert history["cpu_percent"] == [15.5, 17.5, 19.5, 21.5, 23.5]
+    assert sampler.history(window=3)["cpu_percent"] == [21.0, 22.0, 23.0, 24.0]
@@ -0,0 +1,67 @@
+"""Tests for log_performance spans and the sampling profiler."""
+import logging
+import threading
+import time
+
+import pytest
+from src.utils.logger import log_performance
+from src.utils.profiler import profile
+from src.utils.tracing import span_store
+
+
+@log_performance
+def traced_work():
+    return 42
+
+
+@log_performance
+def failing_work():
+    raise ValueError("boom")
+
+
+def test_log_performance_feeds_span_store_only_when_enabled():
+    """Calls become spans; disabling tracing records nothing."""
+    span_store.clear()
+    assert traced_work() == 42
+    assert span_store.recent(name="traced_work")[0]["component"] == "tests.unit.test_tracing"
+
+    span_store.configure(enabled=False)
+    try:
+        traced_work()
+    finally:
+        span_store.configure(enabled=True)
+    assert len(span_store.recent(name="traced_work")) == 1
+
+
+def test_log_performance_logs_failures_when_tracing_is_disabled(caplog):
+    """Disabling tracing drops the span but not the error log with its traceback."""
+    span_store.clear()
+    span_store.configure(enabled=False)
+    try:
+        with caplog.at_level(logging.ERROR, logger="tests.unit.test_tracing"), pytest.raises(ValueError):
+            failing_work()
+    finally:
+        span_store.configure(enabled=True)
+    assert not span_store.recent(name="failing_work")
+    record = next(r for r in caplog.records if "failing_work failed after" in r.getMessage())
+    assert record.exc_info and record.exc_info[0] is ValueError
+
+
+def test_profiler_collapses_other_thread_stacks():
+    """Busy threads show up as collapsed stacks with counts."""
+    stop = threading.Event()
+
+    def spin_in_hot_loop():
+        while not stop.is_set():
+            time.sleep(0.001)
+
+    worker = threading.Thread(target=spin_in_hot_loop, name="hot-worker")
+    worker.start()
+    try:
+        stacks = profile(0.1, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+    hot = [line for line in stacks.splitlines() if line.startswith("hot-worker;")]
+    assert hot and "spin_in_hot_loop" in hot[0]
+    assert int(hot[0].rsplit(" ", 1)[1]) > 5
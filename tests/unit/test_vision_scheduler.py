@@ -0,0 +1,36 @@
+"""Tests for VisionScheduler frame dispatch."""
+import asyncio
+import numpy as np
+from src.core.inference import InferenceExecutor
+from src.vision.camera import Camera
+from src.vision.scheduler import VisionScheduler
+
+
+async def test_slow_consumer_drops_frames(settings):
+    """A busy consumer has frames dropped while a fast one keeps up."""
+    release = asyncio.Event()
+    seen = {"fast": 0, "slow": 0}
+
+    async def fast(frame):
+        seen["fast"] += 1
+
+    async def slow(frame):
+        seen["slow"] += 1
+        await release.wait()
+
+    scheduler = VisionScheduler(settings, Camera(settings), InferenceExecutor(1))
+    scheduler.register("fast", fast, target_fps=100, priority=1)
+    scheduler.register("slow", slow, target_fps=100)
+
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    for step in range(5):
+        scheduler.dispatch(frame, now=step * 0.02)
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0)
+
+    stats = scheduler.get_stats()
+    assert seen == {"fast": 5, "slow": 1}
+    assert stats["slow"]["dropped"] == 4
+    assert stats["fast"]["dropped"] == 0
+    assert list(stats) == ["fast", "slow"]
@@ -0,0 +1,46 @@
+"""Tests for background warm-up."""
+import subprocess
+import sys
+from pathlib import Path
+
+from src.core.warmup import Warmup
+
+
+async def test_steps_report_state_without_stopping_others():
+    """Sync and async steps run in order; unavailable and failed steps do not block the rest."""
+    warmup = Warmup()
+    order = []
+
+    async def llm():
+        order.append("llm")
+        return False
+
+    def stt():
+        order.append("stt")
+        raise RuntimeError("no model")
+
+    warmup.add("llm", llm)
+    warmup.add("stt", stt)
+    warmup.add("tts", lambda: order.append("tts"))
+    assert not warmup.status()["ready"]
+
+    await warmup.start()
+    status = warmup.status()
+    assert order == ["llm", "stt", "tts"]
+    assert status["ready"] and status["degraded"]
+    assert {name: s["state"] for name, s in status["subsystems"].items()} == {
+        "llm": "unavailable", "stt": "failed", "tts": "ready"
+    }
+    assert status["subsystems"]["stt"]["error"] == "no model"
+
+
+def test_server_import_does_not_load_components():
+    """Importing the dashboard server leaves model-backed components for the warm-up."""
+    code = (
+        "import sys, src.api.server; "
+        "print(','.join(m for m in ('src.voice.stt', 'src.voice.tts', 'src.vision.camera', "
+        "'src.ai.llm_client', 'cv2', 'numpy', 'uvicorn') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[2],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""